@@ -14,19 +14,32 @@ and update group information.
 
 import sys
 import os
-import json
+import time
+import threading
 from dotenv import load_dotenv
 from datetime import datetime
+from concurrent.futures import Future, ThreadPoolExecutor
 from evolutionapi.client import EvolutionClient
 from evolutionapi.exceptions import EvolutionAuthenticationError, EvolutionAPIError
 from .group import Group
 import pandas as pd
 from .message_sandeco import MessageSandeco
-from ..utils.task_scheduler import TaskScheduled, is_running_in_docker
+from . import message_batch
+from ..infrastructure.persistence.message_store import MessageStore
+from ..infrastructure.persistence.group_index import GroupIndex
+from ..infrastructure.persistence.settings_store import SETTINGS_COLUMNS, get_settings_store
+from ..utils.task_scheduler import TaskScheduled
+from ..utils.environment import is_running_in_docker
+from ..utils import fast_json
 
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 
 class GroupController:
+    # Atualizações do cache de grupos em andamento, por arquivo de cache (compartilhadas entre instâncias)
+    # In-flight groups cache refreshes, per cache file (shared across instances)
+    _refresh_lock = threading.Lock()
+    _refreshes = {}
+
     def __init__(self):
         """
         PT-BR:
@@ -51,6 +64,22 @@ class GroupController:
         project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', '..'))
         self.csv_file = os.path.join(project_root, "data", "group_summary.csv")
         self.cache_file = os.path.join(project_root, "data", "groups_cache.json")
+        # Configurações de resumo (SQLite ou CSV) / Summary settings (SQLite or CSV)
+        self.settings_store = get_settings_store(self.csv_file)
+        # Validade do cache de grupos em segundos (0 = nunca expira) / Groups cache TTL in seconds (0 = never expires)
+        self.cache_ttl = float(os.getenv("GROUPS_CACHE_TTL", "3600"))
+
+        # Índice de grupos por group_id / Group index by group_id
+        self.group_index = GroupIndex(
+            os.getenv("GROUPS_INDEX_PATH", os.path.join(project_root, "data", "groups_index.db"))
+        )
+
+        # Local message store / Armazenamento local de mensagens
+        self.message_store = None
+        if os.getenv("MESSAGE_STORE_ENABLED", "true").lower() == "true":
+            self.message_store = MessageStore(
+                os.getenv("MESSAGE_STORE_PATH", os.path.join(project_root, "data", "messages.db"))
+            )
 
         if not all([self.api_token, self.instance_id, self.instance_token]):
             raise ValueError("API_TOKEN, INSTANCE_NAME ou INSTANCE_TOKEN não configurados. / API_TOKEN, INSTANCE_NAME or INSTANCE_TOKEN not configured.")
@@ -67,6 +96,10 @@ class GroupController:
         print(f"Inicializando EvolutionClient com URL / Initializing EvolutionClient with URL: {self.base_url}")
         self.client = EvolutionClient(base_url=self.base_url, api_token=self.api_token)
         self.groups = []
+        # Índices por group_id / Indexes by group_id
+        self.groups_by_id = {}
+        self._summary_index = None
+        self._summary_index_key = None
 
     def _load_cache(self):
         """
@@ -81,9 +114,8 @@ class GroupController:
         if not os.path.exists(self.cache_file):
             return None
         try:
-            with open(self.cache_file, 'r') as f:
-                return json.load(f)
-        except json.decoder.JSONDecodeError as e:
+            return fast_json.load_file(self.cache_file)
+        except ValueError as e:
             print(f"Cache com formato inválido. Removendo o arquivo: {e}")
             os.remove(self.cache_file)
             return None
@@ -116,11 +148,65 @@ class GroupController:
                 'timestamp': datetime.now().isoformat(),
                 'groups': groups_data
             }
-            with open(self.cache_file, 'w') as f:
-                json.dump(cache_data, f)
+            fast_json.dump_file(self.cache_file, cache_data)
+            if isinstance(groups_data, list):
+                self.group_index.replace_all(groups_data)
         except Exception as e:
             print(f"Erro ao salvar cache: {str(e)}")
 
+    def _cache_is_stale(self, cache_data):
+        """
+        PT-BR:
+        Indica se o cache passou da validade (GROUPS_CACHE_TTL).
+        Caches sem timestamp válido são considerados expirados.
+
+        EN:
+        Tells whether the cache is past its TTL (GROUPS_CACHE_TTL).
+        Caches without a valid timestamp are considered stale.
+        """
+        if self.cache_ttl <= 0:
+            return False
+        try:
+            saved_at = datetime.fromisoformat(cache_data["timestamp"])
+        except (KeyError, TypeError, ValueError):
+            return True
+        return (datetime.now() - saved_at).total_seconds() > self.cache_ttl
+
+    def _refresh_cache(self):
+        """
+        PT-BR:
+        Inicia a atualização do cache de grupos em uma thread, ou reaproveita a
+        que já está em andamento para o mesmo arquivo de cache.
+
+        Retorna:
+            Future: Resolvido com os dados dos grupos (ou com o erro da API)
+
+        EN:
+        Starts a groups cache refresh in a thread, or reuses the one already
+        in flight for the same cache file.
+
+        Returns:
+            Future: Resolved with the groups data (or with the API error)
+        """
+        with GroupController._refresh_lock:
+            future = GroupController._refreshes.get(self.cache_file)
+            if future is not None and not future.done():
+                return future
+            future = Future()
+            GroupController._refreshes[self.cache_file] = future
+        threading.Thread(target=self._run_refresh, args=(future,), name="groups-cache-refresh", daemon=True).start()
+        return future
+
+    def _run_refresh(self, future):
+        try:
+            groups_data = self._fetch_from_api()
+            self._save_cache(groups_data)
+        except Exception as e:
+            print(f"Falha ao atualizar o cache de grupos / Failed to refresh groups cache: {e}")
+            future.set_exception(e)
+        else:
+            future.set_result(groups_data)
+
     def _fetch_from_api(self):
         """
         PT-BR:
@@ -182,6 +268,8 @@ class GroupController:
         """
         PT-BR:
         Obtém lista de grupos usando cache ou API.
+        Se o cache estiver expirado, os dados do cache são usados imediatamente
+        e a atualização ocorre em segundo plano (stale-while-revalidate).
         
         Parâmetros:
             force_refresh: Força atualização da API ignorando cache
@@ -191,6 +279,8 @@ class GroupController:
 
         EN:
         Gets group list using cache or API.
+        If the cache is stale, cached data is used immediately and the
+        refresh happens in the background (stale-while-revalidate).
         
         Parameters:
             force_refresh: Forces API update ignoring cache
@@ -198,22 +288,24 @@ class GroupController:
         Returns:
             List[Group]: List of Group objects
         """
-        summary_data = self.load_summary_info()
+        summary_index = self.load_summary_index()
         groups_data = None
         if not force_refresh:
             cache_data = self._load_cache()
             if cache_data and "groups" in cache_data:
-                print("Usando dados do cache...")
                 groups_data = cache_data["groups"]
+                if self._cache_is_stale(cache_data):
+                    print("Cache expirado. Usando dados do cache e atualizando em segundo plano...")
+                    self._refresh_cache()
+                else:
+                    print("Usando dados do cache...")
             else:
                 print("Cache não encontrado. Buscando da API...")
-                groups_data = self._fetch_from_api()
-                self._save_cache(groups_data)
+                groups_data = self._refresh_cache().result()
         else:
             try:
                 print("Forçando atualização da API...")
-                groups_data = self._fetch_from_api()
-                self._save_cache(groups_data)
+                groups_data = self._refresh_cache().result()
             except Exception as e:
                 if "rate-overlimit" in str(e):
                     print("Rate limit atingido. Verificando cache para fallback...")
@@ -225,49 +317,59 @@ class GroupController:
                 else:
                     raise e
         self.groups = []
+        self.groups_by_id = {}
         for group in groups_data:
             group_id = group["id"]
-            resumo = summary_data[summary_data["group_id"] == group_id]
-            if not resumo.empty:
-                resumo = resumo.iloc[0].to_dict()
-                horario = resumo.get("horario", "22:00")
-                enabled = resumo.get("enabled", False)
-                is_links = resumo.get("is_links", False)
-                is_names = resumo.get("is_names", False)
-                send_to_group = resumo.get("send_to_group", True)
-                send_to_personal = resumo.get("send_to_personal", False)
-            else:
-                horario = "22:00"
-                enabled = False
-                is_links = False
-                is_names = False
-                send_to_group = True
-                send_to_personal = False
-
-            self.groups.append(
-                Group(
-                    group_id=group_id,
-                    name=group["subject"],
-                    subject_owner=group.get("subjectOwner", "remoteJid"),
-                    subject_time=group["subjectTime"],
-                    picture_url=group.get("pictureUrl", None),
-                    size=group["size"],
-                    creation=group["creation"],
-                    owner=group.get("owner", None),
-                    restrict=group["restrict"],
-                    announce=group["announce"],
-                    is_community=group["isCommunity"],
-                    is_community_announce=group["isCommunityAnnounce"],
-                    horario=horario,
-                    enabled=enabled,
-                    is_links=is_links,
-                    is_names=is_names,
-                    send_to_group=send_to_group,
-                    send_to_personal=send_to_personal
-                )
-            )
+            group_obj = self._build_group(group, summary_index.get(group_id))
+            self.groups.append(group_obj)
+            self.groups_by_id[group_id] = group_obj
         return self.groups
 
+    @staticmethod
+    def _build_group(group, resumo):
+        """
+        PT-BR:
+        Cria um Group a partir do registro da API e das configurações de resumo (ou None).
+
+        EN:
+        Builds a Group from the API record and the summary settings (or None).
+        """
+        if resumo is not None:
+            horario = resumo.get("horario", "22:00")
+            enabled = resumo.get("enabled", False)
+            is_links = resumo.get("is_links", False)
+            is_names = resumo.get("is_names", False)
+            send_to_group = resumo.get("send_to_group", True)
+            send_to_personal = resumo.get("send_to_personal", False)
+        else:
+            horario = "22:00"
+            enabled = False
+            is_links = False
+            is_names = False
+            send_to_group = True
+            send_to_personal = False
+
+        return Group(
+            group_id=group["id"],
+            name=group["subject"],
+            subject_owner=group.get("subjectOwner", "remoteJid"),
+            subject_time=group["subjectTime"],
+            picture_url=group.get("pictureUrl", None),
+            size=group["size"],
+            creation=group["creation"],
+            owner=group.get("owner", None),
+            restrict=group["restrict"],
+            announce=group["announce"],
+            is_community=group["isCommunity"],
+            is_community_announce=group["isCommunityAnnounce"],
+            horario=horario,
+            enabled=enabled,
+            is_links=is_links,
+            is_names=is_names,
+            send_to_group=send_to_group,
+            send_to_personal=send_to_personal
+        )
+
     def load_summary_info(self):
         """
         PT-BR:
@@ -282,14 +384,42 @@ class GroupController:
         Returns:
             DataFrame: Contains summary settings for all groups
         """
-        try:
-            return pd.read_csv(self.csv_file)
-        except FileNotFoundError:
-            return pd.DataFrame(columns=[
-                "group_id", "dias", "horario", "enabled", 
-                "is_links", "is_names", "send_to_group", 
-                "send_to_personal", "min_messages_summary" # Adicionar nova coluna
-            ])
+        return self.settings_store.load()
+
+    def load_summary_index(self):
+        """
+        PT-BR:
+        Configurações de resumo indexadas por group_id (a primeira linha de cada
+        grupo vale). O índice só é reconstruído quando as configurações mudam.
+
+        Retorna:
+            dict: group_id -> dicionário de configurações
+
+        EN:
+        Summary settings indexed by group_id (the first row of each group wins).
+        The index is only rebuilt when the settings change.
+
+        Returns:
+            dict: group_id -> settings dictionary
+        """
+        key = self.settings_revision()
+        if self._summary_index is None or key != self._summary_index_key:
+            index = {}
+            for config in self.load_summary_info().to_dict('records'):
+                index.setdefault(config.get("group_id"), config)
+            self._summary_index = index
+            self._summary_index_key = key
+        return self._summary_index
+
+    def settings_revision(self):
+        """
+        PT-BR:
+        Valor que muda sempre que as configurações de resumo mudam.
+
+        EN:
+        Value that changes whenever the summary settings change.
+        """
+        return self.settings_store.revision()
 
     def load_data_by_group(self, group_id):
         """
@@ -312,16 +442,15 @@ class GroupController:
             dict/False: Dictionary with settings or False if not found
         """
         try:
-            df = self.load_summary_info()
-            resumo = df[df["group_id"] == group_id]
-            return resumo.iloc[0].to_dict() if not resumo.empty else False
+            config = self.load_summary_index().get(group_id)
+            return dict(config) if config is not None else False
         except Exception:
             return False
 
-    def update_summary(self, group_id, horario, enabled, is_links, is_names, script, send_to_group=True, send_to_personal=False, start_date=None, start_time=None, end_date=None, end_time=None, min_messages_summary=50): # Adicionar novo parâmetro com valor default
+    def update_summary(self, group_id, horario, enabled, is_links, is_names, script, send_to_group=True, send_to_personal=False, start_date=None, start_time=None, end_date=None, end_time=None, min_messages_summary=50, chunk_tokens=None, chunk_parallelism=None, rolling=None): # Adicionar novo parâmetro com valor default
         """
         PT-BR:
-        Atualiza configurações de resumo de um grupo no CSV.
+        Atualiza configurações de resumo de um grupo (gravação apenas da linha do grupo).
         
         Parâmetros:
             group_id: ID do grupo
@@ -337,12 +466,15 @@ class GroupController:
             end_date: Data final (opcional)
             end_time: Hora final (opcional)
             min_messages_summary: Mínimo de mensagens para gerar resumo (opcional)
+            chunk_tokens: Orçamento de tokens por trecho no modo map-reduce; 0 desativa (opcional, mantém o valor atual)
+            chunk_parallelism: Trechos resumidos em paralelo (opcional, mantém o valor atual)
+            rolling: Resumo contínuo, só com as mensagens novas (opcional, mantém o valor atual)
 
         Retorna:
             bool: True se atualizado com sucesso
 
         EN:
-        Updates group summary settings in CSV.
+        Updates group summary settings (only the group's row is written).
         
         Parameters:
             group_id: Group ID
@@ -358,22 +490,84 @@ class GroupController:
             end_date: End date (optional)
             end_time: End time (optional)
             min_messages_summary: Minimum messages to generate summary (optional)
+            chunk_tokens: Per-chunk token budget for map-reduce mode; 0 disables (optional, keeps current value)
+            chunk_parallelism: Chunks summarized in parallel (optional, keeps current value)
+            rolling: Rolling summary using only new messages (optional, keeps current value)
 
         Returns:
             bool: True if successfully updated
         """
-        try:
-            df = pd.read_csv(self.csv_file)
-        except FileNotFoundError:
-            df = pd.DataFrame(columns=["group_id", "horario", "enabled", "is_links", "is_names", "script", 
-                                     "send_to_group", "send_to_personal",
-                                     "start_date", "start_time", "end_date", "end_time", "min_messages_summary"]) # Adicionar nova coluna
-        
-        # Remove qualquer entrada existente para o grupo
-        df = df[df['group_id'] != group_id]
-        
-        # Adiciona a nova configuração
-        nova_config = {
+        return self.update_summaries([{
+            "group_id": group_id,
+            "horario": horario,
+            "enabled": enabled,
+            "is_links": is_links,
+            "is_names": is_names,
+            "script": script,
+            "send_to_group": send_to_group,
+            "send_to_personal": send_to_personal,
+            "start_date": start_date,
+            "start_time": start_time,
+            "end_date": end_date,
+            "end_time": end_time,
+            "min_messages_summary": min_messages_summary,
+            "chunk_tokens": chunk_tokens,
+            "chunk_parallelism": chunk_parallelism,
+            "rolling": rolling,
+        }])
+
+    def update_summaries(self, configs):
+        """
+        PT-BR:
+        Atualiza as configurações de resumo de vários grupos com uma única gravação.
+        Cada item aceita os mesmos campos de update_summary (group_id, horario,
+        enabled, is_links, is_names e script são obrigatórios).
+
+        Parâmetros:
+            configs: Lista de dicionários de configuração
+
+        Retorna:
+            bool: True se atualizado com sucesso
+
+        EN:
+        Updates the summary settings of several groups with a single write.
+        Each item accepts the same fields as update_summary (group_id, horario,
+        enabled, is_links, is_names and script are required).
+
+        Parameters:
+            configs: List of settings dictionaries
+
+        Returns:
+            bool: True if successfully updated
+        """
+        configs = list(configs)
+        if len(configs) == 1:
+            find_existing = self.settings_store.get
+        else:
+            find_existing = self.load_summary_index().get
+        rows = [self._summary_row(find_existing(config["group_id"]), **config) for config in configs]
+        self.settings_store.upsert_many(rows)
+        self._summary_index = None
+        return True
+
+    @staticmethod
+    def _summary_row(existing, group_id, horario, enabled, is_links, is_names, script, send_to_group=True,
+                     send_to_personal=False, start_date=None, start_time=None, end_date=None, end_time=None,
+                     min_messages_summary=50, chunk_tokens=None, chunk_parallelism=None, rolling=None):
+        # Ajustes só editáveis no CSV (trechos, resumo contínuo): preserva os valores atuais
+        # CSV-only settings (chunking, rolling summary): keep the current values
+        csv_only = {"chunk_tokens": chunk_tokens, "chunk_parallelism": chunk_parallelism, "rolling": rolling}
+        extra = {}
+        if existing is not None:
+            for key, value in csv_only.items():
+                if value is None:
+                    csv_only[key] = existing.get(key)
+            # Colunas extras adicionadas à mão (ex.: message_count usado por tools/50_plus.py)
+            # Extra hand-added columns (e.g. message_count used by tools/50_plus.py)
+            extra = {key: value for key, value in existing.items() if key not in SETTINGS_COLUMNS}
+
+        return {
+            **extra,
             "group_id": group_id,
             "horario": horario,
             "enabled": enabled,
@@ -386,13 +580,27 @@ class GroupController:
             "start_time": start_time if start_time else None,
             "end_date": end_date if end_date else None,
             "end_time": end_time if end_time else None,
-            "min_messages_summary": min_messages_summary # Adicionar novo campo
+            "min_messages_summary": min_messages_summary, # Adicionar novo campo
+            **csv_only
         }
-        
-        df = pd.concat([df, pd.DataFrame([nova_config])], ignore_index=True)
-        df.to_csv(self.csv_file, index=False)
-        
-        return True
+
+    def delete_summary(self, group_id):
+        """
+        PT-BR:
+        Remove as configurações de resumo de um grupo.
+
+        Retorna:
+            bool: False se o grupo não tinha configurações
+
+        EN:
+        Removes a group's summary settings.
+
+        Returns:
+            bool: False if the group had no settings
+        """
+        deleted = self.settings_store.delete(group_id)
+        self._summary_index = None
+        return deleted
 
     def get_groups(self):
         """
@@ -431,11 +639,72 @@ class GroupController:
             Group/None: Group object or None if not found
         """
         if not self.groups:
-            self.groups = self.fetch_groups()
-        for group in self.groups:
-            if group.group_id == group_id:
-                return group
-        return None
+            self.fetch_groups()
+        return self.groups_by_id.get(group_id)
+
+    def get_group(self, group_id):
+        """
+        PT-BR:
+        Obtém um único grupo sem carregar todos os grupos da instância: usa os
+        grupos em memória, depois o índice local por group_id e, por fim, a
+        consulta de informações do grupo na API Evolution.
+
+        Parâmetros:
+            group_id: ID do grupo
+
+        Retorna:
+            Group/None: Objeto Group ou None se não encontrado
+
+        EN:
+        Gets a single group without loading every group of the instance: uses
+        the in-memory groups, then the local group_id index and, last, the
+        Evolution API group info call.
+
+        Parameters:
+            group_id: Group ID
+
+        Returns:
+            Group/None: Group object or None if not found
+        """
+        group = self.groups_by_id.get(group_id)
+        if group is not None:
+            return group
+
+        record = None
+        try:
+            record = self.group_index.get(group_id)
+        except Exception as e:
+            print(f"Erro ao ler o índice de grupos / Error reading group index: {e}")
+        if record is None:
+            record = self._fetch_group_info(group_id)
+            if record is None:
+                return None
+            try:
+                self.group_index.put(record)
+            except Exception as e:
+                print(f"Erro ao gravar o índice de grupos / Error writing group index: {e}")
+        return self._build_group(record, self.load_summary_index().get(group_id))
+
+    def _fetch_group_info(self, group_id):
+        try:
+            record = self.client.group.get_group_info(
+                instance_id=self.instance_id,
+                group_jid=group_id,
+                instance_token=self.instance_token
+            )
+        except Exception as e:
+            print(f"Erro ao buscar informações do grupo {group_id} / Error fetching group info: {e}")
+            return None
+        if not isinstance(record, dict) or record.get("id") != group_id:
+            return None
+        # Mesmo formato de fetch_all_groups, sem participantes / Same shape as fetch_all_groups, without participants
+        participants = record.pop("participants", None) or []
+        record.setdefault("size", len(participants))
+        for key in ("subjectTime", "creation"):
+            record.setdefault(key, None)
+        for key in ("restrict", "announce", "isCommunity", "isCommunityAnnounce"):
+            record.setdefault(key, False)
+        return record
 
     def filter_groups_by_owner(self, owner):
         """
@@ -459,31 +728,17 @@ class GroupController:
         """
         return [group for group in self.groups if group.owner == owner]
 
-    def get_messages(self, group_id, start_date, end_date):
+    @staticmethod
+    def _message_window(start_date, end_date):
         """
         PT-BR:
-        Obtém e filtra mensagens de um grupo em um período.
-        
-        Parâmetros:
-            group_id: ID do grupo
-            start_date: Data inicial (formato: YYYY-MM-DD HH:MM:SS)
-            end_date: Data final (formato: YYYY-MM-DD HH:MM:SS)
-
-        Retorna:
-            List[Message]: Lista de mensagens filtradas
+        Converte as datas do período para ISO 8601 (usado pela API) e para
+        timestamps Unix (usados na filtragem local).
 
         EN:
-        Gets and filters group messages within a period.
-        
-        Parameters:
-            group_id: Group ID
-            start_date: Start date (format: YYYY-MM-DD HH:MM:SS)
-            end_date: End date (format: YYYY-MM-DD HH:MM:SS)
-
-        Returns:
-            List[Message]: List of filtered messages
+        Converts the period dates to ISO 8601 (used by the API) and to
+        Unix timestamps (used for local filtering).
         """
-
         def pad_time_string(date_str):
             # date_str esperado: 'YYYY-MM-DD HH:MM' ou 'YYYY-MM-DD HH:MM:SS'
             if len(date_str) == 16:  # 'YYYY-MM-DD HH:MM'
@@ -497,24 +752,236 @@ class GroupController:
 
         timestamp_start = to_iso8601(start_date)
         timestamp_end = to_iso8601(end_date)
+        ts_start = int(datetime.strptime(timestamp_start, "%Y-%m-%dT%H:%M:%SZ").timestamp())
+        ts_end = int(datetime.strptime(timestamp_end, "%Y-%m-%dT%H:%M:%SZ").timestamp())
+        return timestamp_start, timestamp_end, ts_start, ts_end
+
+    def _fetch_messages_page(self, group_id, timestamp_start, timestamp_end, page, page_size):
+        """
+        PT-BR:
+        Busca uma única página de mensagens na API Evolution.
 
+        EN:
+        Fetches a single page of messages from the Evolution API.
+        """
         # Ensure instance_id and instance_token are not None
         assert self.instance_id is not None, "instance_id cannot be None"
         assert self.instance_token is not None, "instance_token cannot be None"
 
-        group_mensagens = self.client.chat.get_messages(
+        return self.client.chat.get_messages(
             instance_id=self.instance_id,
             remote_jid=group_id,
             instance_token=self.instance_token,
             timestamp_start=timestamp_start,
             timestamp_end=timestamp_end,
-            page=1,
-            offset=1000
+            page=page,
+            offset=page_size
         )
-        msgs = MessageSandeco.get_messages(group_mensagens)
 
-        # Filtrar mensagens para garantir que estejam dentro do intervalo solicitado
-        ts_start = int(datetime.strptime(timestamp_start, "%Y-%m-%dT%H:%M:%SZ").timestamp())
-        ts_end = int(datetime.strptime(timestamp_end, "%Y-%m-%dT%H:%M:%SZ").timestamp())
-        msgs_filtradas = [msg for msg in msgs if ts_start <= msg.message_timestamp <= ts_end]
-        return msgs_filtradas
\ No newline at end of file
+    def iter_messages(self, group_id, start_date, end_date, page_size=None):
+        """
+        PT-BR:
+        Percorre todas as páginas de mensagens de um grupo no período,
+        produzindo objetos MessageSandeco à medida que cada página chega.
+        A próxima página é buscada em segundo plano enquanto a atual é
+        consumida, e a paginação para assim que os timestamps saem do período.
+
+        Parâmetros:
+            group_id: ID do grupo
+            start_date: Data inicial (formato: YYYY-MM-DD HH:MM:SS)
+            end_date: Data final (formato: YYYY-MM-DD HH:MM:SS)
+            page_size: Registros por página (padrão: EVO_MESSAGES_PAGE_SIZE ou 1000)
+
+        Retorna:
+            Iterator[MessageSandeco]: Mensagens dentro do período, da mais recente para a mais antiga
+
+        EN:
+        Walks every page of a group's messages within the period, yielding
+        MessageSandeco objects as each page arrives. The next page is fetched
+        in the background while the current one is consumed, and paging stops
+        as soon as timestamps fall outside the period.
+
+        Parameters:
+            group_id: Group ID
+            start_date: Start date (format: YYYY-MM-DD HH:MM:SS)
+            end_date: End date (format: YYYY-MM-DD HH:MM:SS)
+            page_size: Records per page (default: EVO_MESSAGES_PAGE_SIZE or 1000)
+
+        Returns:
+            Iterator[MessageSandeco]: Messages within the period, newest first
+        """
+        if page_size is None:
+            page_size = int(os.getenv("EVO_MESSAGES_PAGE_SIZE", "1000"))
+
+        timestamp_start, timestamp_end, ts_start, ts_end = self._message_window(start_date, end_date)
+
+        executor = ThreadPoolExecutor(max_workers=1)
+        try:
+            page = 1
+            future = executor.submit(
+                self._fetch_messages_page, group_id, timestamp_start, timestamp_end, page, page_size
+            )
+            while future is not None:
+                response = future.result()
+                msgs_data = (response or {}).get('messages', {})
+                records = msgs_data.get('records', [])
+                total_pages = msgs_data.get('pages')
+
+                page_timestamps = message_batch.timestamps(records)
+                # A API retorna as mensagens da mais recente para a mais antiga: uma
+                # mensagem anterior ao início do período encerra a paginação
+                # The API returns messages newest first: a message older than the
+                # window start ends the paging
+                reached_start = bool(message_batch.window_mask(page_timestamps, 0, ts_start - 1).any())
+
+                has_next = bool(records) and len(records) >= page_size and not reached_start
+                if total_pages is not None:
+                    has_next = has_next and page < int(total_pages)
+
+                # Pede a próxima página antes de processar a atual
+                # Request the next page before processing the current one
+                future = None
+                if has_next:
+                    future = executor.submit(
+                        self._fetch_messages_page, group_id, timestamp_start, timestamp_end, page + 1, page_size
+                    )
+
+                # Filtro vetorizado do período; só as mensagens dentro dele viram objetos
+                # Vectorised window filter; only in-window messages become objects
+                for index in message_batch.window_mask(page_timestamps, ts_start, ts_end).nonzero()[0]:
+                    yield MessageSandeco(records[index])
+                page += 1
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def get_messages_frame(self, group_id, start_date, end_date):
+        """
+        PT-BR:
+        Obtém as mensagens do período como DataFrame colunar (message_id,
+        remote_jid, participant, push_name, message_type, message_timestamp, text),
+        para análises sobre colunas inteiras.
+
+        EN:
+        Gets the period's messages as a columnar DataFrame (message_id,
+        remote_jid, participant, push_name, message_type, message_timestamp, text),
+        for analytics over whole columns.
+        """
+        messages = self.get_messages(group_id, start_date, end_date)
+        columns = message_batch.parse_records([msg.to_record() for msg in messages])
+        return message_batch.to_frame(columns)
+
+    def wait_for_sync(self, group_id, end_date, timeout=None, poll_interval=None):
+        """
+        PT-BR:
+        Aguarda a sincronização de mensagens do grupo na Evolution API.
+        Considera pronto quando o armazenamento local (alimentado pelo webhook)
+        já cobre o fim do período, ou quando a mensagem mais recente na API
+        para de mudar entre duas consultas. Nunca espera mais que o timeout.
+
+        Parâmetros:
+            group_id: ID do grupo
+            end_date: Data final do período (formato: YYYY-MM-DD HH:MM:SS)
+            timeout: Espera máxima em segundos (padrão: SUMMARY_SYNC_TIMEOUT ou 20)
+            poll_interval: Intervalo entre consultas (padrão: SUMMARY_SYNC_POLL_INTERVAL ou 2)
+
+        Retorna:
+            bool: True se a sincronização foi confirmada
+
+        EN:
+        Waits for the group's messages to be synchronized in the Evolution API.
+        Ready when the local store (fed by the webhook) already covers the end
+        of the period, or when the newest message in the API stops changing
+        between two polls. Never waits longer than the timeout.
+
+        Parameters:
+            group_id: Group ID
+            end_date: Period end date (format: YYYY-MM-DD HH:MM:SS)
+            timeout: Maximum wait in seconds (default: SUMMARY_SYNC_TIMEOUT or 20)
+            poll_interval: Seconds between polls (default: SUMMARY_SYNC_POLL_INTERVAL or 2)
+
+        Returns:
+            bool: True if synchronization was confirmed
+        """
+        if timeout is None:
+            timeout = float(os.getenv("SUMMARY_SYNC_TIMEOUT", "20"))
+        if poll_interval is None:
+            poll_interval = float(os.getenv("SUMMARY_SYNC_POLL_INTERVAL", "2"))
+
+        _, timestamp_end, _, ts_end = self._message_window(end_date, end_date)
+        if self.message_store is not None:
+            coverage = self.message_store.get_coverage(group_id)
+            if coverage and coverage[1] >= min(ts_end, int(time.time())) - poll_interval:
+                return True
+
+        deadline = time.monotonic() + timeout
+        previous = None
+        while True:
+            response = self._fetch_messages_page(group_id, "1970-01-01T00:00:00Z", timestamp_end, 1, 1)
+            records = ((response or {}).get('messages') or {}).get('records') or []
+            newest = (records[0].get('key', {}).get('id'), records[0].get('messageTimestamp')) if records else None
+            if previous is not None and newest == previous:
+                return True
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                print(f"Sincronização não confirmada em {timeout:.0f}s / Sync not confirmed within {timeout:.0f}s")
+                return False
+            previous = newest
+            time.sleep(min(poll_interval, remaining))
+
+    def get_messages(self, group_id, start_date, end_date):
+        """
+        PT-BR:
+        Obtém e filtra mensagens de um grupo em um período.
+        Com o armazenamento local ativo, apenas o trecho ainda não
+        sincronizado é solicitado à API; o restante vem do disco.
+        
+        Parâmetros:
+            group_id: ID do grupo
+            start_date: Data inicial (formato: YYYY-MM-DD HH:MM:SS)
+            end_date: Data final (formato: YYYY-MM-DD HH:MM:SS)
+
+        Retorna:
+            List[Message]: Lista de mensagens filtradas
+
+        EN:
+        Gets and filters group messages within a period.
+        With the local store enabled, only the stretch not yet
+        synchronized is requested from the API; the rest comes from disk.
+        
+        Parameters:
+            group_id: Group ID
+            start_date: Start date (format: YYYY-MM-DD HH:MM:SS)
+            end_date: End date (format: YYYY-MM-DD HH:MM:SS)
+
+        Returns:
+            List[Message]: List of filtered messages
+        """
+        if self.message_store is None:
+            return list(self.iter_messages(group_id, start_date, end_date))
+
+        _, _, ts_start, ts_end = self._message_window(start_date, end_date)
+        coverage = self.message_store.get_coverage(group_id)
+
+        fetch_start = ts_start
+        if coverage and coverage[0] <= ts_start <= coverage[1]:
+            if ts_end <= coverage[1]:
+                fetch_start = None  # Período inteiro já está no disco / Whole period already on disk
+            else:
+                # Pequena sobreposição para mensagens que chegam com atraso
+                # Small overlap for messages that arrive late
+                overlap = int(os.getenv("MESSAGE_STORE_OVERLAP_SECONDS", "300"))
+                fetch_start = max(ts_start, coverage[1] - overlap)
+
+        if fetch_start is not None:
+            fetch_start_date = datetime.fromtimestamp(fetch_start).strftime("%Y-%m-%d %H:%M:%S")
+            print(f"Buscando mensagens novas desde {fetch_start_date} / Fetching new messages since {fetch_start_date}")
+            batch = []
+            for msg in self.iter_messages(group_id, fetch_start_date, end_date):
+                batch.append(msg)
+                if len(batch) >= 500:
+                    self.message_store.add_messages(batch)
+                    batch = []
+            self.message_store.add_messages(batch)
+            self.message_store.extend_coverage(group_id, fetch_start, min(ts_end, int(time.time())))
+
+        return self.message_store.get_messages(group_id, ts_start, ts_end)
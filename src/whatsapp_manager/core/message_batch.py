@@ -0,0 +1,136 @@
+"""
+Leitura em Lote de Mensagens / Columnar Message Batch Parser
+
+PT-BR:
+Converte uma página de registros da API Evolution diretamente em colunas
+(dict de arrays ou DataFrame do pandas), sem criar um objeto por mensagem.
+Também oferece o filtro de período vetorizado usado na paginação de
+GroupController, para que análises e a montagem do prompt trabalhem com
+colunas inteiras.
+
+EN:
+Turns a page of Evolution API records straight into columns (a dict of
+arrays or a pandas DataFrame), without creating one object per message.
+It also provides the vectorised time-window filter used by GroupController's
+paging, so analytics and prompt building can work on whole columns.
+"""
+
+import numpy as np
+import pandas as pd
+
+COLUMNS = (
+    "message_id",
+    "remote_jid",
+    "participant",
+    "push_name",
+    "message_type",
+    "message_timestamp",
+    "text",
+)
+
+# Tipos cujo texto é a legenda da mídia / Types whose text is the media caption
+CAPTION_TYPES = ("imageMessage", "documentMessage")
+
+MISSING_TIMESTAMP = -1
+
+
+def _timestamp(record):
+    value = record.get("messageTimestamp")
+    if value is None:
+        return MISSING_TIMESTAMP
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return MISSING_TIMESTAMP
+
+
+def _text(record):
+    message = record.get("message") or {}
+    message_type = record.get("messageType")
+    if message_type == "conversation":
+        return message.get("conversation")
+    if message_type in CAPTION_TYPES:
+        return (message.get(message_type) or {}).get("caption")
+    return ""
+
+
+def timestamps(records):
+    """
+    PT-BR:
+    Extrai os timestamps de uma página como array int64 (-1 quando ausente).
+
+    EN:
+    Extracts a page's timestamps as an int64 array (-1 when missing).
+    """
+    return np.fromiter((_timestamp(record) for record in records), dtype=np.int64, count=len(records))
+
+
+def parse_records(records):
+    """
+    PT-BR:
+    Converte os registros em colunas. message_timestamp é um array int64;
+    as demais colunas são arrays de objetos.
+
+    Parâmetros:
+        records: Lista de registros ("records" da resposta da API)
+
+    Retorna:
+        dict: Coluna -> array, com as colunas de COLUMNS
+
+    EN:
+    Converts records into columns. message_timestamp is an int64 array;
+    the other columns are object arrays.
+
+    Parameters:
+        records: List of records ("records" of the API response)
+
+    Returns:
+        dict: Column -> array, with the COLUMNS columns
+    """
+    keys = [record.get("key") or {} for record in records]
+    columns = {
+        "message_id": [key.get("id") for key in keys],
+        "remote_jid": [key.get("remoteJid") for key in keys],
+        "participant": [key.get("participant") for key in keys],
+        "push_name": [record.get("pushName") for record in records],
+        "message_type": [record.get("messageType") for record in records],
+        "text": [_text(record) for record in records],
+    }
+    columns = {name: np.array(values, dtype=object) for name, values in columns.items()}
+    columns["message_timestamp"] = timestamps(records)
+    return columns
+
+
+def window_mask(message_timestamps, ts_start, ts_end):
+    """
+    PT-BR:
+    Máscara booleana das mensagens dentro do período [ts_start, ts_end].
+
+    EN:
+    Boolean mask of messages inside the [ts_start, ts_end] period.
+    """
+    message_timestamps = np.asarray(message_timestamps)
+    return (message_timestamps >= ts_start) & (message_timestamps <= ts_end)
+
+
+def filter_window(columns, ts_start, ts_end):
+    """
+    PT-BR:
+    Filtra todas as colunas pelo período, de forma vetorizada.
+
+    EN:
+    Filters every column by the period, vectorised.
+    """
+    mask = window_mask(columns["message_timestamp"], ts_start, ts_end)
+    return {name: values[mask] for name, values in columns.items()}
+
+
+def to_frame(columns):
+    """
+    PT-BR:
+    Converte as colunas em DataFrame do pandas.
+
+    EN:
+    Converts the columns into a pandas DataFrame.
+    """
+    return pd.DataFrame({name: columns[name] for name in COLUMNS})
@@ -0,0 +1,171 @@
+"""
+Compactação de Mensagens / Message Compaction
+
+PT-BR:
+Etapa executada antes da chamada ao LLM que reduz o número de tokens do prompt
+sem perder conteúdo relevante: descarta mensagens vazias (figurinhas, mídias
+sem legenda) e ruído ("ok", "kkk", só emojis), remove textos encaminhados
+repetidos, trunca mensagens muito longas e junta mensagens consecutivas do
+mesmo remetente. As regras são configuráveis pelo ambiente.
+
+EN:
+Stage run before the LLM call that reduces prompt tokens without losing
+relevant content: drops empty messages (stickers, media without caption) and
+noise ("ok", "kkk", emoji-only), removes repeated forwarded texts, truncates
+very long messages and merges consecutive messages from the same sender.
+Rules are configurable through the environment.
+"""
+
+import hashlib
+import os
+import re
+
+
+class CompactedMessage:
+    """
+    PT-BR:
+    Mensagem já compactada, com a mesma interface usada pelo PromptBuilder.
+
+    EN:
+    Compacted message, with the same interface used by PromptBuilder.
+    """
+
+    __slots__ = ("name", "text", "message_timestamp")
+
+    def __init__(self, name, text, message_timestamp):
+        self.name = name
+        self.text = text
+        self.message_timestamp = message_timestamp
+
+    def get_name(self):
+        return self.name
+
+    def get_text(self):
+        return self.text
+
+
+class MessageCompactor:
+    """
+    PT-BR:
+    Aplica as regras de compactação e registra a economia obtida.
+
+    EN:
+    Applies compaction rules and records the savings.
+    """
+
+    DEFAULT_NOISE_PATTERN = r"(o+k+|okay|blz|beleza|vlw|valeu|obg|k{2,}|rs+|(ha|he|hi){2,}|[\W_]*)"
+
+    def __init__(self, drop_empty=True, noise_pattern=DEFAULT_NOISE_PATTERN, collapse_minutes=5,
+                 dedupe_min_chars=80, max_chars=1500):
+        """
+        PT-BR:
+        Parâmetros:
+            drop_empty: Descarta mensagens sem texto
+            noise_pattern: Regex de mensagens descartadas como ruído (vazio desativa)
+            collapse_minutes: Junta mensagens do mesmo remetente dentro deste intervalo (0 desativa)
+            dedupe_min_chars: Tamanho mínimo para remover textos repetidos (0 desativa)
+            max_chars: Tamanho máximo de uma mensagem antes de truncar (0 desativa)
+
+        EN:
+        Parameters:
+            drop_empty: Drops messages without text
+            noise_pattern: Regex of messages dropped as noise (empty disables)
+            collapse_minutes: Merges same-sender messages within this interval (0 disables)
+            dedupe_min_chars: Minimum length to remove repeated texts (0 disables)
+            max_chars: Maximum message length before truncation (0 disables)
+        """
+        self.drop_empty = drop_empty
+        self.noise = re.compile(noise_pattern, re.IGNORECASE) if noise_pattern else None
+        self.collapse_seconds = collapse_minutes * 60
+        self.dedupe_min_chars = dedupe_min_chars
+        self.max_chars = max_chars
+        self.stats = {}
+
+    @classmethod
+    def from_env(cls):
+        """
+        PT-BR:
+        Cria o compactador a partir das variáveis SUMMARY_COMPACT_*.
+
+        EN:
+        Creates the compactor from the SUMMARY_COMPACT_* variables.
+        """
+        return cls(
+            drop_empty=os.getenv("SUMMARY_COMPACT_DROP_EMPTY", "true").lower() == "true",
+            noise_pattern=os.getenv("SUMMARY_COMPACT_NOISE_PATTERN", cls.DEFAULT_NOISE_PATTERN),
+            collapse_minutes=float(os.getenv("SUMMARY_COMPACT_COLLAPSE_MINUTES", "5")),
+            dedupe_min_chars=int(os.getenv("SUMMARY_COMPACT_DEDUPE_MIN_CHARS", "80")),
+            max_chars=int(os.getenv("SUMMARY_COMPACT_MAX_CHARS", "1500")),
+        )
+
+    def _truncate(self, text):
+        if self.max_chars and len(text) > self.max_chars:
+            return text[:self.max_chars].rstrip() + "…"
+        return text
+
+    def compact(self, messages):
+        """
+        PT-BR:
+        Compacta as mensagens (em ordem cronológica) e atualiza self.stats.
+
+        Retorna:
+            list[CompactedMessage]: Mensagens compactadas
+
+        EN:
+        Compacts the messages (in chronological order) and updates self.stats.
+
+        Returns:
+            list[CompactedMessage]: Compacted messages
+        """
+        stats = {"messages_in": 0, "dropped_empty": 0, "dropped_noise": 0, "duplicates": 0,
+                 "truncated": 0, "collapsed": 0, "chars_in": 0, "chars_out": 0}
+        seen = set()
+        result = []
+        last = None
+        last_timestamp = None
+
+        for msg in messages:
+            stats["messages_in"] += 1
+            text = (msg.get_text() or "").strip()
+            stats["chars_in"] += len(text)
+
+            if not text:
+                if self.drop_empty:
+                    stats["dropped_empty"] += 1
+                    continue
+            elif self.noise is not None and self.noise.fullmatch(text):
+                stats["dropped_noise"] += 1
+                continue
+
+            if self.dedupe_min_chars and len(text) >= self.dedupe_min_chars:
+                digest = hashlib.sha1(" ".join(text.lower().split()).encode("utf-8")).digest()
+                if digest in seen:
+                    stats["duplicates"] += 1
+                    continue
+                seen.add(digest)
+
+            truncated = self._truncate(text)
+            if truncated is not text:
+                stats["truncated"] += 1
+                text = truncated
+
+            name = msg.get_name()
+            timestamp = msg.message_timestamp
+            if (last is not None and self.collapse_seconds and last.name == name
+                    and timestamp - last_timestamp <= self.collapse_seconds):
+                last.text = f"{last.text}\n{text}" if last.text else text
+                last_timestamp = timestamp
+                stats["collapsed"] += 1
+                continue
+
+            last = CompactedMessage(name, text, timestamp)
+            last_timestamp = timestamp
+            result.append(last)
+
+        stats["messages_out"] = len(result)
+        stats["chars_out"] = sum(len(msg.text) for msg in result)
+        # Mesma heurística do PromptBuilder: ~4 caracteres por token
+        # Same heuristic as PromptBuilder: ~4 characters per token
+        stats["tokens_saved"] = (stats["chars_in"] - stats["chars_out"]) // 4
+        self.stats = stats
+        return result
@@ -6,10 +6,16 @@ Processador de Mensagens do WhatsApp / WhatsApp Message Processor
 PT-BR:
 Esta classe processa e estrutura diferentes tipos de mensagens do WhatsApp (texto, áudio,
 imagem e documentos), extraindo e organizando seus metadados e conteúdo.
+Apenas os campos usados nos resumos (remetente, texto e timestamp) são lidos na
+criação; metadados de mídia e o conteúdo base64 são lidos/decodificados no
+primeiro acesso. A classe usa __slots__ para reduzir a memória em janelas grandes.
 
 EN:
 This class processes and structures different types of WhatsApp messages (text, audio,
 image, and documents), extracting and organizing their metadata and content.
+Only the fields summaries use (sender, text and timestamp) are read on creation;
+media metadata and the base64 payload are read/decoded on first access. The class
+uses __slots__ to reduce memory for large windows.
 """
 
 class MessageSandeco:
@@ -18,315 +24,339 @@ class MessageSandeco:
     TYPE_AUDIO = "audioMessage"
     TYPE_IMAGE = "imageMessage"
     TYPE_DOCUMENT = "documentMessage"
-    
+
     # Message Scopes / Escopos de Mensagem
     SCOPE_GROUP = "group"
     SCOPE_PRIVATE = "private"
-    
+
+    # Envelope fields / Campos do envelope do webhook
+    ENVELOPE_FIELDS = ("event", "instance", "destination", "date_time", "server_url", "apikey")
+
+    # Record fields read on demand / Campos do registro lidos sob demanda
+    RECORD_FIELDS = {
+        "status": "status",
+        "instance_id": "instanceId",
+        "source": "source",
+        "sender": "sender",
+    }
+
+    # Media fields per type: attribute -> key in the media payload
+    # Campos de mídia por tipo: atributo -> chave no conteúdo da mídia
+    MEDIA_FIELDS = {
+        TYPE_AUDIO: {
+            "audio_url": "url",
+            "audio_mimetype": "mimetype",
+            "audio_file_sha256": "fileSha256",
+            "audio_file_length": "fileLength",
+            "audio_duration_seconds": "seconds",
+            "audio_media_key": "mediaKey",
+            "audio_ptt": "ptt",
+            "audio_file_enc_sha256": "fileEncSha256",
+            "audio_direct_path": "directPath",
+            "audio_waveform": "waveform",
+            "audio_view_once": "viewOnce",
+        },
+        TYPE_IMAGE: {
+            "image_url": "url",
+            "image_mimetype": "mimetype",
+            "image_caption": "caption",
+            "image_file_sha256": "fileSha256",
+            "image_file_length": "fileLength",
+            "image_height": "height",
+            "image_width": "width",
+            "image_media_key": "mediaKey",
+            "image_file_enc_sha256": "fileEncSha256",
+            "image_direct_path": "directPath",
+            "image_media_key_timestamp": "mediaKeyTimestamp",
+            "image_thumbnail_base64": "jpegThumbnail",
+            "image_scans_sidecar": "scansSidecar",
+            "image_scan_lengths": "scanLengths",
+            "image_mid_quality_file_sha256": "midQualityFileSha256",
+        },
+        TYPE_DOCUMENT: {
+            "document_url": "url",
+            "document_mimetype": "mimetype",
+            "document_title": "title",
+            "document_file_sha256": "fileSha256",
+            "document_file_length": "fileLength",
+            "document_media_key": "mediaKey",
+            "document_file_name": "fileName",
+            "document_file_enc_sha256": "fileEncSha256",
+            "document_direct_path": "directPath",
+            "document_caption": "caption",
+        },
+    }
+
+    # Base64 payload attribute per type / Atributo do conteúdo base64 por tipo
+    BASE64_FIELDS = {
+        TYPE_AUDIO: "audio_base64_bytes",
+        TYPE_IMAGE: "image_base64",
+        TYPE_DOCUMENT: "document_base64_bytes",
+    }
+
+    __slots__ = (
+        "_record", "_envelope", "_decoded",
+        "remote_jid", "message_id", "from_me", "participant",
+        "push_name", "message_timestamp", "message_type",
+    )
+
     def __init__(self, raw_data):
         """
         PT-BR:
         Inicializa uma mensagem a partir dos dados brutos.
-        
+
         Parâmetros:
-            raw_data: Dados brutos da mensagem do WhatsApp
+            raw_data: Dados brutos da mensagem do WhatsApp (registro ou envelope do webhook)
 
         EN:
         Initializes a message from raw data.
-        
+
         Parameters:
-            raw_data: Raw WhatsApp message data
+            raw_data: Raw WhatsApp message data (record or webhook envelope)
         """
-        if "data" not in raw_data:
-            enveloped_data = {
-                "event": None,
-                "instance": None,
-                "destination": None,
-                "date_time": None,
-                "server_url": None,
-                "apikey": None,
-                "data": raw_data
-            }
+        if "data" in raw_data:
+            self._envelope = raw_data
+            self._record = raw_data.get("data") or {}
         else:
-            enveloped_data = raw_data
-        
-        self.data = enveloped_data
+            self._envelope = None
+            self._record = raw_data
+        self._decoded = None
         self.extract_common_data()
-        self.extract_specific_data()
-    
+
     def extract_common_data(self):
         """
         PT-BR:
-        Extrai metadados comuns da mensagem (remetente, timestamp, IDs, etc).
-        Define os atributos básicos compartilhados por todos os tipos de mensagem.
+        Extrai os metadados usados com frequência (remetente, timestamp, IDs).
+        Os demais campos são lidos sob demanda.
 
         EN:
-        Extracts common message metadata (sender, timestamp, IDs, etc).
-        Sets basic attributes shared by all message types.
+        Extracts frequently used metadata (sender, timestamp, IDs).
+        Other fields are read on demand.
         """
-        self.event = self.data.get("event")
-        self.instance = self.data.get("instance")
-        self.destination = self.data.get("destination")
-        self.date_time = self.data.get("date_time")
-        self.server_url = self.data.get("server_url")
-        self.apikey = self.data.get("apikey")
-        
-        data = self.data.get("data", {})
-        key = data.get("key", {})
-        
+        record = self._record
+        key = record.get("key") or {}
         self.remote_jid = key.get("remoteJid")
         self.message_id = key.get("id")
         self.from_me = key.get("fromMe")
-        self.push_name = data.get("pushName")
-        self.status = data.get("status")
-        self.instance_id = data.get("instanceId")
-        self.source = data.get("source")
-        self.message_timestamp = data.get("messageTimestamp")
-        self.message_type = data.get("messageType")
-        self.sender = data.get("sender")
         self.participant = key.get("participant")
-        
-        self.determine_scope()
-    
-    def determine_scope(self):
-        """
-        PT-BR:
-        Determina se a mensagem é de grupo ou privada.
-        Extrai ID do grupo e número de telefone com base no escopo.
+        self.push_name = record.get("pushName")
+        self.message_timestamp = record.get("messageTimestamp")
+        self.message_type = record.get("messageType")
 
-        EN:
-        Determines if the message is from a group or private chat.
-        Extracts group ID and phone number based on scope.
-        """
-        if self.remote_jid.endswith("@g.us"):
-            self.scope = self.SCOPE_GROUP
-            self.group_id = self.remote_jid.split("@")[0]
-            self.phone = self.participant.split("@")[0] if self.participant else None
-        elif self.remote_jid.endswith("@s.whatsapp.net"):
-            self.scope = self.SCOPE_PRIVATE
-            self.phone = self.remote_jid.split("@")[0]
-            self.group_id = None
-        else:
-            self.scope = "unknown"
-            self.phone = None
-            self.group_id = None
-    
-    def extract_specific_data(self):
+    @property
+    def data(self):
         """
         PT-BR:
-        Extrai dados específicos baseado no tipo da mensagem.
-        Chama o método apropriado para processar texto, áudio, imagem ou documento.
+        Envelope no formato do webhook (criado sob demanda para registros da API).
 
         EN:
-        Extracts specific data based on message type.
-        Calls appropriate method to process text, audio, image, or document.
+        Webhook-style envelope (built on demand for API records).
         """
-        if self.message_type == self.TYPE_TEXT:
-            self.extract_text_message()
-        elif self.message_type == self.TYPE_AUDIO:
-            self.extract_audio_message()
-        elif self.message_type == self.TYPE_IMAGE:
-            self.extract_image_message()
-        elif self.message_type == self.TYPE_DOCUMENT:
-            self.extract_document_message()
-    
-    def extract_text_message(self):
-        """
-        PT-BR:
-        Extrai o conteúdo de uma mensagem de texto.
-        Define o atributo text_message com o conteúdo da conversa.
+        if self._envelope is None:
+            return {
+                "event": None,
+                "instance": None,
+                "destination": None,
+                "date_time": None,
+                "server_url": None,
+                "apikey": None,
+                "data": self._record,
+            }
+        return self._envelope
 
-        EN:
-        Extracts text message content.
-        Sets text_message attribute with conversation content.
-        """
-        self.text_message = self.data["data"]["message"].get("conversation")
-    
-    def extract_audio_message(self):
-        """
-        PT-BR:
-        Extrai metadados de mensagens de áudio.
-        Inclui URL, tipo MIME, duração, chaves de mídia e outros detalhes.
+    def _message_content(self):
+        return self._record.get("message") or {}
 
-        EN:
-        Extracts audio message metadata.
-        Includes URL, MIME type, duration, media keys, and other details.
-        """
-        audio_data = self.data["data"]["message"]["audioMessage"]
-        self.audio_base64_bytes = self.data["data"]["message"].get("base64")
-        self.audio_url = audio_data.get("url")
-        self.audio_mimetype = audio_data.get("mimetype")
-        self.audio_file_sha256 = audio_data.get("fileSha256")
-        self.audio_file_length = audio_data.get("fileLength")
-        self.audio_duration_seconds = audio_data.get("seconds")
-        self.audio_media_key = audio_data.get("mediaKey")
-        self.audio_ptt = audio_data.get("ptt")
-        self.audio_file_enc_sha256 = audio_data.get("fileEncSha256")
-        self.audio_direct_path = audio_data.get("directPath")
-        self.audio_waveform = audio_data.get("waveform")
-        self.audio_view_once = audio_data.get("viewOnce", False)
-    
-    def extract_image_message(self):
-        """
-        PT-BR:
-        Extrai metadados de mensagens com imagem.
-        Inclui URL, dimensões, legenda, miniaturas e outros detalhes.
+    def __getattr__(self, name):
+        # Chamado apenas para atributos que não estão nos slots: leitura sob demanda
+        # Only called for attributes outside the slots: on-demand reads
+        if name in self.ENVELOPE_FIELDS:
+            return self._envelope.get(name) if self._envelope is not None else None
+        if name in self.RECORD_FIELDS:
+            return self._record.get(self.RECORD_FIELDS[name])
+        if name in ("scope", "group_id", "phone"):
+            return self.determine_scope()[name]
 
-        EN:
-        Extracts image message metadata.
-        Includes URL, dimensions, caption, thumbnails, and other details.
-        """
-        image_data = self.data["data"]["message"]["imageMessage"]
-        self.image_url = image_data.get("url")
-        self.image_mimetype = image_data.get("mimetype")
-        self.image_caption = image_data.get("caption")
-        self.image_file_sha256 = image_data.get("fileSha256")
-        self.image_file_length = image_data.get("fileLength")
-        self.image_height = image_data.get("height")
-        self.image_width = image_data.get("width")
-        self.image_media_key = image_data.get("mediaKey")
-        self.image_file_enc_sha256 = image_data.get("fileEncSha256")
-        self.image_direct_path = image_data.get("directPath")
-        self.image_media_key_timestamp = image_data.get("mediaKeyTimestamp")
-        self.image_thumbnail_base64 = image_data.get("jpegThumbnail")
-        self.image_scans_sidecar = image_data.get("scansSidecar")
-        self.image_scan_lengths = image_data.get("scanLengths")
-        self.image_mid_quality_file_sha256 = image_data.get("midQualityFileSha256")
-        self.image_base64 = self.data["data"]["message"].get("base64")
-    
-    def extract_document_message(self):
+        message_type = object.__getattribute__(self, "message_type")
+        if message_type == self.TYPE_TEXT and name == "text_message":
+            return self._message_content().get("conversation")
+
+        fields = self.MEDIA_FIELDS.get(message_type)
+        if fields and name in fields:
+            media = self._message_content().get(message_type) or {}
+            default = False if name == "audio_view_once" else None
+            return media.get(fields[name], default)
+
+        if name == self.BASE64_FIELDS.get(message_type):
+            payload = self._message_content().get("base64")
+            if message_type != self.TYPE_DOCUMENT:
+                return payload
+            # Decodificado uma única vez, no primeiro acesso / Decoded once, on first access
+            if self._decoded is None:
+                self._decoded = (self.decode_base64(payload),)
+            return self._decoded[0]
+
+        raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'")
+
+    def determine_scope(self):
         """
         PT-BR:
-        Extrai metadados de mensagens com documentos.
-        Inclui URL, nome do arquivo, tipo MIME, legenda e outros detalhes.
+        Determina se a mensagem é de grupo ou privada.
+        Extrai ID do grupo e número de telefone com base no escopo.
+
+        Retorna:
+            dict: scope, group_id e phone
 
         EN:
-        Extracts document message metadata.
-        Includes URL, filename, MIME type, caption, and other details.
+        Determines if the message is from a group or private chat.
+        Extracts group ID and phone number based on scope.
+
+        Returns:
+            dict: scope, group_id and phone
         """
-        document_data = self.data["data"]["message"]["documentMessage"]
-        self.document_url = document_data.get("url")
-        self.document_mimetype = document_data.get("mimetype")
-        self.document_title = document_data.get("title")
-        self.document_file_sha256 = document_data.get("fileSha256")
-        self.document_file_length = document_data.get("fileLength")
-        self.document_media_key = document_data.get("mediaKey")
-        self.document_file_name = document_data.get("fileName")
-        self.document_file_enc_sha256 = document_data.get("fileEncSha256")
-        self.document_direct_path = document_data.get("directPath")
-        self.document_caption = document_data.get("caption", None)
-        self.document_base64_bytes = self.decode_base64(self.data["data"]["message"].get("base64"))
-    
+        remote_jid = self.remote_jid or ""
+        if remote_jid.endswith("@g.us"):
+            return {
+                "scope": self.SCOPE_GROUP,
+                "group_id": remote_jid.split("@")[0],
+                "phone": self.participant.split("@")[0] if self.participant else None,
+            }
+        if remote_jid.endswith("@s.whatsapp.net"):
+            return {"scope": self.SCOPE_PRIVATE, "group_id": None, "phone": remote_jid.split("@")[0]}
+        return {"scope": "unknown", "group_id": None, "phone": None}
+
     def decode_base64(self, base64_string):
         """
         PT-BR:
         Decodifica uma string base64 para bytes.
-        
+
         Parâmetros:
             base64_string: String codificada em base64
-            
+
         Retorna:
             bytes/None: Dados decodificados ou None se a string for inválida
 
         EN:
         Decodes a base64 string to bytes.
-        
+
         Parameters:
             base64_string: Base64 encoded string
-            
+
         Returns:
             bytes/None: Decoded data or None if string is invalid
         """
         if base64_string:
             return base64.b64decode(base64_string)
         return None
-    
+
     def get(self):
         """
         PT-BR:
-        Retorna todos os atributos da mensagem.
-        
+        Retorna todos os atributos da mensagem (os campos de mídia são lidos neste momento).
+
         Retorna:
             dict: Dicionário com todos os atributos da mensagem
 
         EN:
-        Returns all message attributes.
-        
+        Returns all message attributes (media fields are read at this point).
+
         Returns:
             dict: Dictionary with all message attributes
         """
-        return self.__dict__
-    
+        names = list(self.ENVELOPE_FIELDS)
+        names += ["remote_jid", "message_id", "from_me", "push_name", "message_timestamp",
+                  "message_type", "participant", *self.RECORD_FIELDS, "scope", "group_id", "phone"]
+        if self.message_type == self.TYPE_TEXT:
+            names.append("text_message")
+        names += list(self.MEDIA_FIELDS.get(self.message_type, ()))
+        if self.message_type in self.BASE64_FIELDS:
+            names.append(self.BASE64_FIELDS[self.message_type])
+        return {name: getattr(self, name) for name in names}
+
+    def to_record(self):
+        """
+        PT-BR:
+        Retorna o registro bruto da mensagem, sem o envelope do webhook.
+
+        Retorna:
+            dict: Registro no formato retornado pela API Evolution
+
+        EN:
+        Returns the raw message record, without the webhook envelope.
+
+        Returns:
+            dict: Record in the format returned by the Evolution API
+        """
+        return self._record
+
     def get_text(self):
         """
         PT-BR:
         Obtém o texto principal da mensagem.
         Para imagens e documentos, retorna a legenda.
-        
+
         Retorna:
             str: Texto da mensagem ou legenda
 
         EN:
         Gets the main text content of the message.
         For images and documents, returns the caption.
-        
+
         Returns:
             str: Message text or caption
         """
-        text = ""
-        if self.message_type == self.TYPE_TEXT:
-            text = self.text_message
-        elif self.message_type == self.TYPE_IMAGE:
-            text = self.image_caption
-        elif self.message_type == self.TYPE_DOCUMENT:
-            text = self.document_caption
-        return text
-    
+        message_type = self.message_type
+        if message_type == self.TYPE_TEXT:
+            return self._message_content().get("conversation")
+        if message_type == self.TYPE_IMAGE or message_type == self.TYPE_DOCUMENT:
+            return (self._message_content().get(message_type) or {}).get("caption")
+        return ""
+
     def get_name(self):
         """
         PT-BR:
         Obtém o nome do remetente da mensagem.
-        
+
         Retorna:
             str: Nome do remetente
 
         EN:
         Gets the sender's name of the message.
-        
+
         Returns:
             str: Sender's name
         """
         return self.push_name
-    
+
     @staticmethod
     def get_messages(messages: dict) -> list['MessageSandeco']:
         """
         PT:
         Converte um dicionário de mensagens em objetos MessageSandeco.
-        
+
         Parâmetros:
             messages: Dicionário com os registros das mensagens
-            
+
         Retorna:
             List[MessageSandeco]: Lista de objetos de mensagem processados
 
         EN:
         Converts a dictionary of messages into MessageSandeco objects.
-        
+
         Parameters:
             messages: Dictionary with message records
-            
+
         Returns:
             List[MessageSandeco]: List of processed message objects
         """
         # Use .get() to safely access nested keys and provide default values
         msgs_data = messages.get('messages', {})
         records = msgs_data.get('records', [])
-        
+
         if not records:
             # Handle the case where no messages are found or keys are missing
             print("Warning: No message records found in the response or keys 'messages'/'records' missing.")
             return []  # Return an empty list if no records found
 
         mensagens = [MessageSandeco(msg) for msg in records]
-        return mensagens
\ No newline at end of file
+        return mensagens
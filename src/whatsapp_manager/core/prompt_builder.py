@@ -0,0 +1,121 @@
+"""
+Montagem do Prompt de Resumo / Summary Prompt Builder
+
+PT-BR:
+Este módulo monta o texto enviado ao CrewAI a partir das mensagens do período.
+O prompt é montado com um único join (tempo linear no número de mensagens),
+a formatação de data/hora é reaproveitada por minuto e os espaços de
+indentação são removidos, pois viram tokens desperdiçados. Também fornece uma
+estimativa do número de tokens antes da chamada ao LLM.
+
+EN:
+This module assembles the text sent to CrewAI from the period's messages.
+The prompt is built with a single join (linear time in the message count),
+date/time formatting is reused per minute and indentation whitespace is
+stripped, since it only turns into wasted tokens. It also provides an
+estimate of the token count before the LLM call.
+"""
+
+import time
+
+
+class PromptBuilder:
+    """
+    PT-BR:
+    Monta prompts compactos para o resumo de grupos.
+
+    EN:
+    Builds compact prompts for group summaries.
+    """
+
+    MESSAGES_TITLE = "USER MESSAGES FOR SUMMARY / MENSAGENS DOS USUÁRIOS PARA O RESUMO"
+    TIME_FORMAT = "%d/%m %H:%M"
+
+    def __init__(self):
+        self._minute_cache = {}
+
+    @staticmethod
+    def estimate_tokens(text):
+        """
+        PT-BR:
+        Estimativa aproximada de tokens (cerca de 4 caracteres por token).
+
+        EN:
+        Rough token estimate (about 4 characters per token).
+        """
+        return len(text) // 4 + 1
+
+    def format_time(self, timestamp):
+        """
+        PT-BR:
+        Formata o timestamp como "dd/mm HH:MM", reaproveitando o resultado por minuto.
+
+        EN:
+        Formats the timestamp as "dd/mm HH:MM", reusing the result per minute.
+        """
+        minute = int(timestamp) // 60
+        formatted = self._minute_cache.get(minute)
+        if formatted is None:
+            if len(self._minute_cache) > 100000:
+                self._minute_cache.clear()
+            formatted = time.strftime(self.TIME_FORMAT, time.localtime(minute * 60))
+            self._minute_cache[minute] = formatted
+        return formatted
+
+    def header(self, start_date, end_date, title=MESSAGES_TITLE):
+        """
+        PT-BR:
+        Cabeçalho com o período e o título da seção seguinte.
+
+        EN:
+        Header with the period and the title of the following section.
+        """
+        return (
+            "Group Message Data / Dados sobre as mensagens do grupo\n"
+            f"Initial Date / Data Inicial: {start_date}\n"
+            f"Final Date / Data Final: {end_date}\n\n"
+            f"{title}:\n"
+            "--------------------------\n"
+        )
+
+    def format_entry(self, name, text, timestamp):
+        """
+        PT-BR:
+        Formata uma mensagem como um bloco compacto de três linhas.
+
+        EN:
+        Formats one message as a compact three-line block.
+        """
+        text = (text or "").strip()
+        return f"Nome: *{name}*\nPostagem: \"{text}\"\ndata: {self.format_time(timestamp)}\n\n"
+
+    def format_message(self, msg):
+        """
+        PT-BR:
+        Formata um MessageSandeco para o prompt.
+
+        EN:
+        Formats a MessageSandeco for the prompt.
+        """
+        return self.format_entry(msg.get_name(), msg.get_text(), msg.message_timestamp)
+
+    def entries(self, messages):
+        """
+        PT-BR:
+        Gera as entradas formatadas, na ordem recebida.
+
+        EN:
+        Yields the formatted entries, in the given order.
+        """
+        for msg in messages:
+            yield self.format_message(msg)
+
+    def build(self, start_date, end_date, entries, title=MESSAGES_TITLE):
+        """
+        PT-BR:
+        Monta o prompt completo com um único join.
+
+        EN:
+        Assembles the full prompt with a single join.
+        """
+        return self.header(start_date, end_date, title) + "".join(entries)
@@ -0,0 +1,164 @@
+"""
+Motor de Agendamento em Processo / In-process Scheduler Engine
+
+PT-BR:
+Agendador diário baseado em heap usado pelo worker residente no lugar de uma
+entrada de cron por grupo. Cada chave (group_id) tem um horário diário; o
+próximo disparo fica em um heap ordenado por data/hora, então descobrir o que
+venceu e quanto falta para o próximo disparo custa O(log n). Suporta:
+- espalhamento: grupos com o mesmo horário são distribuídos de forma estável
+  dentro de uma janela (spread_seconds), evitando picos na API e no LLM;
+- jitter: atraso aleatório adicional a cada disparo (jitter_seconds);
+- recarga: load() troca os horários sem reiniciar o processo.
+
+EN:
+Heap-based daily scheduler used by the resident worker instead of one cron
+entry per group. Each key (group_id) has a daily slot; the next firing lives
+in a heap ordered by datetime, so finding what is due and how long until the
+next firing costs O(log n). Supports:
+- spreading: groups sharing a slot are stably distributed across a window
+  (spread_seconds), avoiding API and LLM spikes;
+- jitter: extra random delay on each firing (jitter_seconds);
+- reload: load() swaps the slots without restarting the process.
+"""
+
+import heapq
+import random
+import zlib
+from datetime import datetime, timedelta
+
+
+class DailyScheduler:
+    """
+    PT-BR:
+    Heap de disparos diários por chave.
+
+    EN:
+    Heap of daily firings per key.
+    """
+
+    def __init__(self, catchup=timedelta(minutes=15), spread_seconds=0, jitter_seconds=0, rng=None):
+        """
+        PT-BR:
+        Parâmetros:
+            catchup: Atraso máximo tolerado; disparos mais atrasados são pulados
+            spread_seconds: Janela de espalhamento estável por chave (0 desativa)
+            jitter_seconds: Atraso aleatório máximo por disparo (0 desativa)
+            rng: random.Random usado no jitter (opcional)
+
+        EN:
+        Parameters:
+            catchup: Maximum tolerated delay; later firings are skipped
+            spread_seconds: Stable per-key spreading window (0 disables)
+            jitter_seconds: Maximum random delay per firing (0 disables)
+            rng: random.Random used for jitter (optional)
+        """
+        self.catchup = catchup
+        self.spread_seconds = spread_seconds
+        self.jitter_seconds = jitter_seconds
+        self.rng = rng or random.Random()
+        self.slots = {}
+        self._heap = []
+        self._built = False
+
+    def load(self, slots):
+        """
+        PT-BR:
+        Define os horários ({chave: datetime.time}). O heap é reconstruído no
+        próximo uso, a partir do horário informado nele.
+
+        EN:
+        Sets the slots ({key: datetime.time}). The heap is rebuilt on next use,
+        from the time given to it.
+        """
+        self.slots = dict(slots)
+        self._heap = []
+        self._built = False
+
+    def _offset(self, key):
+        offset = 0.0
+        if self.spread_seconds:
+            offset += zlib.crc32(str(key).encode("utf-8")) % int(self.spread_seconds)
+        if self.jitter_seconds:
+            offset += self.rng.uniform(0, self.jitter_seconds)
+        return timedelta(seconds=offset)
+
+    def _push(self, key, day):
+        # O dia do horário fica na entrada: o espalhamento pode empurrar o disparo para depois da meia-noite
+        # The slot day is kept in the entry: spreading can push the firing past midnight
+        due = datetime.combine(day, self.slots[key]) + self._offset(key)
+        heapq.heappush(self._heap, (due, key, day))
+
+    def _first_day(self, key, now):
+        # Horário de hoje já perdido além da tolerância: começa amanhã
+        # Today's slot already missed beyond the tolerance: start tomorrow
+        first = datetime.combine(now.date(), self.slots[key])
+        return now.date() if first + self.catchup >= now else now.date() + timedelta(days=1)
+
+    def _ensure(self, now):
+        if self._built:
+            return
+        for key in self.slots:
+            self._push(key, self._first_day(key, now))
+        self._built = True
+
+    def peek_due(self, now):
+        """
+        PT-BR:
+        Lista, sem alterar o heap, as chaves vencidas dentro da tolerância.
+
+        Retorna:
+            list: Tuplas (chave, data/hora prevista), em ordem de disparo
+
+        EN:
+        Lists, without changing the heap, the keys due within the tolerance.
+
+        Returns:
+            list: (key, scheduled datetime) tuples, in firing order
+        """
+        self._ensure(now)
+        due = []
+        for when, key, _ in sorted(self._heap):
+            if when > now:
+                break
+            if now <= when + self.catchup:
+                due.append((key, when))
+        return due
+
+    def pop_due(self, now):
+        """
+        PT-BR:
+        Remove do heap tudo o que venceu e reagenda cada chave para o dia seguinte.
+
+        Retorna:
+            tuple: (vencidas [(chave, prevista)], perdidas [(chave, prevista)])
+
+        EN:
+        Removes everything due from the heap and reschedules each key for the next day.
+
+        Returns:
+            tuple: (due [(key, scheduled)], missed [(key, scheduled)])
+        """
+        self._ensure(now)
+        due, missed = [], []
+        while self._heap and self._heap[0][0] <= now:
+            when, key, day = heapq.heappop(self._heap)
+            next_day = day + timedelta(days=1)
+            if now <= when + self.catchup:
+                due.append((key, when))
+                self._push(key, next_day)
+            else:
+                missed.append((key, when))
+                self._push(key, max(next_day, self._first_day(key, now)))
+        return due, missed
+
+    def next_due(self, now):
+        """
+        PT-BR:
+        Data/hora do próximo disparo, ou None sem horários.
+
+        EN:
+        Datetime of the next firing, or None without slots.
+        """
+        self._ensure(now)
+        return self._heap[0][0] if self._heap else None
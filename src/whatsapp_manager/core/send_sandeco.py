@@ -13,12 +13,16 @@ Provides an abstraction layer to facilitate API integration.
 """
 
 import os
-import time
 import logging
 from dotenv import load_dotenv
 from evolutionapi.client import EvolutionClient
 from evolutionapi.models.message import TextMessage, MediaMessage
 
+try:
+    from ..infrastructure.api.rate_limiter import get_send_limiter, is_rate_limit_error
+except ImportError:
+    from whatsapp_manager.infrastructure.api.rate_limiter import get_send_limiter, is_rate_limit_error
+
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 
@@ -49,6 +53,34 @@ class SendSandeco:
             api_token=self.evo_api_token
         )
 
+        # Ritmo de envio compartilhado no processo / Process-wide send pacing
+        self.limiter = get_send_limiter()
+        self.max_retries = int(os.getenv("EVO_SEND_MAX_RETRIES", "3"))
+        self.retry_delay = float(os.getenv("EVO_SEND_RETRY_DELAY", "5"))
+
+    def _paced_call(self, send):
+        """
+        PT-BR:
+        Executa um envio respeitando o token bucket. Em caso de rate-overlimit,
+        pausa os envios do processo com espera exponencial e tenta de novo.
+
+        EN:
+        Runs a send through the token bucket. On rate-overlimit, pauses the
+        process' sends with exponential backoff and retries.
+        """
+        for attempt in range(self.max_retries + 1):
+            waited = self.limiter.acquire()
+            if waited:
+                logging.info(f"Aguardou {waited:.1f}s pelo limite de envio / Waited {waited:.1f}s for send rate limit")
+            try:
+                return send()
+            except Exception as e:
+                if not is_rate_limit_error(e) or attempt >= self.max_retries:
+                    raise
+                delay = self.retry_delay * (2 ** attempt)
+                logging.warning(f"Rate limit atingido. Aguardando {delay:.0f}s... / Rate limit hit. Waiting {delay:.0f}s...")
+                self.limiter.penalize(delay)
+
     def _send_media(self, number, media_file, mediatype, mimetype, caption):
         if not os.path.exists(media_file):
             raise FileNotFoundError(f"Arquivo '{media_file}' não encontrado.")
@@ -62,12 +94,12 @@ class SendSandeco:
             media=""
         )
 
-        self.client.messages.send_media(
+        self._paced_call(lambda: self.client.messages.send_media(
             self.evo_instance_id,
             media_message,
             self.evo_instance_token,
             media_file
-        )
+        ))
 
     def textMessage(self, number, msg, mentions=[]):
         """
@@ -109,16 +141,13 @@ class SendSandeco:
                 mentioned=mentions
             )
 
-            # Pequeno delay antes do envio
-            time.sleep(3)
-            
             logging.info("Enviando mensagem...")
             try:
-                response = self.client.messages.send_text(
+                response = self._paced_call(lambda: self.client.messages.send_text(
                     self.evo_instance_id,
                     text_message,
                     self.evo_instance_token
-                )
+                ))
                 logging.info(f"Resposta da API: {response}")
                 logging.info("Mensagem enviada com sucesso!")
                 return response
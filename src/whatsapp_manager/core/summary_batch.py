@@ -0,0 +1,267 @@
+"""
+Resumos em Lote / Batch Summary Runner
+
+PT-BR:
+Executa os resumos de vários grupos como um pipeline concorrente: coleta de
+mensagens na Evolution API, geração com CrewAI e envio rodam em pools de
+threads separados, cada um com seu próprio limite de concorrência. Assim os
+resumos noturnos de todos os grupos terminam em minutos, sem precisar
+espalhar um agendamento por grupo.
+
+EN:
+Runs summaries for many groups as a concurrent pipeline: message collection
+from the Evolution API, CrewAI generation and delivery run on separate thread
+pools, each with its own concurrency limit. Nightly summaries for all groups
+finish in minutes without spreading one schedule entry per group.
+
+Uso / Usage:
+    python -m whatsapp_manager.core.summary_batch --all-enabled
+    python -m whatsapp_manager.core.summary_batch 1203...@g.us 1204...@g.us
+"""
+
+import argparse
+import os
+import sys
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+
+# Define Project Root assuming this file is src/whatsapp_manager/core/summary_batch.py
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', '..'))
+
+# Add src directory to Python path to enable absolute imports when running as script
+src_path = os.path.join(PROJECT_ROOT, 'src')
+if src_path not in sys.path:
+    sys.path.insert(0, src_path)
+
+from dotenv import load_dotenv
+
+# Local application/library imports - try relative first, fallback to absolute
+try:
+    from .summary_runner import SummaryJob, SummaryRunner
+    from .summary_crew import SummaryCrew
+except ImportError:
+    from whatsapp_manager.core.summary_runner import SummaryJob, SummaryRunner
+    from whatsapp_manager.core.summary_crew import SummaryCrew
+
+
+class SummaryBatch:
+    """
+    PT-BR:
+    Pipeline coleta → prompt → LLM → envio com limites de concorrência por etapa.
+
+    EN:
+    Fetch → prompt → LLM → send pipeline with per-stage concurrency limits.
+    """
+
+    def __init__(self, runner=None, fetch_concurrency=None, llm_concurrency=None, send_concurrency=None, crew_factory=None):
+        """
+        PT-BR:
+        Inicializa o pipeline.
+
+        Parâmetros:
+            runner: SummaryRunner compartilhado (opcional)
+            fetch_concurrency: Coletas simultâneas na Evolution API (padrão: 4)
+            llm_concurrency: Chamadas simultâneas ao LLM (padrão: 3)
+            send_concurrency: Envios simultâneos (padrão: 1)
+            crew_factory: Função que cria um SummaryCrew por thread (padrão: SummaryCrew)
+
+        EN:
+        Initializes the pipeline.
+
+        Parameters:
+            runner: Shared SummaryRunner (optional)
+            fetch_concurrency: Concurrent Evolution API fetches (default: 4)
+            llm_concurrency: Concurrent LLM calls (default: 3)
+            send_concurrency: Concurrent sends (default: 1)
+            crew_factory: Callable creating one SummaryCrew per thread (default: SummaryCrew)
+        """
+        self.runner = runner or SummaryRunner()
+        self.fetch_concurrency = fetch_concurrency or int(os.getenv("SUMMARY_FETCH_CONCURRENCY", "4"))
+        self.llm_concurrency = llm_concurrency or int(os.getenv("SUMMARY_LLM_CONCURRENCY", "3"))
+        self.send_concurrency = send_concurrency or int(os.getenv("SUMMARY_SEND_CONCURRENCY", "1"))
+        self.crew_factory = crew_factory or SummaryCrew
+        # Prompts inteiros e trechos (map-reduce) dividem o mesmo limite de chamadas ao LLM
+        # Whole prompts and map-reduce chunks share the same LLM call limit
+        self.runner.llm_slots = threading.BoundedSemaphore(self.llm_concurrency)
+        self._local = threading.local()
+        self._crews = []
+        # Pools por etapa compartilhados entre lotes simultâneos (dispatch_workers do worker)
+        # Stage pools shared by concurrent batches (the worker's dispatch_workers)
+        self._pools = None
+        self._pools_lock = threading.Lock()
+
+    def _crew(self):
+        # Crew/Agent do CrewAI guardam estado da execução: um por thread do pool de LLM
+        # CrewAI Crew/Agent keep per-run state: one per LLM pool thread
+        crew = getattr(self._local, "crew", None)
+        if crew is None:
+            crew = self.crew_factory()
+            self._local.crew = crew
+            self._crews.append(crew)
+        return crew
+
+    def _stage_pools(self):
+        with self._pools_lock:
+            if self._pools is None:
+                self._pools = (
+                    ThreadPoolExecutor(self.fetch_concurrency, thread_name_prefix="summary-fetch"),
+                    ThreadPoolExecutor(self.llm_concurrency, thread_name_prefix="summary-llm"),
+                    ThreadPoolExecutor(self.send_concurrency, thread_name_prefix="summary-send"),
+                )
+            return self._pools
+
+    def close(self):
+        """
+        PT-BR:
+        Encerra os pools das etapas, aguardando as tarefas em andamento.
+
+        EN:
+        Shuts down the stage pools, waiting for running tasks.
+        """
+        with self._pools_lock:
+            pools, self._pools = self._pools, None
+        for pool in pools or ():
+            pool.shutdown(wait=True)
+
+    def run(self, group_ids):
+        """
+        PT-BR:
+        Executa os resumos dos grupos informados. Chamadas simultâneas dividem
+        os mesmos pools, então os limites por etapa valem para todas juntas.
+
+        Parâmetros:
+            group_ids: Lista de IDs de grupos
+
+        Retorna:
+            list: SummaryJob de cada grupo, na ordem recebida
+
+        EN:
+        Runs summaries for the given groups. Concurrent calls share the same
+        pools, so the per-stage limits hold across all of them.
+
+        Parameters:
+            group_ids: List of group IDs
+
+        Returns:
+            list: One SummaryJob per group, in the given order
+        """
+        group_ids = list(dict.fromkeys(group_ids))
+        if not group_ids:
+            return []
+
+        started = time.monotonic()
+        self.runner._log("info", f"Iniciando lote de {len(group_ids)} resumos (coleta={self.fetch_concurrency}, llm={self.llm_concurrency}, envio={self.send_concurrency})")
+
+        fetch_pool, llm_pool, send_pool = self._stage_pools()
+
+        def send_stage(job):
+            return self.runner.deliver(job)
+
+        def llm_stage(job):
+            self.runner.summarize(job, self._crew())
+            if job.status != SummaryJob.STATUS_SUMMARIZED:
+                return job
+            return send_pool.submit(send_stage, job)
+
+        def fetch_stage(group_id):
+            job = self.runner.prepare(group_id)
+            if job.status != SummaryJob.STATUS_READY:
+                return job
+            return llm_pool.submit(llm_stage, job)
+
+        futures = [(group_id, fetch_pool.submit(fetch_stage, group_id)) for group_id in group_ids]
+        jobs = [self._resolve(group_id, future) for group_id, future in futures]
+
+        counts = {}
+        for job in jobs:
+            counts[job.status] = counts.get(job.status, 0) + 1
+        elapsed = time.monotonic() - started
+        self.runner._log("info", f"Lote finalizado em {elapsed:.1f}s: {counts}")
+        cache_hits = sum(getattr(getattr(crew, "cache", None), "hits", 0) for crew in self._crews)
+        cache_misses = sum(getattr(getattr(crew, "cache", None), "misses", 0) for crew in self._crews)
+        if cache_hits or cache_misses:
+            self.runner._log("info", f"Cache de resumos / Summary cache: {cache_hits} hits, {cache_misses} misses")
+        return jobs
+
+    def _resolve(self, group_id, future):
+        # Cada etapa devolve o job final ou o Future da próxima etapa
+        # Each stage returns the final job or the next stage's Future
+        try:
+            result = future.result()
+            while isinstance(result, Future):
+                result = result.result()
+            return result
+        except Exception as e:
+            job = SummaryJob(group_id)
+            return self.runner._fail(job, f"Erro inesperado no resumo do grupo {group_id}: {e}", exc_info=True)
+
+
+def enabled_group_ids(controller, daily_only=False):
+    """
+    PT-BR:
+    Lista os grupos com resumo habilitado em group_summary.csv.
+
+    EN:
+    Lists groups with summary enabled in group_summary.csv.
+    """
+    try:
+        from .summary_worker import is_daily_config
+    except ImportError:
+        from whatsapp_manager.core.summary_worker import is_daily_config
+
+    summary_data = controller.load_summary_info()
+    group_ids = []
+    for config in summary_data.to_dict('records'):
+        if not config.get('group_id') or not config.get('enabled', False):
+            continue
+        if daily_only and not is_daily_config(config):
+            continue
+        group_ids.append(config['group_id'])
+    return group_ids
+
+
+def main():
+    load_dotenv(os.path.join(PROJECT_ROOT, '.env'), override=True)
+
+    parser = argparse.ArgumentParser(description="Executa resumos de vários grupos em paralelo / Runs summaries for many groups concurrently")
+    parser.add_argument("group_ids", nargs="*", help="IDs dos grupos / Group IDs")
+    parser.add_argument("--all-enabled", action="store_true", help="Todos os grupos habilitados / All enabled groups")
+    parser.add_argument("--task_name", type=str, default=None, help="Nome da tarefa agendada / Scheduled task name")
+    parser.add_argument("--force", action="store_true", help="Executa mesmo com o worker residente ativo / Run even if the resident worker is active")
+    args = parser.parse_args()
+
+    try:
+        from whatsapp_manager.utils.logger import get_logger, TaskExecutionMonitor
+        logger = get_logger("summary_batch", os.getenv("LOG_LEVEL", "INFO"))
+        task_monitor = TaskExecutionMonitor()
+    except ImportError:
+        logger = None
+        task_monitor = None
+
+    # Agendado pelo cron sem grupos explícitos: o worker residente já cobre os resumos diários
+    # Scheduled by cron without explicit groups: the resident worker already covers daily summaries
+    if args.task_name and not args.group_ids and not args.force:
+        try:
+            from .worker_status import is_worker_active
+        except ImportError:
+            from whatsapp_manager.core.worker_status import is_worker_active
+        if is_worker_active():
+            print("Worker residente ativo; lote delegado / Resident worker active; batch delegated")
+            sys.exit(0)
+
+    runner = SummaryRunner(logger=logger, task_monitor=task_monitor)
+    group_ids = args.group_ids
+    if args.all_enabled or not group_ids:
+        group_ids = group_ids + enabled_group_ids(runner.controller, daily_only=bool(args.task_name))
+
+    batch = SummaryBatch(runner)
+    try:
+        jobs = batch.run(group_ids)
+    finally:
+        batch.close()
+    sys.exit(1 if any(job.status == SummaryJob.STATUS_ERROR for job in jobs) else 0)
+
+
+if __name__ == "__main__":
+    main()
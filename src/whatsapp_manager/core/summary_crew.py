@@ -21,27 +21,45 @@ from crewai import Crew
 from crewai import Process
 from crewai import LLM
 
+# Local application/library imports - try relative first, fallback to absolute
+try:
+    from ..infrastructure.persistence.summary_cache import SummaryCache
+except ImportError:
+    from whatsapp_manager.infrastructure.persistence.summary_cache import SummaryCache
 
 # Define Project Root assuming this file is src/whatsapp_manager/core/summary_crew.py
 # Navigate three levels up to reach the project root from core.
 PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', '..'))
 
 class SummaryCrew:
-    def __init__(self):
+    def __init__(self, cache=None):
         """
         PT-BR:
         Inicializa o gerador de resumos.
         Configura o modelo de linguagem e cria a equipe de agentes.
 
+        Parâmetros:
+            cache: SummaryCache a usar (padrão: data/summary_cache.db, se SUMMARY_CACHE_ENABLED)
+
         EN:
         Initializes the summary generator.
         Sets up the language model and creates the agent crew.
+
+        Parameters:
+            cache: SummaryCache to use (default: data/summary_cache.db, if SUMMARY_CACHE_ENABLED)
         """
         env_path = os.path.join(PROJECT_ROOT, '.env')
         load_dotenv(env_path, override=True) # Explicitly load .env from project root
         self.llm = "gemini/gemini-2.0-flash" # This might need to be an environment variable
         self.create_crew()
 
+        # Cache de resumos por hash do conteúdo / Content-hash summary cache
+        if cache is None and os.getenv("SUMMARY_CACHE_ENABLED", "true").lower() == "true":
+            cache = SummaryCache(
+                os.getenv("SUMMARY_CACHE_PATH", os.path.join(PROJECT_ROOT, "data", "summary_cache.db"))
+            )
+        self.cache = cache
+
     def create_crew(self):
         """
         PT-BR:
@@ -120,13 +138,48 @@ Mensagens para análise / Messages for analysis:
             process=Process.sequential,
         )
 
-    def kickoff(self, inputs):
+        # Chunk Task (map step) / Tarefa de Trecho (etapa de mapeamento)
+        self.chunk_task = Task(
+            description=r"""
+PT-BR:
+As mensagens abaixo são apenas um trecho de uma conversa maior do WhatsApp.
+Extraia notas objetivas que serão combinadas depois com as de outros trechos:
+tópicos discutidos com horário, participantes de cada tópico, dúvidas e quem
+as respondeu, decisões tomadas e todos os links com seu contexto.
+Não escreva introdução nem conclusão.
+
+EN:
+The messages below are only a slice of a larger WhatsApp conversation.
+Extract objective notes that will later be merged with those of other slices:
+topics discussed with their time, participants of each topic, questions and
+who answered them, decisions made and every link with its context.
+Do not write an introduction or a conclusion.
+
+Mensagens do trecho / Slice messages:
+<msgs>
+{msgs}
+</msgs>
+            """,
+            expected_output=(
+                "Notas concisas do trecho, em tópicos, preservando nomes, horários e links. / "
+                "Concise bullet notes for the slice, keeping names, times and links."
+            ),
+            agent=self.agent,
+        )
+        self.chunk_crew = Crew(
+            agents=[self.agent],
+            tasks=[self.chunk_task],
+            process=Process.sequential,
+        )
+
+    def kickoff(self, inputs, cache_inputs=None):
         """
         PT-BR:
         Executa o processo de geração do resumo.
         
         Parâmetros:
             inputs (str): Mensagens do WhatsApp para processar
+            cache_inputs (dict): Conteúdo estável usado na chave do cache (padrão: inputs)
             
         Retorna:
             str: Resumo formatado seguindo o template
@@ -136,14 +189,68 @@ Mensagens para análise / Messages for analysis:
         
         Parameters:
             inputs (str): WhatsApp messages to process
+            cache_inputs (dict): Stable content used for the cache key (default: inputs)
             
         Returns:
             str: Formatted summary following the template
         """
-        result = self.crew.kickoff(inputs=inputs).raw
+        return self._run(self.crew, self.task, inputs, cache_inputs)
+
+    def kickoff_chunk(self, inputs, cache_inputs=None):
+        """
+        PT-BR:
+        Gera notas parciais de um trecho das mensagens (etapa "map" do modo em trechos).
+
+        Parâmetros:
+            inputs (dict): {"msgs": mensagens do trecho}
+            cache_inputs (dict): Conteúdo estável usado na chave do cache (padrão: inputs)
+
+        Retorna:
+            str: Notas do trecho
+
+        EN:
+        Generates partial notes for a slice of the messages (the "map" step of chunked mode).
+
+        Parameters:
+            inputs (dict): {"msgs": slice messages}
+            cache_inputs (dict): Stable content used for the cache key (default: inputs)
+
+        Returns:
+            str: Slice notes
+        """
+        return self._run(self.chunk_crew, self.chunk_task, inputs, cache_inputs)
+
+    def _run(self, crew, task, inputs, cache_inputs=None):
+        cache_key = None
+        if self.cache is not None:
+            # Template e modelo fazem parte da chave: mudar o prompt invalida o cache
+            # Template and model are part of the key: changing the prompt invalidates the cache
+            template = f"{task.description}\n{task.expected_output}"
+            cache_key = self.cache.make_key(cache_inputs if cache_inputs is not None else inputs, template, self.llm)
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                print(f"Resumo obtido do cache / Summary served from cache ({self.cache.hits} hits, {self.cache.misses} misses)")
+                return cached
+
+        result = crew.kickoff(inputs=inputs).raw
         # Remove 'text' do início, se existir
         if result.strip().startswith('text'):
             result = result.strip()[4:].lstrip('\n: ')
+
+        if cache_key is not None:
+            self.cache.put(cache_key, result, self.llm)
         return result
+
+    def cache_stats(self):
+        """
+        PT-BR:
+        Retorna os contadores de acertos/falhas do cache de resumos.
+
+        EN:
+        Returns the summary cache hit/miss counters.
+        """
+        if self.cache is None:
+            return {}
+        return self.cache.stats()
     
 
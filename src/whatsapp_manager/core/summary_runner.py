@@ -0,0 +1,726 @@
+"""
+Executor de Resumos de Grupos / Group Summary Runner
+
+PT-BR:
+Este módulo concentra o fluxo de geração de resumo de um grupo (configuração,
+coleta de mensagens, geração com CrewAI e envio), dividido em etapas. Os objetos
+caros (GroupController, SendSandeco e SummaryCrew) são criados uma única vez e
+reaproveitados entre execuções, o que permite usar o mesmo executor tanto no
+script agendado (summary.py) quanto em processos residentes.
+
+EN:
+This module holds the summary flow for a group (settings, message collection,
+CrewAI generation and delivery), split into stages. Expensive objects
+(GroupController, SendSandeco and SummaryCrew) are created once and reused
+across runs, so the same runner serves both the scheduled script (summary.py)
+and long-running processes.
+"""
+
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+
+# Define Project Root assuming this file is src/whatsapp_manager/core/summary_runner.py
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', '..'))
+
+from .group_controller import GroupController
+from .summary_crew import SummaryCrew
+from .send_sandeco import SendSandeco
+from .prompt_builder import PromptBuilder
+from .message_compactor import MessageCompactor
+from ..infrastructure.persistence.summary_state import SummaryStateStore
+from ..infrastructure.persistence.summary_events import (
+    DESTINATION_GROUP,
+    DESTINATION_PERSONAL,
+    SummaryEventLog,
+)
+
+
+class SummaryJob:
+    """
+    PT-BR:
+    Estado de uma execução de resumo para um grupo.
+
+    EN:
+    State of a summary run for one group.
+    """
+
+    STATUS_PENDING = "pending"
+    STATUS_READY = "ready"
+    STATUS_SUMMARIZED = "summarized"
+    STATUS_SUCCESS = "success"
+    STATUS_SKIPPED = "skipped"
+    STATUS_ERROR = "error"
+
+    def __init__(self, group_id, task_name=None):
+        self.group_id = group_id
+        self.task_name = task_name or f"ResumoGrupo_{group_id}"
+        self.name = None
+        self.config = None
+        self.start_date = None
+        self.end_date = None
+        self.window_id = None
+        self.messages = []
+        self.entries = []
+        self.chunks = 0
+        self.previous_summary = None
+        self.new_messages = []
+        self.covered_from = None
+        self.compaction = {}
+        self.prompt = None
+        self.summary = None
+        self.destinations = []
+        self.status = self.STATUS_PENDING
+        self.reason = None
+        self.started_at = datetime.now()
+        self.llm_seconds = None
+
+    @property
+    def done(self):
+        return self.status in (self.STATUS_SUCCESS, self.STATUS_SKIPPED, self.STATUS_ERROR)
+
+    def __repr__(self):
+        return f"SummaryJob(group_id={self.group_id}, status={self.status}, messages={len(self.messages)})"
+
+
+class SummaryRunner:
+    """
+    PT-BR:
+    Executa resumos de grupos reaproveitando as conexões e o modelo já carregados.
+
+    EN:
+    Runs group summaries reusing already loaded connections and model.
+    """
+
+    DATE_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+    def __init__(self, logger=None, task_monitor=None, controller=None, sender=None, summary_state=None,
+                 event_log=None):
+        """
+        PT-BR:
+        Inicializa o executor.
+
+        Parâmetros:
+            logger: WhatsAppLogger opcional (sem ele, usa print)
+            task_monitor: TaskExecutionMonitor opcional
+            controller: GroupController já criado (opcional)
+            sender: SendSandeco já criado (opcional)
+            summary_state: SummaryStateStore dos resumos contínuos (opcional)
+            event_log: SummaryEventLog que recebe um evento por execução (opcional)
+
+        EN:
+        Initializes the runner.
+
+        Parameters:
+            logger: Optional WhatsAppLogger (falls back to print)
+            task_monitor: Optional TaskExecutionMonitor
+            controller: Already created GroupController (optional)
+            sender: Already created SendSandeco (optional)
+            summary_state: Rolling summary SummaryStateStore (optional)
+            event_log: SummaryEventLog receiving one event per run (optional)
+        """
+        self.logger = logger
+        self.task_monitor = task_monitor
+
+        # Get WhatsApp number from environment / Obtém número do WhatsApp do ambiente
+        personal_number = os.getenv("WHATSAPP_NUMBER")
+        if personal_number:
+            # Garante que o número está no formato correto
+            personal_number = personal_number.strip()
+            if not personal_number.endswith('@s.whatsapp'):
+                personal_number = f"{personal_number}@s.whatsapp"
+        self.personal_number = personal_number
+
+        self._log("info", f"\nConfigurações carregadas:\nNúmero do WhatsApp: {personal_number}\nBase URL: {os.getenv('EVO_BASE_URL')}\nInstance Name: {os.getenv('EVO_INSTANCE_NAME')}")
+
+        self.sender = sender or SendSandeco()
+        self.controller = controller or GroupController()
+        self.crew_factory = SummaryCrew
+        self.prompt_builder = PromptBuilder()
+        self._summary_crew = None
+        self._chunk_crews = []
+        # Protege group_summary.csv, a lista de grupos e o log quando o executor é usado por várias threads
+        # Guards group_summary.csv, the group list and the log when the runner is shared across threads
+        self._lock = threading.Lock()
+        # Limite único de chamadas simultâneas ao LLM, compartilhado por prompts inteiros e trechos
+        # Single limit on concurrent LLM calls, shared by whole prompts and chunks
+        self.llm_slots = threading.BoundedSemaphore(int(os.getenv("SUMMARY_LLM_CONCURRENCY", "3")))
+        self.event_log = event_log or SummaryEventLog(
+            os.getenv("SUMMARY_EVENTS_PATH", os.path.join(PROJECT_ROOT, "data", "summary_events.jsonl"))
+        )
+        self.summary_state = summary_state or SummaryStateStore(
+            os.getenv("SUMMARY_STATE_PATH", os.path.join(PROJECT_ROOT, "data", "summary_state.db"))
+        )
+
+    def _log(self, level, message, exc_info=False):
+        if self.logger:
+            if level in ("error", "critical"):
+                getattr(self.logger, level)(message, exc_info=exc_info)
+            else:
+                getattr(self.logger, level)(message)
+        else:
+            print(message)
+
+    @property
+    def summary_crew(self):
+        """
+        PT-BR:
+        SummaryCrew criado no primeiro uso e reaproveitado depois.
+
+        EN:
+        SummaryCrew created on first use and reused afterwards.
+        """
+        if self._summary_crew is None:
+            self._summary_crew = self.crew_factory()
+        return self._summary_crew
+
+    def _record_event(self, job):
+        """
+        PT-BR:
+        Grava o evento estruturado da execução (nunca interrompe o resumo).
+
+        EN:
+        Writes the run's structured event (never interrupts the summary).
+        """
+        def iso(value):
+            return value.isoformat() if isinstance(value, datetime) else value
+
+        try:
+            self.event_log.append({
+                "event": "summary_run",
+                "status": job.status,
+                "group_id": job.group_id,
+                "name": job.name,
+                "task_name": job.task_name,
+                "started_at": iso(job.started_at),
+                "finished_at": datetime.now().isoformat(),
+                "window_start": iso(job.start_date),
+                "window_end": iso(job.end_date),
+                "destinations": list(job.destinations),
+                "message_count": len(job.messages),
+                "prompt_tokens": self.estimate_tokens(job.prompt) if job.prompt else None,
+                "summary_tokens": self.estimate_tokens(job.summary) if job.summary else None,
+                "llm_seconds": round(job.llm_seconds, 3) if job.llm_seconds is not None else None,
+                "reason": job.reason,
+            })
+        except Exception as e:
+            self._log("warning", f"Erro ao gravar evento do resumo: {e}")
+
+    def _skip(self, job, reason):
+        job.status = SummaryJob.STATUS_SKIPPED
+        job.reason = reason
+        self._log("info", reason)
+        if self.task_monitor:
+            self.task_monitor.log_task_skipped(job.task_name, job.group_id, reason)
+        self._record_event(job)
+        return job
+
+    def _fail(self, job, reason, exc_info=False):
+        job.status = SummaryJob.STATUS_ERROR
+        job.reason = reason
+        self._log("error", reason, exc_info=exc_info)
+        if self.task_monitor:
+            self.task_monitor.log_task_error(job.task_name, job.group_id, reason)
+        self._record_event(job)
+        return job
+
+    def _find_group(self, group_id):
+        with self._lock:
+            # Lê só o grupo necessário (memória, índice local ou API)
+            # Reads only the needed group (memory, local index or API)
+            group = self.controller.get_group(group_id)
+            if group is None:
+                # Último recurso: lista completa atualizada / Last resort: full refreshed list
+                self.controller.fetch_groups()
+                group = self.controller.find_group_by_id(group_id)
+            return group
+
+    def resolve_window(self, config):
+        """
+        PT-BR:
+        Calcula o período de coleta: datas configuradas ou últimas 24 horas.
+
+        Retorna:
+            tuple: (data inicial, data final, descrição)
+
+        EN:
+        Computes the collection period: configured dates or the last 24 hours.
+
+        Returns:
+            tuple: (start date, end date, description)
+        """
+        start_date = config.get('start_date')
+        start_time = config.get('start_time')
+        end_date = config.get('end_date')
+        end_time = config.get('end_time')
+
+        # Se todos os campos de data/hora estiverem presentes e válidos, usa-os
+        if self._configured_window(config):
+            data_anterior_formatada = f"{start_date} {start_time}"
+            data_atual_formatada = f"{end_date} {end_time}"
+            time_info = f"Data inicial configurada: {data_anterior_formatada}\nData final configurada: {data_atual_formatada}"
+        else:
+            # fallback: últimas 24h
+            data_atual = datetime.now()
+            data_anterior = data_atual - timedelta(days=1)
+            data_atual_formatada = data_atual.strftime(self.DATE_FORMAT)
+            data_anterior_formatada = data_anterior.strftime(self.DATE_FORMAT)
+            time_info = f"Data atual: {data_atual_formatada}\nData de 1 dia anterior: {data_anterior_formatada}"
+        return data_anterior_formatada, data_atual_formatada, time_info
+
+    @staticmethod
+    def _configured_window(config):
+        values = [config.get(key) for key in ('start_date', 'start_time', 'end_date', 'end_time')]
+        return all(value and str(value) != 'nan' for value in values)
+
+    def resolve_window_id(self, config, start_date, end_date):
+        """
+        PT-BR:
+        Identificador estável da janela, usado na chave do cache de resumos.
+        Janelas configuradas usam as próprias datas; a janela padrão (últimas
+        24 horas, calculada a partir de now()) usa o dia e o horário agendado,
+        para que uma nova tentativa no mesmo dia reaproveite o resumo.
+
+        EN:
+        Stable window identifier, used in the summary cache key.
+        Configured windows use their own dates; the default window (last 24
+        hours, computed from now()) uses the day and the scheduled slot, so a
+        retry on the same day reuses the summary.
+        """
+        if self._configured_window(config):
+            return f"{start_date}/{end_date}"
+        return f"{str(end_date)[:10]}@{config.get('horario')}"
+
+    def _cache_inputs(self, job, content):
+        return {
+            "group_id": job.group_id,
+            "window": job.window_id or f"{job.start_date}/{job.end_date}",
+            "previous_summary": job.previous_summary,
+            "msgs": content,
+        }
+
+    @staticmethod
+    def estimate_tokens(text):
+        """
+        PT-BR:
+        Estimativa aproximada de tokens do prompt.
+
+        EN:
+        Rough prompt token estimate.
+        """
+        return PromptBuilder.estimate_tokens(text)
+
+    def _prompt_header(self, job, title=PromptBuilder.MESSAGES_TITLE):
+        return self.prompt_builder.header(job.start_date, job.end_date, title)
+
+    def format_message(self, msg):
+        """
+        PT-BR:
+        Formata uma mensagem para o prompt.
+
+        EN:
+        Formats one message for the prompt.
+        """
+        return self.prompt_builder.format_message(msg)
+
+    def build_prompt(self, job):
+        """
+        PT-BR:
+        Formata as mensagens do período para o CrewAI, em ordem cronológica.
+        As entradas individuais ficam em job.entries para o modo em trechos.
+        Em resumos contínuos, envia o resumo anterior e apenas as mensagens novas.
+
+        EN:
+        Formats the period messages for CrewAI, in chronological order.
+        Individual entries are kept in job.entries for chunked mode.
+        For rolling summaries, sends the previous summary and only the new messages.
+        """
+        messages = job.messages if job.previous_summary is None else job.new_messages
+        messages = self.compact_messages(job, list(reversed(messages)))
+        job.entries = list(self.prompt_builder.entries(messages))
+        if job.previous_summary is None:
+            return self._prompt_header(job) + "".join(job.entries)
+        return self._rolling_prompt(job, "".join(job.entries))
+
+    def compact_messages(self, job, messages):
+        """
+        PT-BR:
+        Etapa de compactação antes do LLM (desativada com SUMMARY_COMPACTION=false).
+        As estatísticas ficam em job.compaction.
+
+        EN:
+        Compaction stage before the LLM (disabled with SUMMARY_COMPACTION=false).
+        Statistics are kept in job.compaction.
+        """
+        if os.getenv("SUMMARY_COMPACTION", "true").lower() != "true":
+            return messages
+        compactor = MessageCompactor.from_env()
+        compacted = compactor.compact(messages)
+        job.compaction = compactor.stats
+        self._log("info", (
+            f"Compactação: {job.compaction['messages_in']} → {job.compaction['messages_out']} mensagens, "
+            f"~{job.compaction['tokens_saved']} tokens economizados / Compaction: ~{job.compaction['tokens_saved']} tokens saved"
+        ))
+        return compacted
+
+    def _rolling_prompt(self, job, new_content, title="NEW MESSAGES / MENSAGENS NOVAS"):
+        return "".join((
+            self._prompt_header(job, "PREVIOUS SUMMARY / RESUMO ANTERIOR"),
+            "Atualize o resumo anterior com o conteúdo novo abaixo e descarte assuntos anteriores à Data Inicial.\n",
+            "Update the previous summary with the new content below and drop topics older than the Initial Date.\n\n",
+            job.previous_summary.strip(),
+            f"\n\n{title}:\n--------------------------\n",
+            new_content,
+        ))
+
+    @staticmethod
+    def rolling_enabled(config):
+        """
+        PT-BR:
+        Indica se o grupo usa resumos contínuos (coluna rolling do
+        group_summary.csv, padrão SUMMARY_ROLLING).
+
+        EN:
+        Tells whether the group uses rolling summaries (rolling column of
+        group_summary.csv, default SUMMARY_ROLLING).
+        """
+        value = (config or {}).get('rolling')
+        if value is None or str(value) in ('nan', ''):
+            value = os.getenv("SUMMARY_ROLLING", "false")
+        return str(value).strip().lower() in ('true', '1', 'yes')
+
+    def apply_rolling_state(self, job):
+        """
+        PT-BR:
+        Carrega o resumo anterior do grupo e separa as mensagens novas.
+        O resumo anterior só é reaproveitado se ainda cobrir parte do período
+        e tiver começado há no máximo SUMMARY_ROLLING_MAX_SPAN_HOURS (padrão 48)
+        antes do início atual; caso contrário o resumo é refeito do zero.
+
+        EN:
+        Loads the group's previous summary and separates the new messages.
+        The previous summary is only reused if it still covers part of the
+        period and started at most SUMMARY_ROLLING_MAX_SPAN_HOURS (default 48)
+        before the current start; otherwise the summary is rebuilt from scratch.
+        """
+        _, _, ts_start, _ = self.controller._message_window(job.start_date, job.end_date)
+        job.covered_from = ts_start
+        state = self.summary_state.get(job.group_id)
+        if not state:
+            return job
+        max_span = float(os.getenv("SUMMARY_ROLLING_MAX_SPAN_HOURS", "48")) * 3600
+        if state["last_timestamp"] < ts_start or ts_start - state["covered_from"] > max_span:
+            self._log("info", "Resumo anterior fora do período; gerando resumo completo / Previous summary out of range; running a full summary")
+            return job
+        job.previous_summary = state["summary"]
+        job.covered_from = max(state["covered_from"], ts_start - int(max_span))
+        # Mensagens no mesmo segundo do último resumo que chegaram depois dele também são novas
+        # Messages in the last summary's second that arrived after it are new as well
+        seen = set(state["last_ids"])
+        job.new_messages = [msg for msg in job.messages
+                            if msg.message_timestamp > state["last_timestamp"]
+                            or (msg.message_timestamp == state["last_timestamp"] and msg.message_id not in seen)]
+        self._log("info", f"Resumo contínuo: {len(job.new_messages)} mensagens novas desde o último resumo / Rolling summary: {len(job.new_messages)} new messages")
+        return job
+
+    @staticmethod
+    def chunk_settings(config):
+        """
+        PT-BR:
+        Lê do group_summary.csv o orçamento de tokens por trecho (chunk_tokens;
+        0 desativa) e o paralelismo (chunk_parallelism), com padrões do ambiente.
+
+        EN:
+        Reads the per-chunk token budget (chunk_tokens; 0 disables) and the
+        parallelism (chunk_parallelism) from group_summary.csv, with
+        environment defaults.
+        """
+        def setting(key, env_key, default):
+            value = (config or {}).get(key)
+            try:
+                if value is not None and str(value) != 'nan' and str(value) != '':
+                    return int(float(value))
+            except ValueError:
+                pass
+            return int(os.getenv(env_key, default))
+
+        chunk_tokens = setting('chunk_tokens', "SUMMARY_CHUNK_TOKENS", "100000")
+        parallelism = max(1, setting('chunk_parallelism', "SUMMARY_CHUNK_PARALLELISM", "3"))
+        return chunk_tokens, parallelism
+
+    def split_chunks(self, entries, max_tokens):
+        """
+        PT-BR:
+        Divide as entradas em trechos consecutivos que cabem no orçamento de tokens.
+
+        EN:
+        Splits entries into consecutive chunks that fit the token budget.
+        """
+        chunks = []
+        current = []
+        current_tokens = 0
+        for entry in entries:
+            tokens = self.estimate_tokens(entry)
+            if current and current_tokens + tokens > max_tokens:
+                chunks.append(current)
+                current = []
+                current_tokens = 0
+            current.append(entry)
+            current_tokens += tokens
+        if current:
+            chunks.append(current)
+        return chunks
+
+    def _kickoff(self, method, prompt, cache_inputs=None):
+        # Cada chamada ao LLM ocupa uma vaga de llm_slots / Each LLM call takes one llm_slots slot
+        with self.llm_slots:
+            return method(inputs={"msgs": prompt}, cache_inputs=cache_inputs)
+
+    def _borrow_crew(self):
+        with self._lock:
+            if self._chunk_crews:
+                return self._chunk_crews.pop()
+        return self.crew_factory()
+
+    def _map_chunk(self, job, chunk):
+        crew = self._borrow_crew()
+        try:
+            content = "".join(chunk)
+            return self._kickoff(crew.kickoff_chunk, self._prompt_header(job) + content, self._cache_inputs(job, content))
+        finally:
+            with self._lock:
+                self._chunk_crews.append(crew)
+
+    def summarize_chunked(self, job, crew, chunk_tokens, parallelism):
+        """
+        PT-BR:
+        Modo em trechos (map-reduce): resume os trechos em paralelo e combina as
+        notas com o template original. Se as notas ainda excederem o orçamento,
+        elas são resumidas de novo em trechos. As chamadas dos trechos dividem
+        llm_slots com as demais chamadas ao LLM, então o paralelismo nunca passa desse limite.
+
+        EN:
+        Chunked (map-reduce) mode: summarizes chunks in parallel and merges the
+        notes with the original template. If the notes still exceed the budget,
+        they are chunked and summarized again. Chunk calls share llm_slots with
+        every other LLM call, so parallelism never exceeds that limit.
+        """
+        parts = job.entries
+        for _ in range(3):
+            chunks = self.split_chunks(parts, chunk_tokens)
+            job.chunks += len(chunks)
+            self._log("info", f"Resumo em {len(chunks)} trechos (paralelismo {parallelism}) / Summarizing in {len(chunks)} chunks")
+            with ThreadPoolExecutor(min(parallelism, len(chunks)), thread_name_prefix="summary-chunk") as pool:
+                notes = list(pool.map(lambda chunk: self._map_chunk(job, chunk), chunks))
+            parts = [f"Parte / Part {i}/{len(notes)}:\n{note.strip()}\n\n" for i, note in enumerate(notes, 1)]
+            title = "PARTIAL NOTES FOR SUMMARY / NOTAS PARCIAIS PARA O RESUMO"
+            if job.previous_summary is None:
+                reduce_prompt = self._prompt_header(job, title) + "".join(parts)
+            else:
+                reduce_prompt = self._rolling_prompt(job, "".join(parts), title)
+            if len(chunks) == 1 or self.estimate_tokens(reduce_prompt) <= chunk_tokens:
+                break
+        return self._kickoff(crew.kickoff, reduce_prompt, self._cache_inputs(job, "".join(parts)))
+
+    def prepare(self, group_id, task_name=None):
+        """
+        PT-BR:
+        Etapa 1: carrega configuração, coleta as mensagens e monta o prompt.
+
+        Retorna:
+            SummaryJob: status READY, SKIPPED ou ERROR
+
+        EN:
+        Stage 1: loads settings, collects messages and builds the prompt.
+
+        Returns:
+            SummaryJob: status READY, SKIPPED or ERROR
+        """
+        job = SummaryJob(group_id, task_name)
+        self._log("info", f"EXECUTANDO TAREFA AGENDADA - Task: {job.task_name}, Group ID: {group_id}")
+        if self.task_monitor:
+            self.task_monitor.log_task_start(job.task_name, group_id)
+
+        config = self.controller.load_data_by_group(group_id)
+        group = self._find_group(group_id)
+        if group is None:
+            return self._fail(job, f"Group with ID {group_id} not found.")
+        job.name = group.name
+        self._log("info", f"Resumo do grupo : {job.name}")
+
+        # Ensure group summary information is present in group_summary.csv
+        # Garante que as informações do resumo do grupo estejam no arquivo group_summary.csv
+        if not config:
+            self._log("warning", "Dados do grupo não encontrados, criando configuração padrão")
+            with self._lock:
+                self.controller.update_summary(group_id, '22:00', True, False, False, os.path.join(os.path.dirname(__file__), "summary.py"))
+                config = self.controller.load_data_by_group(group_id)
+        job.config = config
+
+        if not (config and config.get('enabled', False)):
+            return self._skip(job, "Grupo não encontrado ou resumo não está habilitado para este grupo. / Group not found or summary is not enabled for this group.")
+
+        job.start_date, job.end_date, time_info = self.resolve_window(config)
+        job.window_id = self.resolve_window_id(config, job.start_date, job.end_date)
+        self._log("info", time_info)
+
+        # Recupera mensagens para o período especificado
+        try:
+            # Verificação opcional de sincronização: só espera se a API ainda estiver recebendo mensagens
+            # Optional sync check: only waits while the API is still receiving messages
+            if os.getenv("SUMMARY_SYNC_CHECK", "false").lower() == "true":
+                self.controller.wait_for_sync(group_id, job.end_date)
+            job.messages = self.controller.get_messages(group_id, job.start_date, job.end_date)
+            self._log("info", f"Mensagens recuperadas com sucesso: {len(job.messages)} mensagens")
+        except Exception as e:
+            return self._fail(job, f"Erro ao recuperar mensagens: {str(e)}", exc_info=True)
+
+        cont = len(job.messages)
+        self._log("info", f"Total de mensagens: {cont}")
+
+        # Carrega o valor de min_messages_summary do group_summary.csv
+        min_messages_config = config.get('min_messages_summary', 50)  # Default para 50 se não encontrado
+
+        # Verifica se o total de mensagens é superior ao configurado
+        if cont <= min_messages_config:
+            return self._skip(job, f"O número de mensagens ({cont}) é inferior ou igual ao configurado ({min_messages_config}). O resumo não será gerado.")
+
+        # Resumo contínuo: reaproveita o último resumo e envia só as mensagens novas
+        # Rolling summary: reuse the last summary and send only the new messages
+        if self.rolling_enabled(config):
+            self.apply_rolling_state(job)
+
+        # Message data formatting for CrewAI / Formatação dos dados para o CrewAI
+        job.prompt = self.build_prompt(job)
+        self._log("info", f"Prompt: {len(job.entries)} mensagens, ~{self.estimate_tokens(job.prompt)} tokens estimados / estimated tokens")
+        if self.logger:
+            self.logger.debug(f"Mensagens formatadas para CrewAI: {job.prompt[:500]}...")  # Log apenas primeiros 500 chars
+        else:
+            print(job.prompt)
+
+        job.status = SummaryJob.STATUS_READY
+        return job
+
+    def summarize(self, job, summary_crew=None):
+        """
+        PT-BR:
+        Etapa 2: gera o resumo com CrewAI.
+
+        Parâmetros:
+            job: SummaryJob com status READY
+            summary_crew: SummaryCrew a usar (padrão: o do executor)
+
+        EN:
+        Stage 2: generates the summary with CrewAI.
+
+        Parameters:
+            job: SummaryJob with READY status
+            summary_crew: SummaryCrew to use (default: the runner's)
+        """
+        if job.status != SummaryJob.STATUS_READY:
+            return job
+        try:
+            self._log("info", "Iniciando geração de resumo com CrewAI...")
+            crew = summary_crew or self.summary_crew
+            llm_started = time.perf_counter()
+            chunk_tokens, parallelism = self.chunk_settings(job.config)
+            if job.previous_summary is not None and not job.new_messages:
+                self._log("info", "Sem mensagens novas; reaproveitando o resumo anterior / No new messages; reusing the previous summary")
+                job.summary = job.previous_summary
+            elif chunk_tokens > 0 and job.entries and self.estimate_tokens(job.prompt) > chunk_tokens:
+                job.summary = self.summarize_chunked(job, crew, chunk_tokens, parallelism)
+            else:
+                job.summary = self._kickoff(crew.kickoff, job.prompt, self._cache_inputs(job, "".join(job.entries)))
+            job.llm_seconds = time.perf_counter() - llm_started
+            self._log("info", "Resumo gerado com sucesso")
+            if self.logger:
+                self.logger.debug(f"Resumo gerado: {job.summary[:200]}...")  # Log apenas primeiros 200 chars
+        except Exception as e:
+            return self._fail(job, f"Erro ao gerar resumo com CrewAI: {str(e)}", exc_info=True)
+        job.status = SummaryJob.STATUS_SUMMARIZED
+        return job
+
+    def deliver(self, job):
+        """
+        PT-BR:
+        Etapa 3: envia o resumo para os destinos configurados e registra o resultado.
+
+        EN:
+        Stage 3: sends the summary to the configured destinations and records the result.
+        """
+        if job.status != SummaryJob.STATUS_SUMMARIZED:
+            return job
+
+        # Send summary based on configuration / Envia resumo com base na configuração
+        if job.config.get('send_to_group', True):
+            try:
+                self.sender.textMessage(job.group_id, job.summary)
+                job.destinations.append(DESTINATION_GROUP)
+                self._log("info", f"Resumo enviado para o grupo: {job.name}")
+            except Exception as e:
+                self._log("error", f"Erro ao enviar resumo para o grupo: {str(e)}", exc_info=True)
+
+        # Envia para o número pessoal se estiver definido
+        if self.personal_number:
+            try:
+                mensagem = f"Resumo do grupo {job.name}:\n\n{job.summary}"
+                self.sender.textMessage(self.personal_number, mensagem)
+                job.destinations.append(DESTINATION_PERSONAL)
+                self._log("info", f"Resumo enviado para número pessoal: {self.personal_number}")
+            except Exception as e:
+                self._log("error", f"Erro ao enviar para número pessoal: {str(e)}", exc_info=True)
+
+        # Success logging / Registro de sucesso
+        if job.destinations:
+            labels = {DESTINATION_GROUP: "grupo", DESTINATION_PERSONAL: "número pessoal"}
+            destinations_str = " e ".join(labels[destination] for destination in job.destinations)
+            success_msg = f"Resumo gerado e enviado com sucesso para {destinations_str}!"
+            self._log("info", success_msg)
+            if self.task_monitor:
+                self.task_monitor.log_task_success(job.task_name, job.group_id, len(job.messages))
+            job.status = SummaryJob.STATUS_SUCCESS
+            self._save_rolling_state(job)
+            self._record_event(job)
+            return job
+
+        return self._fail(job, "Falha ao enviar resumo para qualquer destino")
+
+    def _save_rolling_state(self, job):
+        """
+        PT-BR:
+        Grava o estado do resumo contínuo só depois de uma entrega bem-sucedida,
+        para que uma falha no envio não faça as mensagens serem puladas.
+
+        EN:
+        Stores the rolling summary state only after a successful delivery, so a
+        failed send never makes the messages be skipped.
+        """
+        if not self.rolling_enabled(job.config) or not job.messages:
+            return
+        try:
+            last_timestamp = max(msg.message_timestamp for msg in job.messages)
+            last_ids = [msg.message_id for msg in job.messages if msg.message_timestamp == last_timestamp]
+            self.summary_state.save(job.group_id, job.summary, job.covered_from, last_timestamp, last_ids)
+        except Exception as e:
+            self._log("warning", f"Erro ao gravar estado do resumo contínuo: {e}")
+
+    def run(self, group_id, task_name=None):
+        """
+        PT-BR:
+        Executa as três etapas em sequência para um grupo.
+
+        Retorna:
+            SummaryJob: Resultado da execução
+
+        EN:
+        Runs the three stages in sequence for one group.
+
+        Returns:
+            SummaryJob: Run result
+        """
+        job = self.prepare(group_id, task_name)
+        self.summarize(job)
+        self.deliver(job)
+        return job
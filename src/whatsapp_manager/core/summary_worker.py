@@ -0,0 +1,345 @@
+"""
+Worker Residente de Resumos / Resident Summary Worker
+
+PT-BR:
+Processo de longa duração, executado pelo supervisord ao lado do Streamlit,
+que mantém carregados o GroupController, o SendSandeco e o SummaryCrew e
+executa os resumos diários no horário configurado em group_summary.csv.
+Os horários ficam em um heap em memória (DailyScheduler): o laço dorme até o
+próximo disparo e entrega os grupos devidos a um pool de threads, sem
+depender de uma entrada de cron nem de um novo processo Python por grupo.
+
+EN:
+Long-running process, run by supervisord next to Streamlit, that keeps
+GroupController, SendSandeco and SummaryCrew loaded and runs daily summaries
+at the time configured in group_summary.csv. Slots live in an in-memory heap
+(DailyScheduler): the loop sleeps until the next firing and hands due groups
+to a thread pool, without one cron entry or one new Python process per group.
+"""
+
+import argparse
+import json
+import os
+import signal
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+
+# Define Project Root assuming this file is src/whatsapp_manager/core/summary_worker.py
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', '..'))
+
+# Add src directory to Python path to enable absolute imports when running as script
+src_path = os.path.join(PROJECT_ROOT, 'src')
+if src_path not in sys.path:
+    sys.path.insert(0, src_path)
+
+from dotenv import load_dotenv
+
+# Local application/library imports - try relative first, fallback to absolute
+try:
+    from .summary_runner import SummaryRunner, SummaryJob
+    from .summary_batch import SummaryBatch
+    from .scheduler_engine import DailyScheduler
+    from .worker_status import HEARTBEAT_FILE, is_worker_active, is_daily_config
+except ImportError:
+    from whatsapp_manager.core.summary_runner import SummaryRunner, SummaryJob
+    from whatsapp_manager.core.summary_batch import SummaryBatch
+    from whatsapp_manager.core.scheduler_engine import DailyScheduler
+    from whatsapp_manager.core.worker_status import HEARTBEAT_FILE, is_worker_active, is_daily_config
+
+STATE_FILE = os.path.join(PROJECT_ROOT, "data", "summary_worker_state.json")
+
+
+class SummaryWorker:
+    """
+    PT-BR:
+    Executa os resumos diários devidos a partir de um agendamento interno.
+
+    EN:
+    Runs due daily summaries from an internal schedule.
+    """
+
+    def __init__(self, runner=None, poll_interval=None, catchup_minutes=None, batch=None,
+                 spread_seconds=None, jitter_seconds=None, dispatch_workers=None, retry_seconds=None):
+        """
+        PT-BR:
+        Inicializa o worker.
+
+        Parâmetros:
+            runner: SummaryRunner já criado (opcional)
+            poll_interval: Segundos máximos entre heartbeats/recargas (padrão: 30)
+            catchup_minutes: Atraso máximo tolerado para um horário perdido (padrão: 15)
+            batch: SummaryBatch usado para executar os grupos devidos (opcional)
+            spread_seconds: Janela para espalhar grupos com o mesmo horário (padrão: 0)
+            jitter_seconds: Atraso aleatório máximo por disparo (padrão: 0)
+            dispatch_workers: Lotes executados em paralelo pelo pool (padrão: 2)
+            retry_seconds: Espera antes de repetir um grupo que falhou, dentro da tolerância (padrão: 300)
+
+        EN:
+        Initializes the worker.
+
+        Parameters:
+            runner: Already created SummaryRunner (optional)
+            poll_interval: Maximum seconds between heartbeats/reloads (default: 30)
+            catchup_minutes: Maximum tolerated delay for a missed slot (default: 15)
+            batch: SummaryBatch used to run due groups (optional)
+            spread_seconds: Window to spread groups sharing a slot (default: 0)
+            jitter_seconds: Maximum random delay per firing (default: 0)
+            dispatch_workers: Batches run in parallel by the pool (default: 2)
+            retry_seconds: Wait before retrying a failed group, within the catch-up window (default: 300)
+        """
+        if runner is None:
+            try:
+                from whatsapp_manager.utils.logger import get_logger, TaskExecutionMonitor
+                logger = get_logger("summary_worker", os.getenv("LOG_LEVEL", "INFO"))
+                task_monitor = TaskExecutionMonitor()
+            except ImportError:
+                logger = None
+                task_monitor = None
+            runner = SummaryRunner(logger=logger, task_monitor=task_monitor)
+        self.runner = runner
+        self.batch = batch or SummaryBatch(runner)
+        self.poll_interval = poll_interval or int(os.getenv("SUMMARY_WORKER_POLL_INTERVAL", "30"))
+        self.catchup = timedelta(minutes=catchup_minutes if catchup_minutes is not None
+                                 else int(os.getenv("SUMMARY_WORKER_CATCHUP_MINUTES", "15")))
+        if spread_seconds is None:
+            spread_seconds = int(os.getenv("SUMMARY_WORKER_SPREAD_SECONDS", "0"))
+        if jitter_seconds is None:
+            jitter_seconds = int(os.getenv("SUMMARY_WORKER_JITTER_SECONDS", "0"))
+        self.engine = DailyScheduler(self.catchup, spread_seconds, jitter_seconds)
+        self.dispatch_workers = dispatch_workers or int(os.getenv("SUMMARY_WORKER_DISPATCH_WORKERS", "2"))
+        self.retry_delay = timedelta(seconds=retry_seconds if retry_seconds is not None
+                                     else int(os.getenv("SUMMARY_WORKER_RETRY_SECONDS", "300")))
+        self._executor = None
+        self.schedule = {}
+        self.last_runs = self._load_state()
+        # Em execução: {group_id: horário previsto}; a repetir: {group_id: (previsto, repetir_em)}
+        # Running: {group_id: scheduled datetime}; to retry: {group_id: (scheduled, retry_at)}
+        self._running = {}
+        self._retries = {}
+        self._runs_lock = threading.Lock()
+        self._settings_revision = None
+        self._stop = threading.Event()
+
+    def _log(self, message):
+        self.runner._log("info", message)
+
+    def _load_state(self):
+        try:
+            with open(STATE_FILE, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _save_state(self):
+        tmp_path = f"{STATE_FILE}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(self.last_runs, f)
+        os.replace(tmp_path, STATE_FILE)
+
+    def _heartbeat(self):
+        with open(HEARTBEAT_FILE, 'w', encoding='utf-8') as f:
+            f.write(datetime.now().isoformat())
+
+    def reload_schedule(self, force=False):
+        """
+        PT-BR:
+        Recarrega o agendamento quando as configurações de resumo forem alteradas.
+
+        EN:
+        Reloads the schedule when the summary settings change.
+        """
+        revision = self.runner.controller.settings_revision()
+        if not force and revision == self._settings_revision:
+            return False
+        self._settings_revision = revision
+
+        schedule = {}
+        summary_data = self.runner.controller.load_summary_info()
+        for config in summary_data.to_dict('records'):
+            group_id = config.get('group_id')
+            horario = config.get('horario')
+            if not group_id or not config.get('enabled', False) or not is_daily_config(config):
+                continue
+            try:
+                schedule[group_id] = datetime.strptime(str(horario), "%H:%M").time()
+            except ValueError:
+                self.runner._log("warning", f"Horário inválido para {group_id}: {horario}")
+        self.schedule = schedule
+        self.engine.load(schedule)
+        self._log(f"Agendamento carregado: {len(schedule)} grupos / Schedule loaded: {len(schedule)} groups")
+        return True
+
+    def due_groups(self, now=None):
+        """
+        PT-BR:
+        Lista os grupos cujo horário de hoje já chegou e que ainda não rodaram hoje.
+
+        EN:
+        Lists groups whose slot for today has arrived and that have not run today.
+        """
+        now = now or datetime.now()
+        return [group_id for group_id, when in self.engine.peek_due(now)
+                if self.last_runs.get(group_id) != when.date().isoformat()]
+
+    def _take_due(self, now):
+        """
+        PT-BR:
+        Retira do agendamento os grupos devidos e as falhas prontas para nova
+        tentativa. O dia só é gravado em last_runs depois da execução (_finish).
+
+        EN:
+        Takes due groups and failures ready for another attempt off the
+        schedule. The day is only written to last_runs after the run (_finish).
+        """
+        due, missed = self.engine.pop_due(now)
+        for group_id, when in missed:
+            self.runner._log("warning", f"Horário perdido para {group_id}: {when:%Y-%m-%d %H:%M}")
+        groups = []
+        with self._runs_lock:
+            retries = [(group_id, when) for group_id, (when, retry_at) in self._retries.items() if retry_at <= now]
+            self._retries = {group_id: entry for group_id, entry in self._retries.items()
+                             if now <= entry[0] + self.catchup}
+            for group_id, when in due + retries:
+                if now > when + self.catchup:
+                    continue
+                if self.last_runs.get(group_id) == when.date().isoformat() or group_id in self._running:
+                    continue
+                self._retries.pop(group_id, None)
+                self._running[group_id] = when
+                groups.append(group_id)
+        return groups
+
+    def _finish(self, group_ids, jobs, now=None):
+        """
+        PT-BR:
+        Registra o resultado de um lote: grupos concluídos (ou pulados) marcam o
+        dia em last_runs; os que falharam voltam a ser tentados após retry_delay,
+        enquanto o horário ainda estiver dentro da tolerância.
+
+        EN:
+        Records a batch outcome: finished (or skipped) groups mark the day in
+        last_runs; failed ones are retried after retry_delay while the slot is
+        still within the catch-up window.
+        """
+        now = now or datetime.now()
+        statuses = {job.group_id: job.status for job in jobs}
+        done = (SummaryJob.STATUS_SUCCESS, SummaryJob.STATUS_SKIPPED)
+        with self._runs_lock:
+            changed = False
+            for group_id in group_ids:
+                when = self._running.pop(group_id, None)
+                if when is None:
+                    continue
+                if statuses.get(group_id) in done:
+                    self.last_runs[group_id] = when.date().isoformat()
+                    changed = True
+                elif now + self.retry_delay <= when + self.catchup:
+                    self._retries[group_id] = (when, now + self.retry_delay)
+                    self.runner._log("warning", f"Resumo falhou para {group_id}; nova tentativa em "
+                                                f"{self.retry_delay.total_seconds():.0f}s")
+            if changed:
+                self._save_state()
+
+    def _run_batch(self, group_ids, now=None):
+        jobs = []
+        try:
+            jobs = self.batch.run(group_ids)
+        finally:
+            self._finish(group_ids, jobs, now)
+        return jobs
+
+    def run_due(self, now=None):
+        """
+        PT-BR:
+        Executa os resumos devidos em lote, com concorrência limitada por etapa.
+
+        EN:
+        Runs due summaries as a batch, with per-stage bounded concurrency.
+        """
+        if self._stop.is_set():
+            return []
+        due = self._take_due(now or datetime.now())
+        if not due:
+            return []
+        return self._run_batch(due, now)
+
+    def dispatch_due(self, now=None):
+        """
+        PT-BR:
+        Envia os resumos devidos ao pool de threads sem bloquear o laço principal,
+        que segue com heartbeat e recargas enquanto o lote roda.
+
+        Retorna:
+            Future/None: Execução do lote, ou None sem grupos devidos
+
+        EN:
+        Hands due summaries to the thread pool without blocking the main loop,
+        which keeps up heartbeats and reloads while the batch runs.
+
+        Returns:
+            Future/None: The batch execution, or None without due groups
+        """
+        if self._stop.is_set():
+            return None
+        due = self._take_due(now or datetime.now())
+        if not due:
+            return None
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.dispatch_workers,
+                                                thread_name_prefix="summary-dispatch")
+        self._log(f"Disparando {len(due)} resumos / Dispatching {len(due)} summaries")
+        return self._executor.submit(self._run_batch, due)
+
+    def _seconds_until_next(self, now):
+        next_due = self.engine.next_due(now)
+        if next_due is None:
+            return self.poll_interval
+        return min(self.poll_interval, max((next_due - now).total_seconds(), 0.1))
+
+    def stop(self, *_):
+        self._stop.set()
+
+    def run_forever(self):
+        """
+        PT-BR:
+        Laço principal: heartbeat, recarga do agendamento e disparo dos devidos.
+        Dorme até o próximo horário do heap (no máximo poll_interval).
+
+        EN:
+        Main loop: heartbeat, schedule reload and dispatch of due runs.
+        Sleeps until the heap's next slot (at most poll_interval).
+        """
+        self._log("Worker de resumos iniciado / Summary worker started")
+        self.reload_schedule(force=True)
+        while not self._stop.is_set():
+            wait = self.poll_interval
+            try:
+                self._heartbeat()
+                self.reload_schedule()
+                self.dispatch_due()
+                wait = self._seconds_until_next(datetime.now())
+            except Exception as e:
+                self.runner._log("error", f"Erro no ciclo do worker: {e}", exc_info=True)
+            self._stop.wait(wait)
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+        self.batch.close()
+        self._log("Worker de resumos finalizado / Summary worker stopped")
+
+
+def main():
+    load_dotenv(os.path.join(PROJECT_ROOT, '.env'), override=True)
+    parser = argparse.ArgumentParser(description="Resident summary worker / Worker residente de resumos")
+    parser.add_argument("--poll-interval", type=int, default=None, help="Segundos entre verificações")
+    args = parser.parse_args()
+
+    worker = SummaryWorker(poll_interval=args.poll_interval)
+    signal.signal(signal.SIGTERM, worker.stop)
+    signal.signal(signal.SIGINT, worker.stop)
+    worker.run_forever()
+
+
+if __name__ == "__main__":
+    main()
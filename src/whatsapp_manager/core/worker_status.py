@@ -0,0 +1,53 @@
+"""
+Estado do Worker Residente / Resident Worker Status
+
+PT-BR:
+Verificações leves sobre o worker residente de resumos (heartbeat e tipo de
+configuração), sem importar o SummaryRunner nem o CrewAI. Permite que a
+entrada de cron de um grupo (summary.py) desista antes da inicialização
+pesada quando o worker já cuida do resumo diário.
+
+EN:
+Lightweight checks about the resident summary worker (heartbeat and settings
+kind) that import neither SummaryRunner nor CrewAI. They let a group's cron
+entry (summary.py) bail out before the heavy start-up when the worker already
+owns the daily summary.
+"""
+
+import os
+import time
+
+# Define Project Root assuming this file is src/whatsapp_manager/core/worker_status.py
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', '..'))
+
+HEARTBEAT_FILE = os.path.join(PROJECT_ROOT, "data", "summary_worker.heartbeat")
+
+
+def is_worker_active(max_age_seconds=None):
+    """
+    PT-BR:
+    Indica se há um worker residente em execução (heartbeat recente).
+    Usado por summary.py para não executar duas vezes o mesmo resumo diário.
+
+    EN:
+    Tells whether a resident worker is running (recent heartbeat).
+    Used by summary.py to avoid running the same daily summary twice.
+    """
+    if max_age_seconds is None:
+        max_age_seconds = int(os.getenv("SUMMARY_WORKER_HEARTBEAT_MAX_AGE", "180"))
+    try:
+        return time.time() - os.path.getmtime(HEARTBEAT_FILE) <= max_age_seconds
+    except OSError:
+        return False
+
+
+def is_daily_config(config):
+    """
+    PT-BR:
+    Verifica se a configuração é de resumo diário (sem período fixo).
+
+    EN:
+    Checks whether the settings describe a daily summary (no fixed period).
+    """
+    values = [config.get(key) for key in ('start_date', 'start_time', 'end_date', 'end_time')]
+    return not all(value and str(value) != 'nan' for value in values)
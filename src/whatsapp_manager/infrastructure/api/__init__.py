@@ -7,11 +7,14 @@ Wrappers and adapters for external APIs like Evolution API.
 """
 
 from .evolution_client import EvolutionClientWrapper
+from .rate_limiter import TokenBucket, get_send_limiter
 
 # Alias for backward compatibility
 EvolutionAPIClient = EvolutionClientWrapper
 
 __all__ = [
     'EvolutionClientWrapper',
-    'EvolutionAPIClient'
+    'EvolutionAPIClient',
+    'TokenBucket',
+    'get_send_limiter'
 ]
@@ -0,0 +1,142 @@
+"""
+Limitador de Taxa / Rate Limiter
+
+PT-BR:
+Token bucket para controlar o ritmo de chamadas à Evolution API. Envios
+isolados saem na hora; só há espera quando a taxa configurada é excedida
+ou quando a API sinaliza limite (rate-overlimit).
+
+EN:
+Token bucket used to pace calls to the Evolution API. Isolated sends go out
+immediately; waiting only happens when the configured rate is exceeded or
+when the API signals a limit (rate-overlimit).
+"""
+
+import os
+import re
+import threading
+import time
+
+# "429" só conta ao lado de um rótulo de status (ex.: "Erro na requisição: 429", "status 429")
+# "429" only counts next to a status label (e.g. "Erro na requisição: 429", "status 429")
+_STATUS_429 = re.compile(r"(?:status(?:[ _]code)?|requisição|http(?:/\d(?:\.\d)?)?)\W{0,3}429\b")
+
+
+class TokenBucket:
+    """
+    PT-BR:
+    Token bucket seguro para uso entre threads.
+
+    EN:
+    Thread-safe token bucket.
+    """
+
+    def __init__(self, rate, capacity=1, clock=time.monotonic, sleep=time.sleep):
+        """
+        PT-BR:
+        Parâmetros:
+            rate: Tokens repostos por segundo (0 ou menos desativa o limite)
+            capacity: Máximo de tokens acumulados (rajada permitida)
+            clock: Relógio monotônico (injetável para testes)
+            sleep: Função de espera (injetável para testes)
+
+        EN:
+        Parameters:
+            rate: Tokens refilled per second (0 or less disables limiting)
+            capacity: Maximum accumulated tokens (allowed burst)
+            clock: Monotonic clock (injectable for tests)
+            sleep: Sleep function (injectable for tests)
+        """
+        self.rate = float(rate)
+        self.capacity = max(float(capacity), 1.0)
+        self._clock = clock
+        self._sleep = sleep
+        self._tokens = self.capacity
+        self._updated = clock()
+        self._blocked_until = 0.0
+        self._lock = threading.Lock()
+
+    def _refill(self, now):
+        if now > self._updated:
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+
+    def acquire(self, tokens=1):
+        """
+        PT-BR:
+        Consome tokens, aguardando apenas o necessário.
+
+        Retorna:
+            float: Segundos aguardados
+
+        EN:
+        Consumes tokens, waiting only as long as needed.
+
+        Returns:
+            float: Seconds waited
+        """
+        if self.rate <= 0:
+            return 0.0
+        waited = 0.0
+        while True:
+            with self._lock:
+                now = self._clock()
+                self._refill(now)
+                if now >= self._blocked_until and self._tokens >= tokens:
+                    self._tokens -= tokens
+                    return waited
+                delay = max(self._blocked_until - now, (tokens - self._tokens) / self.rate)
+            self._sleep(delay)
+            waited += delay
+
+    def penalize(self, seconds):
+        """
+        PT-BR:
+        Bloqueia novas aquisições por alguns segundos (ex.: após rate-overlimit).
+
+        EN:
+        Blocks new acquisitions for a few seconds (e.g. after rate-overlimit).
+        """
+        with self._lock:
+            self._blocked_until = max(self._blocked_until, self._clock() + seconds)
+            self._tokens = 0.0
+
+
+_send_limiter = None
+_send_limiter_lock = threading.Lock()
+
+
+def get_send_limiter():
+    """
+    PT-BR:
+    Limitador compartilhado dos envios do processo, configurado por
+    EVO_SEND_RATE (mensagens/segundo, padrão 1) e EVO_SEND_BURST (padrão 3).
+
+    EN:
+    Process-wide send limiter, configured by EVO_SEND_RATE
+    (messages/second, default 1) and EVO_SEND_BURST (default 3).
+    """
+    global _send_limiter
+    with _send_limiter_lock:
+        if _send_limiter is None:
+            _send_limiter = TokenBucket(
+                rate=float(os.getenv("EVO_SEND_RATE", "1")),
+                capacity=float(os.getenv("EVO_SEND_BURST", "3")),
+            )
+        return _send_limiter
+
+
+def is_rate_limit_error(error):
+    """
+    PT-BR:
+    Indica se o erro da API corresponde a limite de requisições.
+
+    EN:
+    Tells whether an API error means the request rate was exceeded.
+    """
+    response = getattr(error, "response", None)
+    status = getattr(error, "status_code", None) or getattr(response, "status_code", None)
+    if status is not None:
+        return status == 429
+    text = str(error).lower()
+    return "rate-overlimit" in text or "too many requests" in text or bool(_STATUS_429.search(text))
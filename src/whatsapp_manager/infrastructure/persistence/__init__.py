@@ -0,0 +1,27 @@
+"""
+Persistência - Armazenamento Local
+Persistence - Local Storage
+
+Armazenamentos locais em disco usados para evitar chamadas repetidas à API.
+Local on-disk stores used to avoid repeated API calls.
+"""
+
+from .group_index import GroupIndex
+from .message_store import MessageStore
+from .settings_store import CsvSettingsStore, SqliteSettingsStore, get_settings_store
+from .summary_cache import SummaryCache
+from .summary_events import SummaryEventLog
+from .summary_rollups import SummaryRollupStore
+from .summary_state import SummaryStateStore
+
+__all__ = [
+    'GroupIndex',
+    'MessageStore',
+    'CsvSettingsStore',
+    'SqliteSettingsStore',
+    'get_settings_store',
+    'SummaryCache',
+    'SummaryEventLog',
+    'SummaryRollupStore',
+    'SummaryStateStore'
+]
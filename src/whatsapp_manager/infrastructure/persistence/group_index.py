@@ -0,0 +1,120 @@
+"""
+Índice Local de Grupos / Local Group Index
+
+PT-BR:
+Este módulo guarda em SQLite um registro por grupo (o mesmo retornado por
+fetch_all_groups), indexado pelo group_id. Ele é regravado junto com o cache
+de grupos e permite que uma tarefa agendada leia apenas o grupo de que
+precisa, sem carregar todos os grupos da instância.
+
+EN:
+This module keeps in SQLite one record per group (the same one returned by
+fetch_all_groups), indexed by group_id. It is rewritten together with the
+groups cache and lets a scheduled task read only the group it needs, without
+loading every group of the instance.
+"""
+
+import os
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+
+from ...utils import fast_json
+
+
+class GroupIndex:
+    """
+    PT-BR:
+    Índice persistente de grupos por group_id.
+
+    EN:
+    Persistent group index by group_id.
+    """
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS groups (
+            group_id TEXT PRIMARY KEY,
+            record TEXT NOT NULL,
+            updated_at REAL NOT NULL
+        );
+    """
+
+    def __init__(self, db_path):
+        """
+        PT-BR:
+        Inicializa o índice. O arquivo e a tabela são criados apenas no primeiro uso.
+
+        Parâmetros:
+            db_path: Caminho do arquivo SQLite
+
+        EN:
+        Initializes the index. The file and table are only created on first use.
+
+        Parameters:
+            db_path: SQLite file path
+        """
+        self.db_path = db_path
+        self._schema_ready = False
+        self._schema_lock = threading.Lock()
+
+    @contextmanager
+    def _connect(self):
+        if not self._schema_ready:
+            with self._schema_lock:
+                if not self._schema_ready:
+                    os.makedirs(os.path.dirname(os.path.abspath(self.db_path)), exist_ok=True)
+                    conn = sqlite3.connect(self.db_path, timeout=30)
+                    try:
+                        conn.execute("PRAGMA journal_mode=WAL")
+                        conn.executescript(self.SCHEMA)
+                        conn.commit()
+                    finally:
+                        conn.close()
+                    self._schema_ready = True
+        conn = sqlite3.connect(self.db_path, timeout=30)
+        try:
+            yield conn
+            conn.commit()
+        finally:
+            conn.close()
+
+    def get(self, group_id):
+        """
+        PT-BR:
+        Retorna o registro do grupo ou None.
+
+        EN:
+        Returns the group's record or None.
+        """
+        with self._connect() as conn:
+            row = conn.execute("SELECT record FROM groups WHERE group_id = ?", (group_id,)).fetchone()
+        return fast_json.loads(row[0]) if row else None
+
+    def put(self, record):
+        """
+        PT-BR:
+        Grava (ou substitui) o registro de um grupo.
+
+        EN:
+        Stores (or replaces) one group's record.
+        """
+        with self._connect() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO groups (group_id, record, updated_at) VALUES (?, ?, ?)",
+                (record["id"], fast_json.dumps(record), time.time()),
+            )
+
+    def replace_all(self, records):
+        """
+        PT-BR:
+        Substitui todo o índice pelos registros informados, em uma única transação.
+
+        EN:
+        Replaces the whole index with the given records, in a single transaction.
+        """
+        now = time.time()
+        rows = [(record["id"], fast_json.dumps(record), now) for record in records if record.get("id")]
+        with self._connect() as conn:
+            conn.execute("DELETE FROM groups")
+            conn.executemany("INSERT OR REPLACE INTO groups (group_id, record, updated_at) VALUES (?, ?, ?)", rows)
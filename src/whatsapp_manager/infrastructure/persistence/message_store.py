@@ -0,0 +1,285 @@
+"""
+Armazenamento Local de Mensagens / Local Message Store
+
+PT-BR:
+Este módulo mantém em SQLite as mensagens já baixadas da API Evolution,
+indexadas por (remote_jid, message_id) e por timestamp. Também registra,
+para cada grupo, o intervalo de tempo já sincronizado, permitindo que apenas
+o trecho novo seja solicitado à API nas execuções seguintes. Mensagens mais
+antigas que o período de retenção (MESSAGE_STORE_RETENTION_DAYS) em relação
+ao ponto sincronizado mais recente de cada grupo são removidas durante a
+atualização da cobertura.
+
+EN:
+This module keeps messages already downloaded from the Evolution API in SQLite,
+keyed by (remote_jid, message_id) and indexed by timestamp. It also records,
+for each group, the time range already synchronized, so that only the new
+stretch has to be requested from the API on later runs. Messages older than
+the retention period (MESSAGE_STORE_RETENTION_DAYS) behind each group's newest
+synchronized point are pruned while the coverage is updated.
+"""
+
+import os
+import sqlite3
+import threading
+from contextlib import contextmanager
+
+from ...core.message_sandeco import MessageSandeco
+from ...utils import fast_json
+
+
+class MessageStore:
+    """
+    PT-BR:
+    Armazenamento persistente de mensagens em SQLite.
+
+    EN:
+    Persistent SQLite message store.
+    """
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS messages (
+            remote_jid TEXT NOT NULL,
+            message_id TEXT NOT NULL,
+            message_timestamp INTEGER NOT NULL,
+            push_name TEXT,
+            message_type TEXT,
+            record TEXT NOT NULL,
+            PRIMARY KEY (remote_jid, message_id)
+        );
+        CREATE INDEX IF NOT EXISTS idx_messages_timestamp
+            ON messages (remote_jid, message_timestamp);
+        CREATE TABLE IF NOT EXISTS sync_state (
+            remote_jid TEXT PRIMARY KEY,
+            synced_from INTEGER NOT NULL,
+            synced_until INTEGER NOT NULL
+        );
+    """
+
+    def __init__(self, db_path, retention_days=None):
+        """
+        PT-BR:
+        Inicializa o armazenamento. O arquivo e as tabelas são criados
+        apenas no primeiro uso.
+
+        Parâmetros:
+            db_path: Caminho do arquivo SQLite
+            retention_days: Dias de mensagens mantidos por grupo (padrão:
+                MESSAGE_STORE_RETENTION_DAYS ou 8; 0 desativa a limpeza)
+
+        EN:
+        Initializes the store. The file and tables are only created
+        on first use.
+
+        Parameters:
+            db_path: SQLite file path
+            retention_days: Days of messages kept per group (default:
+                MESSAGE_STORE_RETENTION_DAYS or 8; 0 disables pruning)
+        """
+        self.db_path = db_path
+        retention_days = retention_days if retention_days is not None else float(os.getenv("MESSAGE_STORE_RETENTION_DAYS", "8"))
+        self.retention_seconds = int(retention_days * 86400)
+        self._schema_ready = False
+        self._schema_lock = threading.Lock()
+
+    @contextmanager
+    def _connect(self):
+        """
+        PT-BR:
+        Abre uma conexão curta (uma por operação, segura entre threads).
+
+        EN:
+        Opens a short-lived connection (one per operation, thread safe).
+        """
+        if not self._schema_ready:
+            with self._schema_lock:
+                if not self._schema_ready:
+                    os.makedirs(os.path.dirname(os.path.abspath(self.db_path)), exist_ok=True)
+                    conn = sqlite3.connect(self.db_path, timeout=30)
+                    try:
+                        conn.execute("PRAGMA journal_mode=WAL")
+                        conn.executescript(self.SCHEMA)
+                        conn.commit()
+                    finally:
+                        conn.close()
+                    self._schema_ready = True
+        conn = sqlite3.connect(self.db_path, timeout=30)
+        try:
+            yield conn
+            conn.commit()
+        finally:
+            conn.close()
+
+    @staticmethod
+    def _record_for_storage(msg):
+        """
+        PT-BR:
+        Retorna o registro bruto da mensagem sem o conteúdo base64 da mídia,
+        que não é usado nos resumos e ocuparia muito espaço.
+
+        EN:
+        Returns the raw message record without the media base64 payload,
+        which summaries never use and would take up a lot of space.
+        """
+        record = dict(msg.to_record())
+        message = record.get("message")
+        if isinstance(message, dict) and "base64" in message:
+            record["message"] = {k: v for k, v in message.items() if k != "base64"}
+        return record
+
+    def add_messages(self, messages):
+        """
+        PT-BR:
+        Insere ou atualiza mensagens no armazenamento.
+
+        Parâmetros:
+            messages: Lista de objetos MessageSandeco
+
+        Retorna:
+            int: Quantidade de mensagens gravadas
+
+        EN:
+        Inserts or updates messages in the store.
+
+        Parameters:
+            messages: List of MessageSandeco objects
+
+        Returns:
+            int: Number of messages written
+        """
+        rows = [
+            (
+                msg.remote_jid,
+                msg.message_id,
+                int(msg.message_timestamp),
+                msg.push_name,
+                msg.message_type,
+                fast_json.dumps(self._record_for_storage(msg)),
+            )
+            for msg in messages
+            if msg.remote_jid and msg.message_id and msg.message_timestamp is not None
+        ]
+        if not rows:
+            return 0
+        with self._connect() as conn:
+            conn.executemany(
+                "INSERT OR REPLACE INTO messages "
+                "(remote_jid, message_id, message_timestamp, push_name, message_type, record) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                rows,
+            )
+        return len(rows)
+
+    def get_messages(self, remote_jid, ts_start, ts_end):
+        """
+        PT-BR:
+        Lê as mensagens de um grupo dentro do período.
+
+        Parâmetros:
+            remote_jid: ID do grupo
+            ts_start: Timestamp Unix inicial (inclusivo)
+            ts_end: Timestamp Unix final (inclusivo)
+
+        Retorna:
+            List[MessageSandeco]: Mensagens da mais recente para a mais antiga
+
+        EN:
+        Reads a group's messages within the period.
+
+        Parameters:
+            remote_jid: Group ID
+            ts_start: Start Unix timestamp (inclusive)
+            ts_end: End Unix timestamp (inclusive)
+
+        Returns:
+            List[MessageSandeco]: Messages, newest first
+        """
+        with self._connect() as conn:
+            rows = conn.execute(
+                "SELECT record FROM messages "
+                "WHERE remote_jid = ? AND message_timestamp BETWEEN ? AND ? "
+                "ORDER BY message_timestamp DESC",
+                (remote_jid, int(ts_start), int(ts_end)),
+            ).fetchall()
+        return [MessageSandeco(fast_json.loads(row[0])) for row in rows]
+
+    def last_timestamp(self, remote_jid):
+        """
+        PT-BR:
+        Retorna o timestamp da mensagem mais recente armazenada para o grupo.
+
+        EN:
+        Returns the timestamp of the newest stored message for the group.
+        """
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT MAX(message_timestamp) FROM messages WHERE remote_jid = ?",
+                (remote_jid,),
+            ).fetchone()
+        return row[0] if row else None
+
+    def get_coverage(self, remote_jid):
+        """
+        PT-BR:
+        Retorna o intervalo já sincronizado para o grupo.
+
+        Retorna:
+            tuple/None: (synced_from, synced_until) ou None se nunca sincronizado
+
+        EN:
+        Returns the range already synchronized for the group.
+
+        Returns:
+            tuple/None: (synced_from, synced_until) or None if never synchronized
+        """
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT synced_from, synced_until FROM sync_state WHERE remote_jid = ?",
+                (remote_jid,),
+            ).fetchone()
+        return (row[0], row[1]) if row else None
+
+    def extend_coverage(self, remote_jid, synced_from, synced_until):
+        """
+        PT-BR:
+        Registra que o intervalo informado está completo no armazenamento.
+        Se ele se sobrepõe ao intervalo atual, os dois são unidos; caso
+        contrário, o intervalo mais recente prevalece. Mensagens mais antigas
+        que o período de retenção antes do fim do intervalo são removidas e o
+        intervalo é ajustado, sem nunca cortar o trecho informado nesta chamada.
+
+        EN:
+        Records that the given range is complete in the store.
+        If it overlaps the current range, both are merged; otherwise
+        the most recent range wins. Messages older than the retention period
+        behind the end of the range are pruned and the range is trimmed to match,
+        never cutting into the stretch passed in this call.
+        """
+        synced_from, synced_until = int(synced_from), int(synced_until)
+        requested_from = synced_from
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT synced_from, synced_until FROM sync_state WHERE remote_jid = ?",
+                (remote_jid,),
+            ).fetchone()
+            if row:
+                current_from, current_until = row
+                if synced_from <= current_until and synced_until >= current_from:
+                    synced_from = min(synced_from, current_from)
+                    synced_until = max(synced_until, current_until)
+                elif synced_until < current_from:
+                    return
+            if self.retention_seconds > 0:
+                # Nunca remove dentro do intervalo recém-gravado (janelas maiores que a retenção)
+                # Never prune inside the range just recorded (windows longer than the retention)
+                cutoff = min(synced_until - self.retention_seconds, requested_from)
+                conn.execute(
+                    "DELETE FROM messages WHERE remote_jid = ? AND message_timestamp < ?",
+                    (remote_jid, cutoff),
+                )
+                synced_from = max(synced_from, cutoff)
+            conn.execute(
+                "INSERT OR REPLACE INTO sync_state (remote_jid, synced_from, synced_until) "
+                "VALUES (?, ?, ?)",
+                (remote_jid, synced_from, synced_until),
+            )
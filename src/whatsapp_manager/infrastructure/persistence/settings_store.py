@@ -0,0 +1,497 @@
+"""
+Configurações de Resumo dos Grupos / Group Summary Settings Store
+
+PT-BR:
+Este módulo guarda as configurações de resumo de cada grupo (horário,
+habilitado, período, etc.). Há duas implementações com a mesma interface:
+- CsvSettingsStore: o group_summary.csv original, regravado por inteiro a cada alteração;
+- SqliteSettingsStore: tabela SQLite com group_id como chave primária e
+  gravação (upsert) por linha, segura para cron, worker e interface ao mesmo tempo.
+O SqliteSettingsStore importa o group_summary.csv na primeira utilização e
+sempre que o arquivo muda depois disso (edição manual): apenas as linhas
+alteradas, novas ou removidas desde a última sincronização são aplicadas.
+A reexportação do CSV após cada alteração é opcional (SETTINGS_EXPORT_CSV).
+O backend é escolhido por SETTINGS_BACKEND=sqlite|csv.
+
+EN:
+This module keeps each group's summary settings (time, enabled, period,
+etc.). There are two implementations sharing the same interface:
+- CsvSettingsStore: the original group_summary.csv, fully rewritten on every change;
+- SqliteSettingsStore: a SQLite table keyed by group_id with row-level
+  upserts, safe for cron, the worker and the UI at the same time.
+SqliteSettingsStore imports group_summary.csv on first use and whenever the
+file changes afterwards (manual edits): only the rows changed, added or
+removed since the last sync are applied. Re-exporting the CSV after each
+change is optional (SETTINGS_EXPORT_CSV).
+The backend is selected with SETTINGS_BACKEND=sqlite|csv.
+"""
+
+import hashlib
+import math
+import os
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+
+import pandas as pd
+
+from ...utils import fast_json
+
+SETTINGS_COLUMNS = [
+    "group_id", "horario", "enabled", "is_links", "is_names", "script",
+    "send_to_group", "send_to_personal",
+    "start_date", "start_time", "end_date", "end_time", "min_messages_summary",
+    "chunk_tokens", "chunk_parallelism", "rolling",
+]
+
+
+def _clean_value(value):
+    # Tipos do numpy/pandas -> Python; NaN -> None / numpy/pandas types -> Python; NaN -> None
+    if hasattr(value, "item"):
+        value = value.item()
+    if isinstance(value, float) and math.isnan(value):
+        return None
+    return value
+
+
+def _first_per_group(configs):
+    # Primeira linha de cada grupo vale, como no CSV / First row of each group wins, as in the CSV
+    seen = set()
+    unique = []
+    for config in configs:
+        group_id = config.get("group_id")
+        if group_id not in seen:
+            seen.add(group_id)
+            unique.append(config)
+    return unique
+
+
+def _file_stamp(path):
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return f"{stat.st_mtime_ns}:{stat.st_size}"
+
+
+def _read_csv_rows(csv_file):
+    # Linhas do CSV por grupo, com o hash de cada uma / CSV rows per group, with each row's hash
+    try:
+        configs = pd.read_csv(csv_file).to_dict('records')
+    except (FileNotFoundError, pd.errors.EmptyDataError):
+        configs = []
+    rows = {}
+    for config in _first_per_group(configs):
+        config = {key: _clean_value(value) for key, value in config.items()}
+        if config.get("group_id"):
+            rows[config["group_id"]] = (config, hashlib.sha1(fast_json.dumps_bytes(config)).hexdigest())
+    return rows
+
+
+def _write_csv(df, csv_file):
+    # Gravação atômica: leitores nunca veem um arquivo pela metade
+    # Atomic write: readers never see a half-written file
+    os.makedirs(os.path.dirname(os.path.abspath(csv_file)), exist_ok=True)
+    tmp_path = f"{csv_file}.{os.getpid()}.{threading.get_ident()}.tmp"
+    df.to_csv(tmp_path, index=False)
+    os.replace(tmp_path, csv_file)
+
+
+class CsvSettingsStore:
+    """
+    PT-BR:
+    Configurações guardadas diretamente no group_summary.csv.
+
+    EN:
+    Settings kept directly in group_summary.csv.
+    """
+
+    def __init__(self, csv_file):
+        self.csv_file = csv_file
+
+    def load(self):
+        """
+        PT-BR:
+        Retorna todas as configurações como DataFrame.
+
+        EN:
+        Returns every setting as a DataFrame.
+        """
+        try:
+            return pd.read_csv(self.csv_file)
+        except FileNotFoundError:
+            return pd.DataFrame(columns=SETTINGS_COLUMNS)
+
+    def get(self, group_id):
+        """
+        PT-BR:
+        Retorna as configurações do grupo (dict) ou None.
+
+        EN:
+        Returns the group's settings (dict) or None.
+        """
+        df = self.load()
+        rows = df[df["group_id"] == group_id]
+        return rows.iloc[0].to_dict() if not rows.empty else None
+
+    def upsert(self, config):
+        """
+        PT-BR:
+        Substitui as configurações do grupo config["group_id"].
+
+        EN:
+        Replaces the settings of group config["group_id"].
+        """
+        self.upsert_many([config])
+
+    def upsert_many(self, configs):
+        """
+        PT-BR:
+        Substitui as configurações de vários grupos com uma única gravação.
+
+        EN:
+        Replaces the settings of several groups with a single write.
+        """
+        configs = list(configs)
+        if not configs:
+            return
+        group_ids = {config["group_id"] for config in configs}
+        df = self.load()
+        df = df[~df["group_id"].isin(group_ids)]
+        df = pd.concat([df, pd.DataFrame(configs)], ignore_index=True)
+        _write_csv(df, self.csv_file)
+
+    def delete(self, group_id):
+        """
+        PT-BR:
+        Remove as configurações do grupo. Retorna False se ele não existir.
+
+        EN:
+        Removes the group's settings. Returns False if it does not exist.
+        """
+        df = self.load()
+        if group_id not in df["group_id"].values:
+            return False
+        _write_csv(df[df["group_id"] != group_id], self.csv_file)
+        return True
+
+    def revision(self):
+        """
+        PT-BR:
+        Valor que muda sempre que as configurações mudam.
+
+        EN:
+        Value that changes whenever the settings change.
+        """
+        try:
+            stat = os.stat(self.csv_file)
+        except OSError:
+            return None
+        return (stat.st_mtime_ns, stat.st_size)
+
+    def export_csv(self, csv_file):
+        """
+        PT-BR:
+        Exporta as configurações para um arquivo CSV.
+
+        EN:
+        Exports the settings to a CSV file.
+        """
+        _write_csv(self.load(), csv_file)
+
+
+class SqliteSettingsStore:
+    """
+    PT-BR:
+    Configurações em SQLite, com uma linha por grupo (group_id como chave primária).
+
+    EN:
+    Settings in SQLite, one row per group (group_id as primary key).
+    """
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS group_settings (
+            group_id TEXT PRIMARY KEY,
+            config TEXT NOT NULL,
+            updated_at REAL NOT NULL
+        );
+        CREATE TABLE IF NOT EXISTS settings_meta (
+            key TEXT PRIMARY KEY,
+            value TEXT NOT NULL
+        );
+        INSERT OR IGNORE INTO settings_meta (key, value) VALUES ('revision', '0');
+    """
+
+    def __init__(self, db_path, csv_file=None, export_csv=False):
+        """
+        PT-BR:
+        Inicializa o armazenamento. O arquivo e as tabelas são criados apenas no primeiro uso.
+        Alterações no csv_file (mtime/tamanho diferentes da última sincronização)
+        são importadas na operação seguinte.
+
+        Parâmetros:
+            db_path: Caminho do arquivo SQLite
+            csv_file: group_summary.csv a importar quando mudar (opcional)
+            export_csv: Reexporta o csv_file após cada alteração (padrão: False)
+
+        EN:
+        Initializes the store. The file and tables are only created on first use.
+        Changes to csv_file (mtime/size differing from the last sync) are
+        imported on the next operation.
+
+        Parameters:
+            db_path: SQLite file path
+            csv_file: group_summary.csv to import when it changes (optional)
+            export_csv: Re-exports csv_file after each change (default: False)
+        """
+        self.db_path = db_path
+        self.csv_file = csv_file
+        self.export_enabled = export_csv and csv_file is not None
+        self._schema_ready = False
+        self._schema_lock = threading.Lock()
+        self._csv_lock = threading.Lock()
+        self._csv_seen = None
+
+    @contextmanager
+    def _connect(self):
+        if not self._schema_ready:
+            with self._schema_lock:
+                if not self._schema_ready:
+                    os.makedirs(os.path.dirname(os.path.abspath(self.db_path)), exist_ok=True)
+                    conn = sqlite3.connect(self.db_path, timeout=30)
+                    try:
+                        conn.execute("PRAGMA journal_mode=WAL")
+                        conn.executescript(self.SCHEMA)
+                        conn.commit()
+                    finally:
+                        conn.close()
+                    self._schema_ready = True
+        self._sync_csv()
+        conn = sqlite3.connect(self.db_path, timeout=30)
+        try:
+            yield conn
+            conn.commit()
+        finally:
+            conn.close()
+
+    def _sync_csv(self):
+        # Só um os.stat quando o CSV não mudou / Only one os.stat when the CSV did not change
+        if not self.csv_file:
+            return
+        stamp = _file_stamp(self.csv_file)
+        if stamp is None or stamp == self._csv_seen:
+            return
+        with self._csv_lock:
+            conn = sqlite3.connect(self.db_path, timeout=30)
+            try:
+                # Evita importação dupla entre processos / Prevents a double import across processes
+                conn.execute("BEGIN IMMEDIATE")
+                self._import_changes(conn, stamp)
+                conn.commit()
+            finally:
+                conn.close()
+            self._csv_seen = stamp
+
+    @staticmethod
+    def _meta(conn, key):
+        row = conn.execute("SELECT value FROM settings_meta WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else None
+
+    def _import_changes(self, conn, stamp):
+        if self._meta(conn, "csv_stamp") == stamp:
+            return
+        rows = _read_csv_rows(self.csv_file)
+        previous = self._meta(conn, "csv_rows")
+        previous = fast_json.loads(previous) if previous else {}
+        # Linhas novas ou editadas no CSV e linhas removidas dele desde a última sincronização
+        # Rows added or edited in the CSV and rows removed from it since the last sync
+        changed = [config for group_id, (config, digest) in rows.items() if previous.get(group_id) != digest]
+        removed = [group_id for group_id in previous if group_id not in rows]
+        if changed:
+            self._write(conn, changed)
+        if removed:
+            conn.executemany("DELETE FROM group_settings WHERE group_id = ?", [(group_id,) for group_id in removed])
+            conn.execute("UPDATE settings_meta SET value = CAST(value AS INTEGER) + 1 WHERE key = 'revision'")
+        self._save_csv_state(conn, stamp, rows)
+        if changed or removed:
+            print(f"Configurações importadas de {self.csv_file}: {len(changed)} alteradas, {len(removed)} removidas / "
+                  f"Settings imported: {len(changed)} changed, {len(removed)} removed")
+
+    @staticmethod
+    def _save_csv_state(conn, stamp, rows):
+        conn.executemany(
+            "INSERT OR REPLACE INTO settings_meta (key, value) VALUES (?, ?)",
+            [("csv_stamp", stamp), ("csv_rows", fast_json.dumps({group_id: digest for group_id, (_, digest) in rows.items()}))],
+        )
+
+    @staticmethod
+    def _write(conn, configs):
+        now = time.time()
+        rows = []
+        for config in configs:
+            config = {key: _clean_value(value) for key, value in config.items()}
+            if config.get("group_id"):
+                rows.append((config["group_id"], fast_json.dumps(config), now))
+        conn.executemany(
+            "INSERT INTO group_settings (group_id, config, updated_at) VALUES (?, ?, ?) "
+            "ON CONFLICT(group_id) DO UPDATE SET config = excluded.config, updated_at = excluded.updated_at",
+            rows,
+        )
+        conn.execute("UPDATE settings_meta SET value = CAST(value AS INTEGER) + 1 WHERE key = 'revision'")
+        return len(rows)
+
+    @staticmethod
+    def _row(config):
+        # Campos vazios como NaN, igual ao DataFrame lido do CSV / Empty fields as NaN, like the CSV DataFrame
+        row = {column: float("nan") for column in SETTINGS_COLUMNS}
+        row.update({key: float("nan") if value is None else value for key, value in config.items()})
+        return row
+
+    def _configs(self, conn):
+        rows = conn.execute("SELECT config FROM group_settings ORDER BY rowid").fetchall()
+        return [fast_json.loads(row[0]) for row in rows]
+
+    def load(self):
+        """
+        PT-BR:
+        Retorna todas as configurações como DataFrame.
+
+        EN:
+        Returns every setting as a DataFrame.
+        """
+        with self._connect() as conn:
+            configs = self._configs(conn)
+        if not configs:
+            return pd.DataFrame(columns=SETTINGS_COLUMNS)
+        return pd.DataFrame([self._row(config) for config in configs])
+
+    def get(self, group_id):
+        """
+        PT-BR:
+        Retorna as configurações do grupo (dict) ou None.
+
+        EN:
+        Returns the group's settings (dict) or None.
+        """
+        with self._connect() as conn:
+            row = conn.execute("SELECT config FROM group_settings WHERE group_id = ?", (group_id,)).fetchone()
+        return self._row(fast_json.loads(row[0])) if row else None
+
+    def upsert(self, config):
+        """
+        PT-BR:
+        Grava (insere ou atualiza) as configurações do grupo config["group_id"].
+
+        EN:
+        Stores (inserts or updates) the settings of group config["group_id"].
+        """
+        self.upsert_many([config])
+
+    def upsert_many(self, configs):
+        """
+        PT-BR:
+        Grava as configurações de vários grupos em uma única transação.
+
+        EN:
+        Stores the settings of several groups in a single transaction.
+        """
+        configs = list(configs)
+        if not configs:
+            return
+        with self._connect() as conn:
+            self._write(conn, configs)
+        self._export()
+
+    def delete(self, group_id):
+        """
+        PT-BR:
+        Remove as configurações do grupo. Retorna False se ele não existir.
+
+        EN:
+        Removes the group's settings. Returns False if it does not exist.
+        """
+        with self._connect() as conn:
+            deleted = conn.execute("DELETE FROM group_settings WHERE group_id = ?", (group_id,)).rowcount
+            if deleted:
+                conn.execute("UPDATE settings_meta SET value = CAST(value AS INTEGER) + 1 WHERE key = 'revision'")
+        if deleted:
+            self._export()
+        return bool(deleted)
+
+    def revision(self):
+        """
+        PT-BR:
+        Contador incrementado a cada alteração.
+
+        EN:
+        Counter incremented on every change.
+        """
+        with self._connect() as conn:
+            row = conn.execute("SELECT value FROM settings_meta WHERE key = 'revision'").fetchone()
+        return int(row[0])
+
+    def import_csv(self, csv_file):
+        """
+        PT-BR:
+        Importa (upsert) as linhas de um CSV. Retorna o número de linhas lidas.
+
+        EN:
+        Imports (upserts) the rows of a CSV. Returns the number of rows read.
+        """
+        configs = pd.read_csv(csv_file).to_dict('records')
+        with self._connect() as conn:
+            self._write(conn, _first_per_group(configs))
+        self._export()
+        return len(configs)
+
+    def export_csv(self, csv_file):
+        """
+        PT-BR:
+        Exporta as configurações para um arquivo CSV.
+
+        EN:
+        Exports the settings to a CSV file.
+        """
+        _write_csv(self.load(), csv_file)
+
+    def _export(self):
+        if not self.export_enabled:
+            return
+        try:
+            self.export_csv(self.csv_file)
+            # O CSV exportado passa a ser a referência da próxima sincronização
+            # The exported CSV becomes the baseline for the next sync
+            stamp = _file_stamp(self.csv_file)
+            with self._csv_lock:
+                conn = sqlite3.connect(self.db_path, timeout=30)
+                try:
+                    self._save_csv_state(conn, stamp, _read_csv_rows(self.csv_file))
+                    conn.commit()
+                finally:
+                    conn.close()
+                self._csv_seen = stamp
+        except Exception as e:
+            print(f"Erro ao exportar {self.csv_file} / Error exporting settings CSV: {e}")
+
+
+def get_settings_store(csv_file):
+    """
+    PT-BR:
+    Cria o armazenamento de configurações conforme SETTINGS_BACKEND (padrão: sqlite).
+    O banco fica em SETTINGS_DB_PATH (padrão: group_settings.db ao lado do CSV);
+    edições no CSV são importadas e ele só é reexportado após cada alteração
+    com SETTINGS_EXPORT_CSV=true (padrão: false).
+
+    EN:
+    Creates the settings store according to SETTINGS_BACKEND (default: sqlite).
+    The database lives at SETTINGS_DB_PATH (default: group_settings.db next to the CSV);
+    CSV edits are imported, and the CSV is only re-exported after each change
+    with SETTINGS_EXPORT_CSV=true (default: false).
+    """
+    backend = os.getenv("SETTINGS_BACKEND", "sqlite").strip().lower()
+    if backend == "csv":
+        return CsvSettingsStore(csv_file)
+    db_path = os.getenv("SETTINGS_DB_PATH") or os.path.join(os.path.dirname(os.path.abspath(csv_file)), "group_settings.db")
+    export_csv = os.getenv("SETTINGS_EXPORT_CSV", "false").lower() == "true"
+    return SqliteSettingsStore(db_path, csv_file=csv_file, export_csv=export_csv)
@@ -0,0 +1,202 @@
+"""
+Cache de Resumos / Summary Cache
+
+PT-BR:
+Este módulo guarda em SQLite os resumos já gerados pelo LLM, indexados por um
+hash do conteúdo de entrada (mensagens formatadas, template do prompt e nome
+do modelo). Uma nova tentativa após falha de envio, ou um grupo sem mensagens
+novas, reaproveita o resumo anterior sem nova chamada ao LLM. Entradas antigas
+ou excedentes são descartadas automaticamente.
+
+EN:
+This module keeps summaries already produced by the LLM in SQLite, keyed by a
+hash of the input content (formatted messages, prompt template and model
+name). A retry after a failed send, or a group with no new messages, reuses
+the previous summary without a new LLM call. Old or excess entries are evicted
+automatically.
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+
+
+class SummaryCache:
+    """
+    PT-BR:
+    Cache persistente de resumos com descarte por idade e por quantidade.
+
+    EN:
+    Persistent summary cache with age and size eviction.
+    """
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS summaries (
+            cache_key TEXT PRIMARY KEY,
+            model TEXT,
+            summary TEXT NOT NULL,
+            created_at REAL NOT NULL,
+            last_used_at REAL NOT NULL,
+            hits INTEGER NOT NULL DEFAULT 0
+        );
+        CREATE INDEX IF NOT EXISTS idx_summaries_last_used
+            ON summaries (last_used_at);
+        CREATE TABLE IF NOT EXISTS cache_stats (
+            name TEXT PRIMARY KEY,
+            value INTEGER NOT NULL
+        );
+    """
+
+    def __init__(self, db_path, max_entries=None, max_age_days=None):
+        """
+        PT-BR:
+        Inicializa o cache. O arquivo e as tabelas são criados apenas no primeiro uso.
+
+        Parâmetros:
+            db_path: Caminho do arquivo SQLite
+            max_entries: Máximo de resumos guardados (padrão: SUMMARY_CACHE_MAX_ENTRIES ou 500)
+            max_age_days: Idade máxima de um resumo (padrão: SUMMARY_CACHE_MAX_AGE_DAYS ou 7)
+
+        EN:
+        Initializes the cache. The file and tables are only created on first use.
+
+        Parameters:
+            db_path: SQLite file path
+            max_entries: Maximum stored summaries (default: SUMMARY_CACHE_MAX_ENTRIES or 500)
+            max_age_days: Maximum summary age (default: SUMMARY_CACHE_MAX_AGE_DAYS or 7)
+        """
+        self.db_path = db_path
+        self.max_entries = max_entries if max_entries is not None else int(os.getenv("SUMMARY_CACHE_MAX_ENTRIES", "500"))
+        max_age_days = max_age_days if max_age_days is not None else float(os.getenv("SUMMARY_CACHE_MAX_AGE_DAYS", "7"))
+        self.max_age_seconds = max_age_days * 86400
+        self.hits = 0
+        self.misses = 0
+        self._schema_ready = False
+        self._schema_lock = threading.Lock()
+
+    @contextmanager
+    def _connect(self):
+        if not self._schema_ready:
+            with self._schema_lock:
+                if not self._schema_ready:
+                    os.makedirs(os.path.dirname(os.path.abspath(self.db_path)), exist_ok=True)
+                    conn = sqlite3.connect(self.db_path, timeout=30)
+                    try:
+                        conn.execute("PRAGMA journal_mode=WAL")
+                        conn.executescript(self.SCHEMA)
+                        conn.commit()
+                    finally:
+                        conn.close()
+                    self._schema_ready = True
+        conn = sqlite3.connect(self.db_path, timeout=30)
+        try:
+            yield conn
+            conn.commit()
+        finally:
+            conn.close()
+
+    @staticmethod
+    def make_key(inputs, template="", model=""):
+        """
+        PT-BR:
+        Gera a chave do cache a partir das entradas, do template e do modelo.
+
+        EN:
+        Builds the cache key from the inputs, the template and the model.
+        """
+        payload = json.dumps(
+            {"inputs": inputs, "template": template, "model": str(model)},
+            sort_keys=True,
+            ensure_ascii=False,
+            default=str,
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def _count(self, conn, name):
+        conn.execute(
+            "INSERT INTO cache_stats (name, value) VALUES (?, 1) "
+            "ON CONFLICT(name) DO UPDATE SET value = value + 1",
+            (name,),
+        )
+
+    def get(self, key):
+        """
+        PT-BR:
+        Retorna o resumo guardado para a chave, ou None.
+
+        EN:
+        Returns the stored summary for the key, or None.
+        """
+        now = time.time()
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT summary, created_at FROM summaries WHERE cache_key = ?", (key,)
+            ).fetchone()
+            if row and self.max_age_seconds > 0 and now - row[1] > self.max_age_seconds:
+                conn.execute("DELETE FROM summaries WHERE cache_key = ?", (key,))
+                row = None
+            if row is None:
+                self.misses += 1
+                self._count(conn, "misses")
+                return None
+            conn.execute(
+                "UPDATE summaries SET last_used_at = ?, hits = hits + 1 WHERE cache_key = ?",
+                (now, key),
+            )
+            self.hits += 1
+            self._count(conn, "hits")
+            return row[0]
+
+    def put(self, key, summary, model=None):
+        """
+        PT-BR:
+        Guarda um resumo e aplica o descarte por idade e quantidade.
+
+        EN:
+        Stores a summary and applies age and size eviction.
+        """
+        now = time.time()
+        with self._connect() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO summaries (cache_key, model, summary, created_at, last_used_at, hits) "
+                "VALUES (?, ?, ?, ?, ?, 0)",
+                (key, str(model) if model is not None else None, summary, now, now),
+            )
+            self._evict(conn, now)
+
+    def _evict(self, conn, now):
+        if self.max_age_seconds > 0:
+            conn.execute("DELETE FROM summaries WHERE created_at < ?", (now - self.max_age_seconds,))
+        if self.max_entries > 0:
+            conn.execute(
+                "DELETE FROM summaries WHERE cache_key IN ("
+                "SELECT cache_key FROM summaries ORDER BY last_used_at DESC LIMIT -1 OFFSET ?)",
+                (self.max_entries,),
+            )
+
+    def stats(self):
+        """
+        PT-BR:
+        Retorna os contadores do processo atual e os totais acumulados em disco.
+
+        EN:
+        Returns the current process counters and the totals accumulated on disk.
+        """
+        with self._connect() as conn:
+            totals = dict(conn.execute("SELECT name, value FROM cache_stats").fetchall())
+            entries = conn.execute("SELECT COUNT(*) FROM summaries").fetchone()[0]
+        total_hits = totals.get("hits", 0)
+        total_misses = totals.get("misses", 0)
+        lookups = total_hits + total_misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "total_hits": total_hits,
+            "total_misses": total_misses,
+            "hit_rate": total_hits / lookups if lookups else 0.0,
+            "entries": entries,
+        }
@@ -0,0 +1,278 @@
+"""
+Log de Eventos dos Resumos / Summary Event Log
+
+PT-BR:
+Este módulo grava cada execução de resumo como uma linha JSON (JSON lines) em
+data/summary_events.jsonl, com grupo, horários, destinos, número de mensagens,
+latência do LLM, tokens estimados e status. O dashboard lê o arquivo com um
+leitor colunar (pandas/pyarrow) e deriva as colunas de forma vetorizada, sem
+expressões regulares nem comparação de textos em português.
+
+EN:
+This module writes each summary run as one JSON line (JSON lines) to
+data/summary_events.jsonl, with group, timestamps, destinations, message
+count, LLM latency, estimated tokens and status. The dashboard reads the file
+with a columnar reader (pandas/pyarrow) and derives its columns vectorised,
+without regular expressions or Portuguese string matching.
+"""
+
+import io
+import os
+import threading
+
+import numpy as np
+import pandas as pd
+
+from ...utils import fast_json
+
+EVENT_FIELDS = (
+    "event",
+    "status",
+    "group_id",
+    "name",
+    "task_name",
+    "started_at",
+    "finished_at",
+    "window_start",
+    "window_end",
+    "destinations",
+    "message_count",
+    "prompt_tokens",
+    "summary_tokens",
+    "llm_seconds",
+    "reason",
+)
+
+DESTINATION_GROUP = "group"
+DESTINATION_PERSONAL = "personal"
+
+SEND_TYPES = {
+    f"{DESTINATION_GROUP},{DESTINATION_PERSONAL}": "Group & Personal",
+    DESTINATION_PERSONAL: "Personal",
+    DESTINATION_GROUP: "Group",
+}
+
+
+class SummaryEventLog:
+    """
+    PT-BR:
+    Arquivo JSON lines, somente acréscimo, com os eventos dos resumos.
+
+    EN:
+    Append-only JSON lines file with summary events.
+    """
+
+    def __init__(self, path):
+        """
+        PT-BR:
+        Parâmetros:
+            path: Caminho do arquivo .jsonl (o diretório é criado se necessário)
+
+        EN:
+        Parameters:
+            path: Path of the .jsonl file (the directory is created if needed)
+        """
+        self.path = path
+        self._lock = threading.Lock()
+
+    def append(self, event):
+        """
+        PT-BR:
+        Acrescenta um evento. Cada linha é gravada com uma única escrita em modo
+        append, para que processos concorrentes não misturem linhas.
+
+        EN:
+        Appends an event. Each line is written with a single append-mode write,
+        so concurrent processes do not interleave lines.
+        """
+        record = {field: event.get(field) for field in EVENT_FIELDS}
+        line = fast_json.dumps_bytes(record) + b"\n"
+        with self._lock:
+            os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+            with open(self.path, "ab") as f:
+                f.write(line)
+
+    def read_frame(self):
+        """
+        PT-BR:
+        Lê todos os eventos como DataFrame (colunas de EVENT_FIELDS).
+        Linhas corrompidas (ex.: escrita interrompida) são ignoradas.
+
+        EN:
+        Reads every event as a DataFrame (EVENT_FIELDS columns).
+        Corrupted lines (e.g. an interrupted write) are skipped.
+        """
+        try:
+            with open(self.path, "rb") as f:
+                data = f.read()
+        except FileNotFoundError:
+            return pd.DataFrame(columns=list(EVENT_FIELDS))
+        return read_events(data)
+
+
+def read_events(data):
+    """
+    PT-BR:
+    Converte bytes em JSON lines num DataFrame, usando o leitor do pyarrow
+    quando disponível.
+
+    EN:
+    Turns JSON lines bytes into a DataFrame, using the pyarrow reader when
+    available.
+    """
+    if not data.strip():
+        return pd.DataFrame(columns=list(EVENT_FIELDS))
+    try:
+        frame = pd.read_json(io.BytesIO(data), lines=True, engine="pyarrow")
+    except (ImportError, ValueError):
+        # Sem pyarrow, ou linha inválida: decodifica linha a linha
+        # No pyarrow, or an invalid line: decode line by line
+        records = []
+        for line in data.splitlines():
+            try:
+                records.append(fast_json.loads(line))
+            except ValueError:
+                continue
+        frame = pd.DataFrame.from_records(records)
+    return frame.reindex(columns=list(EVENT_FIELDS))
+
+
+def dashboard_frame(events):
+    """
+    PT-BR:
+    Monta as colunas usadas pelo dashboard a partir dos eventos de envio
+    (status success ou error), de forma vetorizada.
+
+    EN:
+    Builds the dashboard columns from the delivery events (status success or
+    error), vectorised.
+    """
+    events = events[events["status"].isin(["success", "error"])]
+    timestamp = pd.to_datetime(events["finished_at"], errors="coerce", format="ISO8601")
+    destinations = events["destinations"].explode()
+    to_group = (destinations == DESTINATION_GROUP).groupby(level=0).any().reindex(events.index, fill_value=False)
+    to_personal = (destinations == DESTINATION_PERSONAL).groupby(level=0).any().reindex(events.index, fill_value=False)
+    send_type = np.select(
+        [to_group & to_personal, to_personal, to_group],
+        [SEND_TYPES[f"{DESTINATION_GROUP},{DESTINATION_PERSONAL}"], SEND_TYPES[DESTINATION_PERSONAL], SEND_TYPES[DESTINATION_GROUP]],
+        default="Unknown",
+    )
+    frame = pd.DataFrame({
+        "Timestamp": timestamp,
+        "Date": timestamp.dt.normalize(),
+        "Hour": timestamp.dt.hour,
+        "Day of Week": timestamp.dt.day_name(),
+        "Week Number": timestamp.dt.isocalendar().week.astype("Int64"),
+        "Month": timestamp.dt.month_name(),
+        "Level": events["status"].map({"success": "INFO", "error": "ERROR"}),
+        "Group Name": events["name"].fillna("N/A"),
+        "Group ID": events["group_id"].fillna("N/A"),
+        "Send Type": send_type,
+        "Success": events["status"] == "success",
+        "Message Count": events["message_count"],
+        "LLM Seconds": events["llm_seconds"],
+        "Prompt Tokens": events["prompt_tokens"],
+        "Summary Tokens": events["summary_tokens"],
+    })
+    frame = frame[frame["Timestamp"].notna()]
+    return frame.sort_values(by="Timestamp", ascending=False).reset_index(drop=True)
+
+
+def read_appended(path, inode, offset):
+    """
+    PT-BR:
+    Lê as linhas completas acrescentadas ao arquivo desde (inode, offset).
+    Se o arquivo foi rotacionado (inode novo), truncado ou removido, a leitura
+    recomeça do início e rebuilt é True: quem chama deve descartar o que
+    derivou do conteúdo anterior. Uma linha final sem quebra de linha
+    (escrita em andamento) fica para a próxima leitura.
+
+    Retorna:
+        tuple: (inode, offset, dados, rebuilt)
+
+    EN:
+    Reads the complete lines appended to the file since (inode, offset).
+    If the file was rotated (new inode), truncated or removed, reading starts
+    over and rebuilt is True: the caller must drop whatever it derived from
+    the previous content. A final line without a newline (write in progress)
+    is left for the next read.
+
+    Returns:
+        tuple: (inode, offset, data, rebuilt)
+    """
+    try:
+        stat = os.stat(path)
+    except FileNotFoundError:
+        return None, 0, b"", inode is not None or offset > 0
+    rebuilt = stat.st_ino != inode or stat.st_size < offset
+    if rebuilt:
+        offset = 0
+    if stat.st_size == offset:
+        return stat.st_ino, offset, b"", rebuilt
+    with open(path, "rb") as f:
+        f.seek(offset)
+        data = f.read(stat.st_size - offset)
+    end = data.rfind(b"\n") + 1
+    return stat.st_ino, offset + end, data[:end], rebuilt
+
+
+class IncrementalEventReader:
+    """
+    PT-BR:
+    Leitor incremental (tail-follow) do log de eventos para o dashboard.
+    Guarda o inode e o deslocamento em bytes da última leitura e, a cada
+    refresh(), lê só as linhas acrescentadas, anexando-as ao DataFrame em
+    cache. O arquivo só é relido do início quando é rotacionado (inode novo)
+    ou truncado (tamanho menor que o deslocamento).
+
+    EN:
+    Incremental (tail-follow) reader of the event log for the dashboard.
+    It keeps the inode and byte offset of the last read and, on each
+    refresh(), reads only the appended lines, appending them to the cached
+    DataFrame. The file is only reread from the start when it is rotated
+    (new inode) or truncated (size below the offset).
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._lock = threading.Lock()
+        self._reset(None)
+
+    def _reset(self, inode):
+        self.inode = inode
+        self.offset = 0
+        self.frame = dashboard_frame(pd.DataFrame(columns=list(EVENT_FIELDS)))
+
+    def _append(self, events):
+        new_rows = dashboard_frame(events)
+        if new_rows.empty:
+            return
+        if self.frame.empty:
+            self.frame = new_rows
+        elif new_rows["Timestamp"].min() >= self.frame["Timestamp"].iloc[0]:
+            # Linhas novas mais recentes: basta colocá-las na frente (ordem decrescente)
+            # Newer rows: just put them in front (descending order)
+            self.frame = pd.concat([new_rows, self.frame], ignore_index=True)
+        else:
+            self.frame = pd.concat([new_rows, self.frame], ignore_index=True).sort_values(
+                by="Timestamp", ascending=False, kind="stable"
+            ).reset_index(drop=True)
+
+    def refresh(self):
+        """
+        PT-BR:
+        Lê as linhas novas e retorna as colunas do dashboard (mais recentes primeiro).
+        Uma linha final sem quebra de linha (escrita em andamento) fica para a próxima leitura.
+
+        EN:
+        Reads the new lines and returns the dashboard columns (newest first).
+        A final line without a newline (write in progress) is left for the next read.
+        """
+        with self._lock:
+            inode, offset, data, rebuilt = read_appended(self.path, self.inode, self.offset)
+            if rebuilt:
+                self._reset(inode)
+            if data:
+                self._append(read_events(data))
+            self.offset = offset
+            return self.frame
@@ -0,0 +1,225 @@
+"""
+Agregados dos Resumos para o Dashboard / Summary Rollups for the Dashboard
+
+PT-BR:
+Este módulo mantém em SQLite contagens pré-agregadas dos eventos de resumo
+por dia × hora × grupo × tipo de envio × sucesso. A atualização acompanha o
+final do arquivo de eventos (inode e deslocamento gravados junto com os
+agregados, na mesma transação) e soma apenas as linhas novas. Os gráficos do
+dashboard consultam essas poucas linhas em vez de reagrupar todos os eventos
+a cada interação.
+
+EN:
+This module keeps in SQLite pre-aggregated counts of the summary events per
+day × hour × group × send type × success. Updates follow the end of the
+event file (inode and offset are stored with the rollups, in the same
+transaction) and only add the new lines. Dashboard charts query these few
+rows instead of regrouping every event on each interaction.
+"""
+
+import os
+import sqlite3
+import threading
+from contextlib import contextmanager
+
+import pandas as pd
+
+from .summary_events import dashboard_frame, read_appended, read_events
+
+ROLLUP_KEYS = ["Date", "Hour", "Group ID", "Group Name", "Send Type", "Success"]
+
+
+def rollup(frame):
+    """
+    PT-BR:
+    Agrega as colunas do dashboard (dashboard_frame) na granularidade dos agregados.
+
+    Retorna:
+        DataFrame: ROLLUP_KEYS + Count, Messages, First Activity, Last Activity
+
+    EN:
+    Aggregates the dashboard columns (dashboard_frame) at the rollup grain.
+
+    Returns:
+        DataFrame: ROLLUP_KEYS + Count, Messages, First Activity, Last Activity
+    """
+    frame = frame.assign(Messages=pd.to_numeric(frame["Message Count"], errors="coerce").fillna(0))
+    grouped = frame.groupby(ROLLUP_KEYS, sort=False, dropna=False)
+    return grouped.agg(
+        Count=("Timestamp", "size"),
+        Messages=("Messages", "sum"),
+        **{"First Activity": ("Timestamp", "min"), "Last Activity": ("Timestamp", "max")},
+    ).reset_index()
+
+
+class SummaryRollupStore:
+    """
+    PT-BR:
+    Agregados persistentes dos eventos de resumo, atualizados de forma incremental.
+
+    EN:
+    Persistent summary event rollups, updated incrementally.
+    """
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS summary_rollup (
+            day TEXT NOT NULL,
+            hour INTEGER NOT NULL,
+            group_id TEXT NOT NULL,
+            group_name TEXT NOT NULL,
+            send_type TEXT NOT NULL,
+            success INTEGER NOT NULL,
+            count INTEGER NOT NULL,
+            messages INTEGER NOT NULL,
+            first_at TEXT NOT NULL,
+            last_at TEXT NOT NULL,
+            PRIMARY KEY (day, hour, group_id, group_name, send_type, success)
+        );
+        CREATE TABLE IF NOT EXISTS rollup_source (
+            path TEXT PRIMARY KEY,
+            inode INTEGER,
+            offset INTEGER NOT NULL
+        );
+    """
+
+    UPSERT = """
+        INSERT INTO summary_rollup
+            (day, hour, group_id, group_name, send_type, success, count, messages, first_at, last_at)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        ON CONFLICT (day, hour, group_id, group_name, send_type, success) DO UPDATE SET
+            count = count + excluded.count,
+            messages = messages + excluded.messages,
+            first_at = MIN(first_at, excluded.first_at),
+            last_at = MAX(last_at, excluded.last_at)
+    """
+
+    def __init__(self, db_path):
+        """
+        PT-BR:
+        Inicializa o armazenamento. O arquivo e as tabelas são criados apenas no primeiro uso.
+
+        Parâmetros:
+            db_path: Caminho do arquivo SQLite
+
+        EN:
+        Initializes the store. The file and tables are only created on first use.
+
+        Parameters:
+            db_path: SQLite file path
+        """
+        self.db_path = db_path
+        self._schema_ready = False
+        self._schema_lock = threading.Lock()
+        self._update_lock = threading.Lock()
+
+    @contextmanager
+    def _connect(self):
+        if not self._schema_ready:
+            with self._schema_lock:
+                if not self._schema_ready:
+                    os.makedirs(os.path.dirname(os.path.abspath(self.db_path)), exist_ok=True)
+                    conn = sqlite3.connect(self.db_path, timeout=30)
+                    try:
+                        conn.execute("PRAGMA journal_mode=WAL")
+                        conn.executescript(self.SCHEMA)
+                        conn.commit()
+                    finally:
+                        conn.close()
+                    self._schema_ready = True
+        conn = sqlite3.connect(self.db_path, timeout=30)
+        try:
+            yield conn
+            conn.commit()
+        finally:
+            conn.close()
+
+    def update(self, events_path):
+        """
+        PT-BR:
+        Soma aos agregados as linhas acrescentadas ao arquivo de eventos desde a
+        última atualização. Com o arquivo rotacionado ou truncado, os agregados
+        são refeitos do início. O banco acompanha um único arquivo de eventos:
+        outro events_path descarta os agregados anteriores e os refaz a partir do novo arquivo.
+
+        Retorna:
+            int: Número de eventos agregados nesta chamada
+
+        EN:
+        Adds the lines appended to the event file since the last update to the
+        rollups. If the file was rotated or truncated, the rollups are rebuilt
+        from the start. The database follows a single event file: a different
+        events_path discards the previous rollups and rebuilds from the new file.
+
+        Returns:
+            int: Number of events aggregated by this call
+        """
+        path = os.path.abspath(events_path)
+        with self._update_lock, self._connect() as conn:
+            # Trava de escrita desde a leitura da posição / Write lock from the position read onwards
+            conn.execute("BEGIN IMMEDIATE")
+            if conn.execute("SELECT 1 FROM rollup_source WHERE path != ? LIMIT 1", (path,)).fetchone():
+                # Outro arquivo de eventos: recomeça do zero / Different event file: start over
+                conn.execute("DELETE FROM rollup_source")
+                conn.execute("DELETE FROM summary_rollup")
+            row = conn.execute("SELECT inode, offset FROM rollup_source WHERE path = ?", (path,)).fetchone()
+            inode, offset = row if row else (None, 0)
+            inode, offset, data, rebuilt = read_appended(path, inode, offset)
+            if rebuilt:
+                conn.execute("DELETE FROM summary_rollup")
+            rows = rollup(dashboard_frame(read_events(data))) if data else pd.DataFrame()
+            if len(rows):
+                conn.executemany(self.UPSERT, (
+                    (day.strftime("%Y-%m-%d"), int(hour), group_id, group_name, send_type, int(bool(success)),
+                     int(count), int(messages), first_at.isoformat(), last_at.isoformat())
+                    for day, hour, group_id, group_name, send_type, success, count, messages, first_at, last_at
+                    in rows.itertuples(index=False, name=None)
+                ))
+            conn.execute(
+                "INSERT OR REPLACE INTO rollup_source (path, inode, offset) VALUES (?, ?, ?)",
+                (path, inode, offset),
+            )
+        return int(rows["Count"].sum()) if len(rows) else 0
+
+    def load(self, start_date=None, end_date=None, group_name=None, send_type=None):
+        """
+        PT-BR:
+        Retorna os agregados filtrados, com os nomes de coluna do dashboard.
+
+        Parâmetros:
+            start_date: Primeiro dia incluído (date/str, opcional)
+            end_date: Último dia incluído (date/str, opcional)
+            group_name: Nome do grupo (opcional)
+            send_type: Tipo de envio (opcional)
+
+        EN:
+        Returns the filtered rollups, with the dashboard column names.
+
+        Parameters:
+            start_date: First included day (date/str, optional)
+            end_date: Last included day (date/str, optional)
+            group_name: Group name (optional)
+            send_type: Send type (optional)
+        """
+        clauses, params = [], []
+        for clause, value in (
+            ("day >= ?", start_date),
+            ("day <= ?", end_date),
+            ("group_name = ?", group_name),
+            ("send_type = ?", send_type),
+        ):
+            if value is not None:
+                clauses.append(clause)
+                params.append(str(value))
+        where = f" WHERE {' AND '.join(clauses)}" if clauses else ""
+        with self._connect() as conn:
+            rows = conn.execute(
+                "SELECT day, hour, group_id, group_name, send_type, success, count, messages, first_at, last_at "
+                f"FROM summary_rollup{where} ORDER BY day, hour, group_name",
+                params,
+            ).fetchall()
+        frame = pd.DataFrame(rows, columns=ROLLUP_KEYS + ["Count", "Messages", "First Activity", "Last Activity"])
+        frame["Date"] = pd.to_datetime(frame["Date"])
+        frame["Success"] = frame["Success"].astype(bool)
+        frame["First Activity"] = pd.to_datetime(frame["First Activity"])
+        frame["Last Activity"] = pd.to_datetime(frame["Last Activity"])
+        return frame
@@ -0,0 +1,135 @@
+"""
+Estado dos Resumos Contínuos / Rolling Summary State
+
+PT-BR:
+Este módulo guarda em SQLite, para cada grupo, o último resumo gerado, o
+início do período que ele cobre, o timestamp da última mensagem processada e
+os IDs das mensagens nesse mesmo segundo (para não perder as que chegam depois).
+Com isso, uma nova execução envia ao LLM apenas o resumo anterior e as
+mensagens novas, em vez de resumir o período inteiro de novo.
+
+EN:
+This module keeps in SQLite, for each group, the last generated summary, the
+start of the period it covers, the timestamp of the last processed message
+and the IDs of the messages in that same second (so late arrivals are kept). A new run then sends the LLM only the previous summary plus the new
+messages, instead of summarizing the whole period again.
+"""
+
+import json
+import os
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+
+
+class SummaryStateStore:
+    """
+    PT-BR:
+    Armazenamento persistente do estado dos resumos contínuos.
+
+    EN:
+    Persistent rolling summary state store.
+    """
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS summary_state (
+            remote_jid TEXT PRIMARY KEY,
+            summary TEXT NOT NULL,
+            covered_from INTEGER NOT NULL,
+            last_timestamp INTEGER NOT NULL,
+            last_ids TEXT NOT NULL DEFAULT '[]',
+            updated_at REAL NOT NULL
+        );
+    """
+
+    def __init__(self, db_path):
+        """
+        PT-BR:
+        Inicializa o armazenamento. O arquivo e a tabela são criados apenas no primeiro uso.
+
+        Parâmetros:
+            db_path: Caminho do arquivo SQLite
+
+        EN:
+        Initializes the store. The file and table are only created on first use.
+
+        Parameters:
+            db_path: SQLite file path
+        """
+        self.db_path = db_path
+        self._schema_ready = False
+        self._schema_lock = threading.Lock()
+
+    @contextmanager
+    def _connect(self):
+        if not self._schema_ready:
+            with self._schema_lock:
+                if not self._schema_ready:
+                    os.makedirs(os.path.dirname(os.path.abspath(self.db_path)), exist_ok=True)
+                    conn = sqlite3.connect(self.db_path, timeout=30)
+                    try:
+                        conn.execute("PRAGMA journal_mode=WAL")
+                        conn.executescript(self.SCHEMA)
+                        # Bancos criados antes da coluna last_ids / Databases created before the last_ids column
+                        columns = {row[1] for row in conn.execute("PRAGMA table_info(summary_state)")}
+                        if "last_ids" not in columns:
+                            conn.execute("ALTER TABLE summary_state ADD COLUMN last_ids TEXT NOT NULL DEFAULT '[]'")
+                        conn.commit()
+                    finally:
+                        conn.close()
+                    self._schema_ready = True
+        conn = sqlite3.connect(self.db_path, timeout=30)
+        try:
+            yield conn
+            conn.commit()
+        finally:
+            conn.close()
+
+    def get(self, remote_jid):
+        """
+        PT-BR:
+        Retorna o estado do grupo como dict (summary, covered_from, last_timestamp,
+        last_ids) ou None.
+
+        EN:
+        Returns the group's state as a dict (summary, covered_from, last_timestamp,
+        last_ids) or None.
+        """
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT summary, covered_from, last_timestamp, last_ids FROM summary_state WHERE remote_jid = ?",
+                (remote_jid,),
+            ).fetchone()
+        if row is None:
+            return None
+        return {"summary": row[0], "covered_from": row[1], "last_timestamp": row[2], "last_ids": json.loads(row[3])}
+
+    def save(self, remote_jid, summary, covered_from, last_timestamp, last_ids=()):
+        """
+        PT-BR:
+        Grava o último resumo do grupo, o período que ele cobre e os IDs das
+        mensagens já processadas no segundo last_timestamp.
+
+        EN:
+        Stores the group's last summary, the period it covers and the IDs of the
+        messages already processed at second last_timestamp.
+        """
+        with self._connect() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO summary_state "
+                "(remote_jid, summary, covered_from, last_timestamp, last_ids, updated_at) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (remote_jid, summary, int(covered_from), int(last_timestamp), json.dumps(sorted(last_ids)), time.time()),
+            )
+
+    def clear(self, remote_jid):
+        """
+        PT-BR:
+        Remove o estado do grupo (o próximo resumo será completo).
+
+        EN:
+        Removes the group's state (the next summary will be a full one).
+        """
+        with self._connect() as conn:
+            conn.execute("DELETE FROM summary_state WHERE remote_jid = ?", (remote_jid,))
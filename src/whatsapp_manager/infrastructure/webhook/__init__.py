@@ -0,0 +1,13 @@
+"""
+Webhook - Recepção de Eventos em Tempo Real
+Webhook - Real-time Event Ingestion
+
+Recebe eventos da Evolution API e grava as mensagens no armazenamento local.
+Receives Evolution API events and writes the messages to the local store.
+"""
+
+from .receiver import WebhookReceiver
+
+__all__ = [
+    'WebhookReceiver'
+]
@@ -0,0 +1,389 @@
+"""
+Receptor de Webhooks da Evolution API / Evolution API Webhook Receiver
+
+PT-BR:
+Servidor HTTP assíncrono e enxuto que recebe eventos `messages.upsert` da
+Evolution API, converte cada mensagem com MessageSandeco e grava no
+armazenamento local em lotes. Com o receptor ativo, as execuções de resumo
+leem as mensagens do disco sem chamar a API.
+
+EN:
+Small asynchronous HTTP server that receives Evolution API `messages.upsert`
+events, parses each message with MessageSandeco and writes them to the local
+store in batches. With the receiver running, summary runs read messages from
+disk without calling the API.
+"""
+
+import argparse
+import asyncio
+import hmac
+import os
+import sys
+import time
+
+# Add src directory to Python path when executed as a script
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', '..', '..'))
+src_path = os.path.join(PROJECT_ROOT, 'src')
+if src_path not in sys.path:
+    sys.path.insert(0, src_path)
+
+from dotenv import load_dotenv
+
+# Local application/library imports - try relative first, fallback to absolute
+try:
+    from ...core.message_sandeco import MessageSandeco
+    from ..persistence.message_store import MessageStore
+    from ...utils import fast_json
+except ImportError:
+    from whatsapp_manager.core.message_sandeco import MessageSandeco
+    from whatsapp_manager.infrastructure.persistence.message_store import MessageStore
+    from whatsapp_manager.utils import fast_json
+
+
+class WebhookReceiver:
+    """
+    PT-BR:
+    Receptor de webhooks com gravação em lotes.
+
+    EN:
+    Webhook receiver with batched writes.
+    """
+
+    ACCEPTED_EVENTS = {"messages.upsert", "MESSAGES_UPSERT"}
+    MAX_BODY_SIZE = 50 * 1024 * 1024
+
+    def __init__(self, store, host="127.0.0.1", port=8090, batch_size=200, flush_interval=1.0, api_key=None):
+        """
+        PT-BR:
+        Inicializa o receptor.
+
+        Parâmetros:
+            store: MessageStore de destino
+            host: Endereço de escuta
+            port: Porta de escuta
+            batch_size: Mensagens por gravação
+            flush_interval: Intervalo máximo (segundos) entre gravações
+            api_key: Chave exigida nos eventos (obrigatória para iniciar o servidor HTTP)
+
+        EN:
+        Initializes the receiver.
+
+        Parameters:
+            store: Target MessageStore
+            host: Listen address
+            port: Listen port
+            batch_size: Messages per write
+            flush_interval: Maximum interval (seconds) between writes
+            api_key: Key required on events (mandatory to start the HTTP server)
+        """
+        self.store = store
+        self.host = host
+        self.port = port
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.api_key = api_key
+        self.started_at = int(time.time())
+        self.stats = {"events": 0, "ignored": 0, "rejected": 0, "messages": 0, "written": 0, "batches": 0}
+        self._buffer = []
+        self._flush_lock = asyncio.Lock()
+        self._buffer_full = None
+        self._flush_task = None
+        self._server = None
+
+    def parse_payload(self, payload):
+        """
+        PT-BR:
+        Converte um evento em mensagens. Eventos que não sejam
+        `messages.upsert` retornam lista vazia.
+
+        EN:
+        Converts an event into messages. Events other than
+        `messages.upsert` return an empty list.
+        """
+        if not isinstance(payload, dict) or payload.get("event") not in self.ACCEPTED_EVENTS:
+            return []
+        data = payload.get("data")
+        items = data if isinstance(data, list) else [data]
+        messages = []
+        for item in items:
+            if not isinstance(item, dict) or not item.get("key"):
+                continue
+            envelope = dict(payload)
+            envelope["data"] = item
+            messages.append(MessageSandeco(envelope))
+        return messages
+
+    async def ingest(self, payload):
+        """
+        PT-BR:
+        Processa um evento e coloca suas mensagens na fila de gravação.
+
+        Retorna:
+            int: Quantidade de mensagens enfileiradas
+
+        EN:
+        Processes an event and queues its messages for writing.
+
+        Returns:
+            int: Number of queued messages
+        """
+        self.stats["events"] += 1
+        messages = self.parse_payload(payload)
+        if not messages:
+            self.stats["ignored"] += 1
+            return 0
+        self.stats["messages"] += len(messages)
+        self._buffer.extend(messages)
+        if len(self._buffer) >= self.batch_size and self._buffer_full is not None:
+            self._buffer_full.set()
+        return len(messages)
+
+    def _write_batch(self, batch):
+        """
+        PT-BR:
+        Grava um lote e marca os grupos como sincronizados desde o início
+        do receptor (executado fora do loop de eventos).
+
+        EN:
+        Writes a batch and marks its groups as synchronized since the
+        receiver started (runs outside the event loop).
+        """
+        written = self.store.add_messages(batch)
+        now = int(time.time())
+        for remote_jid in {msg.remote_jid for msg in batch if msg.remote_jid}:
+            self.store.extend_coverage(remote_jid, self.started_at, now)
+        return written
+
+    async def flush(self):
+        """
+        PT-BR:
+        Grava imediatamente as mensagens pendentes. Um lote só sai do buffer
+        depois de gravado; se a gravação falhar (ex.: banco bloqueado), ele
+        continua pendente para a próxima tentativa.
+
+        EN:
+        Immediately writes pending messages. A batch only leaves the buffer
+        once written; if the write fails (e.g. database locked), it stays
+        pending for the next attempt.
+        """
+        loop = asyncio.get_running_loop()
+        async with self._flush_lock:
+            while self._buffer:
+                batch = self._buffer[:self.batch_size]
+                self.stats["written"] += await loop.run_in_executor(None, self._write_batch, batch)
+                del self._buffer[:len(batch)]
+                self.stats["batches"] += 1
+
+    async def _flush_loop(self):
+        while True:
+            try:
+                await asyncio.wait_for(self._buffer_full.wait(), timeout=self.flush_interval)
+            except asyncio.TimeoutError:
+                pass
+            self._buffer_full.clear()
+            try:
+                await self.flush()
+            except Exception as e:
+                print(f"Erro ao gravar lote de mensagens / Error writing message batch: {e}")
+
+    def _authorized(self, headers, payload):
+        if not self.api_key:
+            return False
+        expected = self.api_key.encode("utf-8")
+        candidates = (headers.get("apikey"), payload.get("apikey") if isinstance(payload, dict) else None)
+        return any(
+            isinstance(candidate, str) and hmac.compare_digest(candidate.encode("utf-8"), expected)
+            for candidate in candidates
+        )
+
+    @staticmethod
+    def _response(writer, status, body, keep_alive):
+        reason = {200: "OK", 400: "Bad Request", 401: "Unauthorized", 404: "Not Found",
+                  405: "Method Not Allowed", 413: "Payload Too Large"}.get(status, "OK")
+        data = fast_json.dumps_bytes(body)
+        writer.write(
+            f"HTTP/1.1 {status} {reason}\r\n"
+            f"Content-Type: application/json\r\n"
+            f"Content-Length: {len(data)}\r\n"
+            f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n".encode("ascii") + data
+        )
+
+    async def _handle_connection(self, reader, writer):
+        """
+        PT-BR:
+        Atende uma conexão HTTP/1.1 (com keep-alive).
+
+        EN:
+        Serves one HTTP/1.1 connection (with keep-alive).
+        """
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line:
+                    break
+                try:
+                    method, path, version = request_line.decode("latin-1").split()
+                except ValueError:
+                    break
+                headers = {}
+                while True:
+                    line = await reader.readline()
+                    if line in (b"\r\n", b"\n", b""):
+                        break
+                    name, _, value = line.decode("latin-1").partition(":")
+                    headers[name.strip().lower()] = value.strip()
+
+                keep_alive = headers.get("connection", "").lower() != "close" and version == "HTTP/1.1"
+                try:
+                    length = int(headers.get("content-length", "0") or 0)
+                except ValueError:
+                    length = -1
+                if length < 0:
+                    self.stats["rejected"] += 1
+                    self._response(writer, 400, {"status": "invalid content-length"}, False)
+                    break
+                if length > self.MAX_BODY_SIZE:
+                    self._response(writer, 413, {"status": "error"}, False)
+                    break
+                body = await reader.readexactly(length) if length else b""
+
+                if method == "GET" and path.rstrip("/") in ("", "/health"):
+                    self._response(writer, 200, {"status": "ok", **self.stats}, keep_alive)
+                elif method != "POST":
+                    self._response(writer, 405, {"status": "error"}, keep_alive)
+                elif not path.startswith("/webhook"):
+                    self._response(writer, 404, {"status": "error"}, keep_alive)
+                else:
+                    try:
+                        payload = fast_json.loads(body or b"{}")
+                    except ValueError:
+                        self.stats["rejected"] += 1
+                        self._response(writer, 400, {"status": "invalid json"}, keep_alive)
+                    else:
+                        if not self._authorized(headers, payload):
+                            self.stats["rejected"] += 1
+                            self._response(writer, 401, {"status": "unauthorized"}, keep_alive)
+                        else:
+                            queued = await self.ingest(payload)
+                            self._response(writer, 200, {"status": "ok", "queued": queued}, keep_alive)
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+    async def start(self):
+        """
+        PT-BR:
+        Inicia o servidor HTTP e a tarefa de gravação em lotes.
+        Sem api_key o servidor não inicia, para não aceitar eventos de qualquer origem.
+
+        EN:
+        Starts the HTTP server and the batch writer task.
+        Without an api_key the server does not start, so it never accepts events from anyone.
+        """
+        if not self.api_key:
+            raise ValueError("WEBHOOK_API_KEY não configurada / WEBHOOK_API_KEY is not set")
+        self._buffer_full = asyncio.Event()
+        self._flush_task = asyncio.create_task(self._flush_loop())
+        self._server = await asyncio.start_server(self._handle_connection, self.host, self.port)
+        self.port = self._server.sockets[0].getsockname()[1]
+        print(f"Receptor de webhooks escutando em / Webhook receiver listening on http://{self.host}:{self.port}/webhook")
+
+    async def stop(self):
+        """
+        PT-BR:
+        Para o servidor e grava as mensagens pendentes.
+
+        EN:
+        Stops the server and writes pending messages.
+        """
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+        if self._flush_task is not None:
+            self._flush_task.cancel()
+            try:
+                await self._flush_task
+            except asyncio.CancelledError:
+                pass
+            self._flush_task = None
+        await self.flush()
+
+    async def serve_forever(self):
+        await self.start()
+        try:
+            await self._server.serve_forever()
+        finally:
+            await self.stop()
+
+    async def replay(self, payloads):
+        """
+        PT-BR:
+        Modo de teste: processa eventos gravados pelo mesmo caminho usado
+        pelo servidor, sem rede, e mede a vazão da ingestão.
+
+        Parâmetros:
+            payloads: Iterável de eventos (dicts) gravados
+
+        Retorna:
+            dict: Estatísticas, incluindo mensagens por segundo
+
+        EN:
+        Test mode: processes recorded events through the same path used by
+        the server, without network, and measures ingestion throughput.
+
+        Parameters:
+            payloads: Iterable of recorded events (dicts)
+
+        Returns:
+            dict: Statistics, including messages per second
+        """
+        started = time.perf_counter()
+        for payload in payloads:
+            await self.ingest(payload)
+            if len(self._buffer) >= self.batch_size:
+                await self.flush()
+        await self.flush()
+        elapsed = time.perf_counter() - started
+        return {
+            **self.stats,
+            "seconds": round(elapsed, 4),
+            "messages_per_second": round(self.stats["written"] / elapsed, 1) if elapsed > 0 else None,
+        }
+
+
+def main():
+    load_dotenv(os.path.join(PROJECT_ROOT, '.env'), override=True)
+    parser = argparse.ArgumentParser(description="Evolution API webhook receiver / Receptor de webhooks da Evolution API")
+    parser.add_argument("--host", default=os.getenv("WEBHOOK_HOST", "127.0.0.1"))
+    parser.add_argument("--port", type=int, default=int(os.getenv("WEBHOOK_PORT", "8090")))
+    parser.add_argument("--batch-size", type=int, default=int(os.getenv("WEBHOOK_BATCH_SIZE", "200")))
+    parser.add_argument("--flush-interval", type=float, default=float(os.getenv("WEBHOOK_FLUSH_INTERVAL", "1.0")))
+    args = parser.parse_args()
+
+    api_key = os.getenv("WEBHOOK_API_KEY", "").strip()
+    if not api_key:
+        print("WEBHOOK_API_KEY não configurada; receptor não iniciado / WEBHOOK_API_KEY is not set; receiver not started")
+        sys.exit(1)
+
+    store = MessageStore(os.getenv("MESSAGE_STORE_PATH", os.path.join(PROJECT_ROOT, "data", "messages.db")))
+    receiver = WebhookReceiver(
+        store,
+        host=args.host,
+        port=args.port,
+        batch_size=args.batch_size,
+        flush_interval=args.flush_interval,
+        api_key=api_key,
+    )
+    try:
+        asyncio.run(receiver.serve_forever())
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
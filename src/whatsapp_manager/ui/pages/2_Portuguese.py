@@ -42,6 +42,7 @@ from whatsapp_manager.core.group_controller import GroupController
 from whatsapp_manager.utils.groups_util import GroupUtils
 from whatsapp_manager.utils.task_scheduler import TaskScheduled
 from whatsapp_manager.core.send_sandeco import SendSandeco
+from whatsapp_manager.infrastructure.persistence.settings_store import get_settings_store
 
 
 # --- Light Theme CSS ---
@@ -156,7 +157,7 @@ elif mode == "online":
 def load_scheduled_groups():
     csv_path = os.path.join(PROJECT_ROOT, "data", "group_summary.csv")
     try:
-        df = pd.read_csv(csv_path)
+        df = get_settings_store(csv_path).load()
         return df[df['enabled'] == True]
     except FileNotFoundError:
         st.warning(f"Arquivo group_summary.csv não encontrado em {csv_path}")
@@ -169,7 +170,8 @@ def load_scheduled_groups():
 def delete_scheduled_group(group_id):
     csv_path = os.path.join(PROJECT_ROOT, "data", "group_summary.csv")
     try:
-        df = pd.read_csv(csv_path)
+        settings_store = get_settings_store(csv_path)
+        df = settings_store.load()
         if group_id not in df['group_id'].values:
             st.error(f"Grupo com ID {group_id} não encontrado!")
             return False
@@ -179,8 +181,7 @@ def delete_scheduled_group(group_id):
             st.success(f"Tarefa {task_name} removida do sistema")
         except Exception as e:
             st.warning(f"Aviso: Não foi possível remover a tarefa: {e}")
-        df = df[df['group_id'] != group_id]
-        df.to_csv(csv_path, index=False)
+        settings_store.delete(group_id)
         st.success("Grupo removido do arquivo de configuração")
         return True
     except FileNotFoundError:
@@ -39,6 +39,7 @@ from whatsapp_manager.core.group_controller import GroupController
 from whatsapp_manager.utils.groups_util import GroupUtils
 from whatsapp_manager.utils.task_scheduler import TaskScheduled
 from whatsapp_manager.core.send_sandeco import SendSandeco
+from whatsapp_manager.infrastructure.persistence.settings_store import get_settings_store
 
 
 # --- Light Theme CSS ---
@@ -154,7 +155,7 @@ elif mode == "online":
 def load_scheduled_groups():
     csv_path = os.path.join(PROJECT_ROOT, "data", "group_summary.csv")
     try:
-        df = pd.read_csv(csv_path)
+        df = get_settings_store(csv_path).load()
         return df[df['enabled'] == True]
     except FileNotFoundError:
         st.warning(f"group_summary.csv not found at {csv_path}")
@@ -167,7 +168,8 @@ def load_scheduled_groups():
 def delete_scheduled_group(group_id):
     csv_path = os.path.join(PROJECT_ROOT, "data", "group_summary.csv")
     try:
-        df = pd.read_csv(csv_path)
+        settings_store = get_settings_store(csv_path)
+        df = settings_store.load()
         if group_id not in df['group_id'].values:
             st.error(f"Group ID {group_id} not found!")
             return False
@@ -177,8 +179,7 @@ def delete_scheduled_group(group_id):
             st.success(f"Task {task_name} removed from system")
         except Exception as e:
             st.warning(f"Warning: Could not remove task: {e}")
-        df = df[df['group_id'] != group_id]
-        df.to_csv(csv_path, index=False)
+        settings_store.delete(group_id)
         st.success("Group removed from configuration file")
         return True
     except FileNotFoundError:
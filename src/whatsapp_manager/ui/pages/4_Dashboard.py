@@ -2,7 +2,7 @@ import calendar
 from datetime import datetime
 from datetime import timedelta
 import os
-import re
+import sys
 
 # Third-party library imports
 import pandas as pd
@@ -60,107 +60,48 @@ st.markdown('<h1 class="main-header">📊 WhatsApp Group Summary Analytics Dashb
 
 # Define Project Root assuming this file is src/whatsapp_manager/ui/pages/4_Dashboard.py
 PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', '..', '..'))
-LOG_FILE_PATH = os.path.join(PROJECT_ROOT, "data", "log_summary.txt")
+src_path = os.path.join(PROJECT_ROOT, 'src')
+if src_path not in sys.path:
+    sys.path.insert(0, src_path)
 
-def parse_log_entries(log_content):
-    """
-    Parses the log content which may contain multiple entries per line.
-    Splits each line into individual log entries and parses them.
-    """
-    log_entries = []
-    
-    # First, try to split multiple entries that might be on a single line
-    # We know each entry starts with a timestamp pattern like [YYYY-MM-DD HH:MM:SS.ffffff]
-    entry_pattern = r"(\[\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}\.\d+\].*?)(?=\[\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}\.\d+\]|$)"
-    
-    for line in log_content.strip().split('\n'):
-        if line.startswith('//'):  # Skip comment lines
-            continue
-            
-        entries = re.findall(entry_pattern, line)
-        for entry in entries:
-            parsed_entry = parse_log_line(entry.strip())
-            if parsed_entry:
-                log_entries.append(parsed_entry)
-    
-    return log_entries
+from whatsapp_manager.infrastructure.persistence.summary_events import IncrementalEventReader
+from whatsapp_manager.infrastructure.persistence.summary_rollups import SummaryRollupStore
 
-def parse_log_line(line):
-    """Parses a single log entry."""
-    match = re.match(r"\[(.*?)\] \[(.*?)\] \[(.*?)\] \[(.*?)\] - Mensagem: (.*)", line)
-    if match:
-        timestamp_str, level, group_info, group_id_info, message = match.groups()
-        timestamp = datetime.strptime(timestamp_str, '%Y-%m-%d %H:%M:%S.%f')
-        
-        group_name_match = re.search(r"GRUPO: (.*?)$", group_info)
-        group_name = group_name_match.group(1).strip() if group_name_match else "N/A"
-        
-        group_id_match = re.search(r"GROUP_ID: (.*?@g\.us)$", group_id_info)
-        group_id = group_id_match.group(1).strip() if group_id_match else "N/A"
+EVENTS_FILE_PATH = os.getenv("SUMMARY_EVENTS_PATH", os.path.join(PROJECT_ROOT, "data", "summary_events.jsonl"))
+ROLLUPS_DB_PATH = os.getenv("SUMMARY_ROLLUPS_PATH", os.path.join(PROJECT_ROOT, "data", "summary_rollups.db"))
 
-        # Improved send type detection with more specific patterns
-        send_type = "Unknown"
-        if "enviado com sucesso para grupo e número pessoal" in message:
-            send_type = "Group & Personal"
-        elif "enviado com sucesso para número pessoal" in message:
-            send_type = "Personal"
-        elif "enviado com sucesso" in message: 
-            send_type = "Group"
-             
-        # Extract message success status
-        success = True if "sucesso" in message else False
-        
-        # Extract date components for filtering and grouping
-        date = timestamp.date()
-        hour = timestamp.hour
-        day_of_week = timestamp.strftime('%A')
-        week_number = timestamp.isocalendar()[1]
-        month = timestamp.strftime('%B')
-        
-        return {
-            "Timestamp": timestamp,
-            "Date": date,
-            "Hour": hour,
-            "Day of Week": day_of_week,
-            "Week Number": week_number,
-            "Month": month,
-            "Level": level,
-            "Group Name": group_name,
-            "Group ID": group_id,
-            "Send Type": send_type,
-            "Success": success,
-            "Message": message
-        }
-    return None
+@st.cache_resource
+def get_event_reader(events_file):
+    """Process-wide tail-follow reader: reruns only parse lines appended since the last read."""
+    return IncrementalEventReader(events_file)
 
-def load_log_data(log_file):
-    """Loads and parses the log file."""
-    logs = []
-    try:
-        with open(log_file, 'r') as f:
-            log_content = f.read()
-            logs = parse_log_entries(log_content)
-    except FileNotFoundError:
-        st.error(f"Log file not found at: {log_file}")
+@st.cache_resource
+def get_rollup_store(db_path):
+    """Persistent rollups (day x hour x group x send type) queried by the charts."""
+    return SummaryRollupStore(db_path)
+
+def load_rollups(events_file, **filters):
+    """Adds newly appended events to the rollups, then returns the filtered rollup rows."""
+    store = get_rollup_store(ROLLUPS_DB_PATH)
+    store.update(events_file)
+    return store.load(**filters)
+
+def load_log_data(events_file):
+    """Loads the structured summary events (JSON lines) into the dashboard columns."""
+    if not os.path.exists(events_file):
+        st.error(f"Events file not found at: {events_file}")
         return pd.DataFrame()
+    try:
+        df = get_event_reader(events_file).refresh()
     except Exception as e:
-        st.error(f"Error reading log file: {e}")
+        st.error(f"Error reading events file: {e}")
         return pd.DataFrame()
-        
-    if not logs:
-        st.warning("No log entries found or failed to parse.")
-        return pd.DataFrame()
-        
-    df = pd.DataFrame(logs)
-    
-    # Convert date columns to proper types for filtering
-    df['Date'] = pd.to_datetime(df['Date'])
-    
-    # Sort by timestamp in descending order (newest first)
-    df = df.sort_values(by="Timestamp", ascending=False)
+
+    if df.empty:
+        st.warning("No summary events found.")
     return df
 
-log_df = load_log_data(LOG_FILE_PATH)
+log_df = load_log_data(EVENTS_FILE_PATH)
 
 if not log_df.empty:
     # Create tabs for different dashboard views
@@ -169,9 +110,12 @@ if not log_df.empty:
     # Add sidebar for filtering
     st.sidebar.header("📊 Filtros de Dados")
     
+    # Filter options come from the (small) unfiltered rollups
+    all_rollups = load_rollups(EVENTS_FILE_PATH)
+    
     # Date range filter
-    min_date = log_df['Date'].min().date()
-    max_date = log_df['Date'].max().date()
+    min_date = all_rollups['Date'].min().date()
+    max_date = all_rollups['Date'].max().date()
     
     date_range = st.sidebar.date_input(
         "Filtrar por Período",
@@ -186,22 +130,39 @@ if not log_df.empty:
         start_date = pd.to_datetime(start_date)
         end_date = pd.to_datetime(end_date) + timedelta(days=1)  # Include the end date
         filtered_df = log_df[(log_df['Date'] >= start_date) & (log_df['Date'] < end_date)]
+        rollup_filters = {
+            "start_date": start_date.strftime('%Y-%m-%d'),
+            "end_date": (end_date - timedelta(days=1)).strftime('%Y-%m-%d'),
+        }
     else:
+        start_date = pd.to_datetime(min_date)
+        end_date = pd.to_datetime(max_date) + timedelta(days=1)
         filtered_df = log_df
+        rollup_filters = {}
     
     # Group filter
-    all_groups = ["Todos"] + sorted(log_df['Group Name'].unique().tolist())
+    all_groups = ["Todos"] + sorted(all_rollups['Group Name'].unique().tolist())
     selected_group = st.sidebar.selectbox("Filtrar por Grupo", all_groups)
     
     if selected_group != "Todos":
         filtered_df = filtered_df[filtered_df['Group Name'] == selected_group]
+        rollup_filters["group_name"] = selected_group
     
     # Send type filter
-    send_types = ["Todos"] + sorted(log_df['Send Type'].unique().tolist())
+    send_types = ["Todos"] + sorted(all_rollups['Send Type'].unique().tolist())
     selected_send_type = st.sidebar.selectbox("Filtrar por Tipo de Envio", send_types)
     
     if selected_send_type != "Todos":
         filtered_df = filtered_df[filtered_df['Send Type'] == selected_send_type]
+        rollup_filters["send_type"] = selected_send_type
+    
+    # Charts and metrics read the pre-aggregated rollups (one row per day x hour x group x send type)
+    rollup_df = load_rollups(EVENTS_FILE_PATH, **rollup_filters)
+    total_summaries = int(rollup_df['Count'].sum())
+    
+    def count_by(keys):
+        """Summaries per key(s), from the rollups."""
+        return rollup_df.groupby(keys)['Count'].sum()
     
     # Show filter summary
     st.sidebar.markdown("---")
@@ -213,17 +174,17 @@ if not log_df.empty:
     # Display stats in the sidebar
     st.sidebar.markdown("---")
     st.sidebar.header("📈 Estatísticas")
-    st.sidebar.metric("Total de Registros", len(filtered_df))
-    st.sidebar.metric("Total de Grupos", filtered_df['Group Name'].nunique())
+    st.sidebar.metric("Total de Registros", total_summaries)
+    st.sidebar.metric("Total de Grupos", rollup_df['Group Name'].nunique())
     
     # Calculate success rate
-    if 'Success' in filtered_df.columns:
-        success_rate = (filtered_df['Success'].sum() / len(filtered_df) * 100) if len(filtered_df) > 0 else 0
-        st.sidebar.metric("Taxa de Sucesso", f"{success_rate:.1f}%")
+    success_count = rollup_df.loc[rollup_df['Success'], 'Count'].sum()
+    success_rate = (success_count / total_summaries * 100) if total_summaries > 0 else 0
+    st.sidebar.metric("Taxa de Sucesso", f"{success_rate:.1f}%")
     
     # Calculate date range stats
-    if len(filtered_df) > 0:
-        date_range_days = (filtered_df['Date'].max() - filtered_df['Date'].min()).days + 1
+    if total_summaries > 0:
+        date_range_days = (rollup_df['Date'].max() - rollup_df['Date'].min()).days + 1
         st.sidebar.metric("Período de Atividade", f"{date_range_days} dias")
 
     # TAB 1 - OVERVIEW
@@ -233,32 +194,31 @@ if not log_df.empty:
         # KPI metrics in a row of 4 columns
         col1, col2, col3, col4 = st.columns(4)
         
-        total_summaries = len(filtered_df)
         col1.metric("Total de Resumos", total_summaries)
         
-        unique_groups = filtered_df['Group Name'].nunique()
+        unique_groups = rollup_df['Group Name'].nunique()
         col2.metric("Grupos Únicos", unique_groups)
 
-        send_type_counts = filtered_df['Send Type'].value_counts()
+        send_type_counts = count_by('Send Type').sort_values(ascending=False)
         most_common_send_type = send_type_counts.index[0] if not send_type_counts.empty else "N/A"
         most_common_count = send_type_counts.iloc[0] if not send_type_counts.empty else 0
         col3.metric("Tipo de Envio Mais Comum", most_common_send_type, f"{most_common_count} vezes")
         
         # Most active group
-        if not filtered_df.empty:
-            group_counts = filtered_df['Group Name'].value_counts()
+        if total_summaries > 0:
+            group_counts = count_by('Group Name').sort_values(ascending=False)
             most_active_group = group_counts.index[0]
             most_active_count = group_counts.iloc[0]
             col4.metric("Grupo Mais Ativo", most_active_group, f"{most_active_count} resumos")
         
         # Calculate additional metrics
-        if len(filtered_df) > 0:
+        if total_summaries > 0:
             # Get date range
-            date_range = (filtered_df['Date'].max() - filtered_df['Date'].min()).days + 1
-            avg_per_day = len(filtered_df) / date_range if date_range > 0 else 0
+            date_range = (rollup_df['Date'].max() - rollup_df['Date'].min()).days + 1
+            avg_per_day = total_summaries / date_range if date_range > 0 else 0
             
             # Peak day identification
-            day_counts = filtered_df.groupby(filtered_df['Date'].dt.date).size()
+            day_counts = count_by('Date')
             peak_day = day_counts.idxmax() if not day_counts.empty else None
             peak_count = day_counts.max() if not day_counts.empty else 0
             
@@ -271,27 +231,23 @@ if not log_df.empty:
                 col2.metric("Dia com Mais Atividade", peak_day.strftime('%d/%m/%Y'), f"{peak_count} resumos")
             
             # Peak hour
-            hour_counts = filtered_df['Hour'].value_counts()
+            hour_counts = count_by('Hour')
             peak_hour = hour_counts.idxmax() if not hour_counts.empty else 0
             peak_hour_count = hour_counts.max() if not hour_counts.empty else 0
             col3.metric("Hora com Mais Atividade", f"{peak_hour}:00", f"{peak_hour_count} resumos")
             
             # Personal vs Group comparison
-            personal_count = len(filtered_df[filtered_df['Send Type'].isin(['Personal', 'Group & Personal'])])
-            group_count = len(filtered_df[filtered_df['Send Type'].isin(['Group', 'Group & Personal'])])
-            personal_pct = personal_count / len(filtered_df) * 100
+            personal_count = rollup_df.loc[rollup_df['Send Type'].isin(['Personal', 'Group & Personal']), 'Count'].sum()
+            personal_pct = personal_count / total_summaries * 100
             col4.metric("Envios Pessoais", f"{personal_count}", f"{personal_pct:.1f}% do total")
         
         # Show activity timeline - summaries per day
         st.subheader("📅 Cronograma de Atividades")
         
         # Group by date and count
-        timeline_data = filtered_df.groupby(filtered_df['Date'].dt.date).size().reset_index(name='Count')
+        timeline_data = count_by('Date').reset_index()
         timeline_data.columns = ['Date', 'Summaries']
         
-        # Convert back to datetime for charting
-        timeline_data['Date'] = pd.to_datetime(timeline_data['Date'])
-        
         # Create a better timeline with Plotly
         fig = px.line(timeline_data, x='Date', y='Summaries', markers=True,
                      title='Resumos por Dia')
@@ -307,7 +263,7 @@ if not log_df.empty:
         
         with col1:
             st.subheader("🔄 Resumos por Grupo")
-            group_counts = filtered_df['Group Name'].value_counts().reset_index()
+            group_counts = count_by('Group Name').sort_values(ascending=False).reset_index()
             group_counts.columns = ['Group', 'Count']
             
             fig = px.bar(group_counts, x='Group', y='Count', 
@@ -318,7 +274,7 @@ if not log_df.empty:
         
         with col2:
             st.subheader("📤 Distribuição por Tipo de Envio")
-            send_counts = filtered_df['Send Type'].value_counts().reset_index()
+            send_counts = send_type_counts.reset_index()
             send_counts.columns = ['Type', 'Count']
             
             fig = px.pie(send_counts, values='Count', names='Type', 
@@ -342,36 +298,19 @@ if not log_df.empty:
     
     with col1:
         st.subheader("Atividade por Dia da Semana")
-        dow_counts = filtered_df['Day of Week'].value_counts().reset_index()
-        dow_counts.columns = ['Day', 'Count']
         # Define correct order of days
         dow_order = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday']
-        # Map Portuguese day names if needed
-        dow_map = {
-            'Monday': 'Segunda',
-            'Tuesday': 'Terça',
-            'Wednesday': 'Quarta',
-            'Thursday': 'Quinta',
-            'Friday': 'Sexta',
-            'Saturday': 'Sábado',
-            'Sunday': 'Domingo'
-        }
-        # Create ordered series for chart
+        dow_counts = rollup_df.groupby(rollup_df['Date'].dt.day_name())['Count'].sum()
         ordered_dow = pd.DataFrame({
             'Day': dow_order,
-            'Count': [dow_counts[dow_counts['Day'] == day]['Count'].sum() 
-                      if day in dow_counts['Day'].values else 0 
-                      for day in dow_order]
+            'Count': dow_counts.reindex(dow_order, fill_value=0).values
         })
-        # Map day names if in Portuguese
-        if 'Segunda' in dow_counts['Day'].values:
-            ordered_dow['Day'] = ordered_dow['Day'].map(dow_map)
         
         st.bar_chart(ordered_dow.set_index('Day'))
     
     with col2:
         st.subheader("Atividade por Hora do Dia")
-        hour_counts = filtered_df['Hour'].value_counts().reset_index()
+        hour_counts = count_by('Hour').reset_index()
         hour_counts.columns = ['Hour', 'Count']
         # Sort by hour
         hour_counts = hour_counts.sort_values('Hour')
@@ -380,20 +319,13 @@ if not log_df.empty:
     # Activity heatmap by day and hour
     st.subheader("Heatmap de Atividade: Dia da Semana x Hora")
     
-    # Create temp df for heatmap
-    heatmap_df = filtered_df.copy()
-    
-    # Extract day of week and hour
-    heatmap_df['Day of Week Num'] = heatmap_df['Timestamp'].dt.dayofweek
-    heatmap_df['Hour'] = heatmap_df['Timestamp'].dt.hour
-    
     # Create a pivot table for the heatmap
     day_hour_pivot = pd.pivot_table(
-        heatmap_df, 
-        values='Group ID',
+        rollup_df.assign(**{'Day of Week Num': rollup_df['Date'].dt.dayofweek}),
+        values='Count',
         index='Day of Week Num', 
         columns='Hour', 
-        aggfunc='count',
+        aggfunc='sum',
         fill_value=0
     )
     
@@ -421,19 +353,18 @@ if not log_df.empty:
     st.header("👥 Estatísticas Detalhadas por Grupo")
     
     # Create a dataframe with group statistics
-    group_stats = filtered_df.groupby('Group Name').agg({
-        'Timestamp': ['count', 'max', 'min'],
-        'Send Type': lambda x: x.value_counts().index[0] if len(x) > 0 else 'N/A'
+    group_stats = rollup_df.groupby('Group Name').agg(**{
+        'Total Summaries': ('Count', 'sum'),
+        'Last Activity': ('Last Activity', 'max'),
+        'First Activity': ('First Activity', 'min'),
     })
-    
-    # Flatten multi-level columns
-    group_stats.columns = ['Total Summaries', 'Last Activity', 'First Activity', 'Most Common Send Type']
+    group_send_counts = count_by(['Group Name', 'Send Type']).reset_index()
+    group_send_counts = group_send_counts.sort_values('Count', ascending=False).drop_duplicates('Group Name')
+    group_stats['Most Common Send Type'] = group_send_counts.set_index('Group Name')['Send Type']
     group_stats = group_stats.reset_index()
     
     # Add a column for activity days
-    group_stats['Activity Days'] = group_stats.apply(
-        lambda row: (row['Last Activity'] - row['First Activity']).days + 1, axis=1
-    )
+    group_stats['Activity Days'] = (group_stats['Last Activity'] - group_stats['First Activity']).dt.days + 1
     
     # Add a column for average summaries per day
     group_stats['Avg Summaries/Day'] = group_stats['Total Summaries'] / group_stats['Activity Days']
@@ -453,13 +384,9 @@ if not log_df.empty:
     # Monthly activity heatmap 
     st.header("📆 Heatmap de Atividade Mensal")
     
-    # Create a DataFrame for heatmap (group by month and day)
-    heatmap_df = filtered_df.copy()
-    heatmap_df['Month'] = heatmap_df['Timestamp'].dt.month
-    heatmap_df['Day'] = heatmap_df['Timestamp'].dt.day
-    
     # Count occurrences for each month/day combination
-    heatmap_data = heatmap_df.groupby(['Month', 'Day']).size().reset_index(name='Count')
+    heatmap_data = rollup_df.groupby([rollup_df['Date'].dt.month.rename('Month'),
+                                      rollup_df['Date'].dt.day.rename('Day')])['Count'].sum().reset_index()
     
     # Pivot the data for the heatmap
     pivot_table = heatmap_data.pivot(index='Day', columns='Month', values='Count').fillna(0)
@@ -475,8 +402,8 @@ if not log_df.empty:
     st.header("🔍 Análise de Eficiência e Engajamento")
     
     # Calculate overall statistics
-    total_days = (filtered_df['Timestamp'].max() - filtered_df['Timestamp'].min()).days + 1
-    avg_summaries_per_day = len(filtered_df) / total_days if total_days > 0 else 0
+    total_days = (rollup_df['Last Activity'].max() - rollup_df['First Activity'].min()).days + 1 if total_summaries else 0
+    avg_summaries_per_day = total_summaries / total_days if total_days > 0 else 0
     
     # Create columns for metrics
     col1, col2, col3, col4 = st.columns(4)
@@ -485,14 +412,14 @@ if not log_df.empty:
     col2.metric("Média de Resumos/Dia", f"{avg_summaries_per_day:.2f}")
     
     # Group with highest engagement (most consistent activity)
-    if not filtered_df.empty and len(filtered_df['Group Name'].unique()) > 1:
+    if total_summaries > 0 and rollup_df['Group Name'].nunique() > 1:
         # Get days with activity per group
-        group_days = filtered_df.groupby('Group Name')['Date'].nunique()
+        group_days = rollup_df.groupby('Group Name')['Date'].nunique()
         most_consistent_group = group_days.idxmax()
         most_consistent_days = group_days.max()
         
         # Get group with most varied send types (uses both personal and group)
-        send_type_variety = filtered_df.groupby('Group Name')['Send Type'].nunique()
+        send_type_variety = rollup_df.groupby('Group Name')['Send Type'].nunique()
         most_varied_group = send_type_variety.idxmax()
         most_varied_count = send_type_variety.max()
         
@@ -503,9 +430,7 @@ if not log_df.empty:
     st.subheader("📈 Tendência de Crescimento")
     
     # Group data by month for trend analysis
-    trend_df = filtered_df.copy()
-    trend_df['Year-Month'] = trend_df['Timestamp'].dt.strftime('%Y-%m')
-    monthly_counts = trend_df.groupby('Year-Month').size().reset_index(name='Count')
+    monthly_counts = rollup_df.groupby(rollup_df['Date'].dt.strftime('%Y-%m').rename('Year-Month'))['Count'].sum().reset_index()
     
     # Calculate growth metrics
     if len(monthly_counts) > 1:
@@ -0,0 +1,126 @@
+"""
+Detecção de Ambiente / Environment Detection
+
+PT-BR:
+Detecta uma única vez por processo se o código está rodando dentro de um
+contêiner Docker e guarda o resultado. A variável DOCKER_ENV força o resultado
+(true/false) sem nenhuma verificação no sistema; sem ela, os indicadores são
+testados na primeira chamada e uma única linha é gravada em
+docker_detection.log com o resultado e o motivo.
+
+EN:
+Detects once per process whether the code is running inside a Docker
+container and caches the result. The DOCKER_ENV variable forces the result
+(true/false) without probing the system; without it, the indicators are
+checked on the first call and a single line with the result and the reason
+is written to docker_detection.log.
+"""
+
+import os
+import subprocess
+import threading
+from datetime import datetime
+
+_TRUE_VALUES = ("1", "true", "yes", "on")
+_FALSE_VALUES = ("0", "false", "no", "off")
+
+_docker_lock = threading.Lock()
+_docker_result = None
+
+
+def _log_detection(result, reason):
+    log_dir = "/app/data" if os.path.exists("/app/data") else "/tmp"
+    try:
+        with open(os.path.join(log_dir, "docker_detection.log"), "a") as log_file:
+            log_file.write(f"[{datetime.now()}] pid={os.getpid()} docker={result} ({reason})\n")
+    except OSError:
+        pass  # Falhar silenciosamente se não conseguir logar / Fail silently if logging is not possible
+
+
+def _read(path):
+    try:
+        with open(path, "r") as f:
+            return f.read()
+    except OSError:
+        return ""
+
+
+def _probe_docker():
+    """
+    PT-BR:
+    Testa os indicadores de contêiner, do mais barato ao mais caro.
+
+    Retorna:
+        tuple: (resultado, motivo)
+
+    EN:
+    Checks the container indicators, cheapest first.
+
+    Returns:
+        tuple: (result, reason)
+    """
+    if os.path.exists("/.dockerenv"):
+        return True, "/.dockerenv exists"
+    cgroup = _read("/proc/1/cgroup")
+    if "docker" in cgroup or "containerd" in cgroup:
+        return True, "/proc/1/cgroup"
+    hostname = _read("/etc/hostname").strip()
+    if hostname.startswith("container") or hostname.startswith("docker"):
+        return True, f"hostname {hostname}"
+    if os.path.exists("/app/.docker_environment"):
+        return True, "/app/.docker_environment exists"
+    if all(os.path.exists(path) for path in ("/app", "/app/src", "/app/data")):
+        return True, "Docker-like directory structure"
+    try:
+        result = subprocess.run(["ps", "aux"], capture_output=True, text=True)
+        if "supervisord" in result.stdout:
+            return True, "supervisord running"
+    except Exception as e:
+        return False, f"error checking supervisord: {e}"
+    return False, "no Docker indicator found"
+
+
+def is_running_in_docker():
+    """
+    PT-BR:
+    Indica se o código está rodando dentro de um contêiner Docker.
+    O resultado é calculado uma vez e reutilizado pelo processo.
+
+    Retorna:
+        bool: True se estiver rodando no Docker, False caso contrário
+
+    EN:
+    Tells whether the code is running inside a Docker container.
+    The result is computed once and reused by the process.
+
+    Returns:
+        bool: True if running in Docker, False otherwise
+    """
+    global _docker_result
+    if _docker_result is not None:
+        return _docker_result
+    with _docker_lock:
+        if _docker_result is None:
+            override = os.environ.get("DOCKER_ENV", "").strip().lower()
+            if override in _TRUE_VALUES:
+                result, reason = True, f"DOCKER_ENV={override}"
+            elif override in _FALSE_VALUES:
+                result, reason = False, f"DOCKER_ENV={override}"
+            else:
+                result, reason = _probe_docker()
+            _log_detection(result, reason)
+            _docker_result = result
+    return _docker_result
+
+
+def reset_environment_cache():
+    """
+    PT-BR:
+    Descarta o resultado em cache (usado em testes ou após mudar DOCKER_ENV).
+
+    EN:
+    Drops the cached result (used in tests or after changing DOCKER_ENV).
+    """
+    global _docker_result
+    with _docker_lock:
+        _docker_result = None
@@ -0,0 +1,124 @@
+"""
+Serialização JSON Rápida / Fast JSON Serialization
+
+PT-BR:
+Camada fina sobre o backend JSON mais rápido disponível (orjson ou msgspec),
+com fallback para o módulo json da biblioteca padrão. Usada no cache de
+grupos, nos registros de mensagens gravados em disco e no webhook.
+O backend pode ser forçado com JSON_BACKEND=json|orjson|msgspec.
+
+EN:
+Thin layer over the fastest available JSON backend (orjson or msgspec),
+falling back to the standard library json module. Used for the groups
+cache, message records stored on disk and the webhook.
+The backend can be forced with JSON_BACKEND=json|orjson|msgspec.
+"""
+
+import json
+import os
+import threading
+
+
+def _select_backend(preferred):
+    candidates = ["orjson", "msgspec"] if preferred in ("", "auto") else [preferred]
+    for name in candidates:
+        if name == "json":
+            break
+        try:
+            if name == "orjson":
+                import orjson
+                return name, orjson.loads, orjson.dumps
+            if name == "msgspec":
+                import msgspec
+                encoder = msgspec.json.Encoder()
+                decoder = msgspec.json.Decoder()
+                return name, decoder.decode, encoder.encode
+        except ImportError:
+            continue
+    return "json", json.loads, None
+
+
+BACKEND, _loads, _dumps = _select_backend(os.getenv("JSON_BACKEND", "auto").strip().lower())
+
+
+def loads(data):
+    """
+    PT-BR:
+    Decodifica JSON a partir de str ou bytes.
+
+    EN:
+    Decodes JSON from str or bytes.
+    """
+    if BACKEND == "msgspec" and isinstance(data, str):
+        data = data.encode("utf-8")
+    try:
+        return _loads(data)
+    except ValueError:
+        raise
+    except Exception as e:
+        # Erros de decodificação sempre como ValueError / Decode errors always as ValueError
+        raise ValueError(str(e)) from e
+
+
+def dumps_bytes(obj):
+    """
+    PT-BR:
+    Codifica em JSON compacto (bytes UTF-8). Tipos não suportados pelo backend
+    rápido (ex.: chaves não-string) caem para o json da biblioteca padrão.
+
+    EN:
+    Encodes as compact JSON (UTF-8 bytes). Types the fast backend does not
+    support (e.g. non-string keys) fall back to the standard library json.
+    """
+    if _dumps is not None:
+        try:
+            return _dumps(obj)
+        except TypeError:
+            pass
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False, default=str).encode("utf-8")
+
+
+def dumps(obj):
+    """
+    PT-BR:
+    Codifica em JSON compacto (str).
+
+    EN:
+    Encodes as compact JSON (str).
+    """
+    return dumps_bytes(obj).decode("utf-8")
+
+
+def load_file(path):
+    """
+    PT-BR:
+    Lê e decodifica um arquivo JSON.
+
+    EN:
+    Reads and decodes a JSON file.
+    """
+    with open(path, "rb") as f:
+        return loads(f.read())
+
+
+def dump_file(path, obj):
+    """
+    PT-BR:
+    Grava um arquivo JSON de forma atômica (arquivo temporário + rename).
+    Cada gravação usa seu próprio arquivo temporário, então gravações
+    concorrentes não sobrescrevem o temporário uma da outra.
+
+    EN:
+    Writes a JSON file atomically (temporary file + rename).
+    Each write uses its own temporary file, so concurrent writers never
+    clobber each other's temporary file.
+    """
+    tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    try:
+        with open(tmp_path, "wb") as f:
+            f.write(dumps_bytes(obj))
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+        raise
@@ -4,19 +4,153 @@ Sistema de Logging Centralizado / Centralized Logging System
 PT-BR:
 Sistema de logging robusto para monitorar o funcionamento do sistema,
 especialmente útil para debugging em ambiente Docker.
+Os loggers apenas enfileiram os registros (QueueHandler); uma única thread
+(QueueListener) grava no console e nos arquivos de data/logs. Assim, envio e
+busca de mensagens nunca esperam por disco.
+
+Vários processos (worker, tarefas do cron, Streamlit) escrevem nos mesmos
+arquivos, então por padrão (LOG_ROTATION=external) eles são abertos com
+WatchedFileHandler e a rotação fica a cargo de um logrotate externo: cada
+processo reabre o arquivo quando ele é trocado. A rotação interna por tamanho
+(size) ou por tempo (time) só é segura quando um único processo grava o arquivo.
 
 EN:
 Robust logging system to monitor system operation,
 especially useful for debugging in Docker environment.
+Loggers only enqueue records (QueueHandler); a single thread (QueueListener)
+writes to the console and to the data/logs files. Sending and fetching
+messages therefore never wait on disk I/O.
+
+Several processes (worker, cron tasks, Streamlit) write to the same files, so
+by default (LOG_ROTATION=external) they are opened with WatchedFileHandler and
+rotation is left to an external logrotate: each process reopens the file once
+it is swapped. In-process size or time rotation is only safe when a single
+process writes the file.
 """
 
+import atexit
 import logging
+import logging.handlers
 import os
+import queue
 import sys
+import threading
 from datetime import datetime
 from pathlib import Path
 from typing import Optional
 
+FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(filename)s:%(lineno)d - %(message)s'
+DATE_FORMAT = '%Y-%m-%d %H:%M:%S'
+
+
+class _RoutingHandler(logging.Handler):
+    """
+    PT-BR:
+    Handler usado pelo QueueListener: entrega cada registro aos handlers
+    cadastrados para o nome do logger de origem.
+
+    EN:
+    Handler used by the QueueListener: delivers each record to the handlers
+    registered for its source logger name.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.routes = {}
+
+    def handle(self, record):
+        for handler in self.routes.get(record.name, ()):
+            if record.levelno >= handler.level:
+                handler.handle(record)
+        return True
+
+    def emit(self, record):
+        pass
+
+
+_pipeline_lock = threading.Lock()
+# Uma única fila por processo: os QueueHandler continuam válidos mesmo após reiniciar a thread
+# A single queue per process: QueueHandlers stay valid even after the thread restarts
+_queue = queue.SimpleQueue()
+_listener = None
+_router = _RoutingHandler()
+_file_handlers = {}
+_console_handler = None
+
+
+def _start_pipeline():
+    global _listener
+    if _listener is None:
+        _listener = logging.handlers.QueueListener(_queue, _router)
+        _listener.start()
+    return _queue
+
+
+def _new_file_handler(path):
+    rotation = os.getenv("LOG_ROTATION", "external").strip().lower()
+    if rotation == "time":
+        return logging.handlers.TimedRotatingFileHandler(
+            path,
+            when=os.getenv("LOG_ROTATION_WHEN", "midnight"),
+            backupCount=int(os.getenv("LOG_BACKUP_COUNT", "7")),
+            encoding='utf-8',
+        )
+    if rotation == "size":
+        return logging.handlers.RotatingFileHandler(
+            path,
+            maxBytes=int(os.getenv("LOG_MAX_BYTES", str(10 * 1024 * 1024))),
+            backupCount=int(os.getenv("LOG_BACKUP_COUNT", "7")),
+            encoding='utf-8',
+        )
+    return logging.handlers.WatchedFileHandler(path, encoding='utf-8')
+
+
+def _file_handler(path, level):
+    # Um handler por arquivo, compartilhado entre loggers / One handler per file, shared across loggers
+    path = str(path)
+    handler = _file_handlers.get(path)
+    if handler is None:
+        handler = _new_file_handler(path)
+        handler.setFormatter(logging.Formatter(FORMAT, datefmt=DATE_FORMAT))
+        _file_handlers[path] = handler
+    handler.setLevel(min(handler.level or level, level))
+    return handler
+
+
+def _stream_handler(level):
+    global _console_handler
+    if _console_handler is None:
+        _console_handler = logging.StreamHandler(sys.stdout)
+        _console_handler.setFormatter(logging.Formatter(FORMAT, datefmt=DATE_FORMAT))
+        _console_handler.setLevel(level)
+    _console_handler.setLevel(min(_console_handler.level, level))
+    return _console_handler
+
+
+def shutdown_logging():
+    """
+    PT-BR:
+    Esvazia a fila e encerra a thread de escrita (também chamado na saída do processo).
+    Um novo logger reinicia a thread sobre a mesma fila, então os loggers
+    existentes continuam funcionando.
+
+    EN:
+    Drains the queue and stops the writer thread (also called on process exit).
+    A new logger restarts the thread on the same queue, so existing loggers
+    keep working.
+    """
+    global _listener
+    with _pipeline_lock:
+        if _listener is not None:
+            _listener.stop()
+            _listener = None
+        for handler in _file_handlers.values():
+            handler.flush()
+
+
+atexit.register(shutdown_logging)
+
+
 class WhatsAppLogger:
     """
     Logger centralizado para o sistema WhatsApp Manager
@@ -37,45 +171,34 @@ class WhatsAppLogger:
         self.name = name
         self.logger = logging.getLogger(name)
         
-        # Evita duplicação de handlers
-        if not self.logger.handlers:
-            self._setup_logger(log_level)
+        # Registro idempotente: a configuração não duplica handlers
+        # Idempotent registration: setting up again never duplicates handlers
+        self._setup_logger(log_level)
     
     def _setup_logger(self, log_level: str):
         """
-        Configura o logger com handlers para arquivo e console
-        Sets up logger with file and console handlers
+        Configura o logger com handlers para arquivo e console (via fila)
+        Sets up logger with file and console handlers (through the queue)
         """
         # Define o nível de log
         level = getattr(logging, log_level.upper(), logging.INFO)
         self.logger.setLevel(level)
         
-        # Formato das mensagens
-        formatter = logging.Formatter(
-            '%(asctime)s - %(name)s - %(levelname)s - %(filename)s:%(lineno)d - %(message)s',
-            datefmt='%Y-%m-%d %H:%M:%S'
-        )
-        
-        # Handler para console
-        console_handler = logging.StreamHandler(sys.stdout)
-        console_handler.setLevel(level)
-        console_handler.setFormatter(formatter)
-        self.logger.addHandler(console_handler)
-        
-        # Handler para arquivo
         log_dir = self._get_log_directory()
-        log_file = log_dir / f"{self.name}.log"
-        
-        file_handler = logging.FileHandler(log_file, encoding='utf-8')
-        file_handler.setLevel(level)
-        file_handler.setFormatter(formatter)
-        self.logger.addHandler(file_handler)
-        
-        # Handler separado para tarefas agendadas
-        scheduled_tasks_file = log_dir / "scheduled_tasks.log"
-        self.tasks_handler = logging.FileHandler(scheduled_tasks_file, encoding='utf-8')
-        self.tasks_handler.setLevel(logging.INFO)
-        self.tasks_handler.setFormatter(formatter)
+        with _pipeline_lock:
+            log_queue = _start_pipeline()
+            console_handler = _stream_handler(level)
+            file_handler = _file_handler(log_dir / f"{self.name}.log", level)
+            # Handler separado para tarefas agendadas
+            self.tasks_handler = _file_handler(log_dir / "scheduled_tasks.log", logging.INFO)
+            
+            # Rotas registradas uma única vez por nome / Routes registered once per name
+            _router.routes[self.name] = (console_handler, file_handler)
+            _router.routes[f"{self.name}.tasks"] = (console_handler, file_handler, self.tasks_handler)
+            
+            # Um único QueueHandler por logger / A single QueueHandler per logger
+            if not any(isinstance(handler, logging.handlers.QueueHandler) for handler in self.logger.handlers):
+                self.logger.addHandler(logging.handlers.QueueHandler(log_queue))
     
     def _get_log_directory(self) -> Path:
         """
@@ -103,8 +226,8 @@ class WhatsAppLogger:
         Log específico para execução de tarefas agendadas
         Specific log for scheduled task execution
         """
+        # Propaga para a fila do logger principal / Propagates to the main logger's queue
         task_logger = logging.getLogger(f"{self.name}.tasks")
-        task_logger.addHandler(self.tasks_handler)
         
         log_message = f"[TASK:{task_name}] [GROUP:{group_id}] [STATUS:{status}] {message}"
         task_logger.info(log_message)
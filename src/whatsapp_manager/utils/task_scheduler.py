@@ -17,95 +17,41 @@ import subprocess
 import platform
 from datetime import datetime
 
-def is_running_in_docker():
+# Detecção em cache, calculada uma vez por processo / Cached detection, computed once per process
+try:
+    from .environment import is_running_in_docker
+except ImportError:
+    from whatsapp_manager.utils.environment import is_running_in_docker
+
+
+def _task_id(cron_line):
+    # Nome da tarefa marcado com "# TASK_ID:" na linha do cron / Task name tagged with "# TASK_ID:" in the cron line
+    if "# TASK_ID:" not in cron_line:
+        return None
+    return cron_line.rpartition("# TASK_ID:")[2].strip()
+
+
+def _read_crontab():
     """
     PT-BR:
-    Detecta se o código está rodando dentro de um contêiner Docker.
-    
-    Returns:
-        bool: True se estiver rodando no Docker, False caso contrário
+    Lê o crontab do usuário. Só um erro "no crontab for <usuário>" conta como
+    crontab vazio; qualquer outra falha gera CalledProcessError, para que o
+    crontab existente não seja sobrescrito.
 
     EN:
-    Detects if the code is running inside a Docker container.
-    
-    Returns:
-        bool: True if running in Docker, False otherwise
+    Reads the user's crontab. Only a "no crontab for <user>" error counts as
+    an empty crontab; any other failure raises CalledProcessError so the
+    existing crontab is never overwritten.
     """
-    # Log da verificação para facilitar debug
-    log_dir = "/app/data" if os.path.exists("/app/data") else "/tmp"
-    log_path = os.path.join(log_dir, "docker_detection.log")
-    
-    def log_detection(message, result):
-        try:
-            with open(log_path, "a") as log_file:
-                log_file.write(f"[{datetime.now()}] {message}: {result}\n")
-        except:
-            pass  # Falhar silenciosamente se não conseguir logar
-    
-    # Primeiro teste: verifica ambiente Docker via variável de ambiente (mais confiável)
-    docker_env = os.environ.get('DOCKER_ENV', '').lower() == 'true'
-    log_detection("DOCKER_ENV environment variable", docker_env)
-    if docker_env:
-        return True
-    
-    # Segundo teste: verifica se existem arquivos típicos do Docker
-    docker_indicators = [
-        '/.dockerenv',
-        '/proc/1/cgroup'
-    ]
-    
-    for indicator in docker_indicators:
-        if os.path.exists(indicator):
-            if indicator == '/proc/1/cgroup':
-                try:
-                    with open(indicator, 'r') as f:
-                        content = f.read()
-                        docker_cgroup = 'docker' in content or 'containerd' in content
-                        log_detection(f"Docker indicator {indicator}", docker_cgroup)
-                        if docker_cgroup:
-                            return True
-                except Exception as e:
-                    log_detection(f"Error reading {indicator}", str(e))
-            else:
-                log_detection(f"Docker indicator {indicator} exists", True)
-                return True
-    
-    # Terceiro teste: verifica o nome do host
-    try:
-        with open('/etc/hostname', 'r') as f:
-            hostname = f.read().strip()
-            docker_hostname = hostname.startswith('container') or hostname.startswith('docker')
-            log_detection(f"Hostname check ({hostname})", docker_hostname)
-            if docker_hostname:
-                return True
-    except Exception as e:
-        log_detection("Error reading hostname", str(e))
-    
-    # Quarto teste: verifica a presença de um arquivo de sinalização específico
-    docker_marker = os.path.exists('/app/.docker_environment')
-    log_detection("Docker marker file exists", docker_marker)
-    if docker_marker:
-        return True
-    
-    # Quinto teste: verificar se estamos em um path típico de container
-    app_path = os.path.exists('/app')
-    log_detection("App directory exists at /app", app_path)
-    if app_path and os.path.exists('/app/src') and os.path.exists('/app/data'):
-        log_detection("Docker-like directory structure detected", True)
-        return True
-    
-    # Sexto teste: verificar supervisord
-    try:
-        result = subprocess.run(["ps", "aux"], capture_output=True, text=True)
-        supervisord_running = 'supervisord' in result.stdout
-        log_detection("Supervisord running", supervisord_running)
-        if supervisord_running:
-            return True
-    except Exception as e:
-        log_detection("Error checking supervisord", str(e))
-    
-    log_detection("Final Docker detection result", False)
-    return False
+    command = ["crontab", "-l"]
+    current = subprocess.run(command, capture_output=True, text=True)
+    if current.returncode == 0:
+        return current.stdout.splitlines()
+    if "no crontab for" in (current.stderr or "").lower():
+        return []
+    print(f"Erro ao ler o crontab; nada foi alterado / Error reading crontab; nothing was changed: {(current.stderr or '').strip()}")
+    raise subprocess.CalledProcessError(current.returncode, command, current.stdout, current.stderr)
+
 
 class TaskScheduled:
     @staticmethod
@@ -162,6 +108,27 @@ class TaskScheduled:
         except Exception as e:
             raise EnvironmentError("Python não encontrado no sistema / Python not found in system") from e
 
+    @staticmethod
+    def _cron_line(python_executable, task_name, python_script_path, schedule_type='DAILY', date=None, time='22:00'):
+        """
+        PT-BR:
+        Monta a linha do crontab de uma tarefa, marcada com # TASK_ID:{task_name}.
+
+        EN:
+        Builds a task's crontab line, tagged with # TASK_ID:{task_name}.
+        """
+        # Caminho absoluto para o script que carrega o .env
+        env_loader_script = "/usr/local/bin/load_env.sh"
+        # Comando que será executado pelo cron
+        cron_command = f"{env_loader_script} {python_executable} {python_script_path} --task_name {task_name}"
+        hour, minute = time.split(':')
+        if schedule_type.upper() == 'ONCE' and date:
+            year, month, day = date.split('-') # YYYY-MM-DD, como enviado pela interface / as sent by the UI
+            # Note: Cron format is MIN HOUR DAY MONTH DAY_OF_WEEK. Year is not directly supported.
+            # This will run once at the specified time on the specified day/month.
+            return f"{minute} {hour} {day} {month} * {cron_command} # TASK_ID:{task_name}"
+        return f"{minute} {hour} * * * {cron_command} # TASK_ID:{task_name}"
+
     @staticmethod
     def create_task(task_name, python_script_path, schedule_type='DAILY', date=None, time='22:00'):
         """
@@ -217,20 +184,8 @@ class TaskScheduled:
             if schedule_type.upper() == 'ONCE' and date:
                 command.extend(['/SD', date])
         elif os_name == "Linux":
-            # Caminho absoluto para o script que carrega o .env
-            env_loader_script = "/usr/local/bin/load_env.sh"
-            # Comando que será executado pelo cron
-            cron_command = f"{env_loader_script} {python_executable} {python_script_path} --task_name {task_name}"
-            
-            if schedule_type.upper() == 'ONCE' and date:
-                hour, minute = time.split(':')
-                day, month, year = date.split('-') # Assuming YYYY-MM-DD format
-                # Note: Cron format is MIN HOUR DAY MONTH DAY_OF_WEEK. Year is not directly supported.
-                # This will run once at the specified time on the specified day/month.
-                command = f'(crontab -l 2>/dev/null ; echo "{minute} {hour} {day} {month} * {cron_command} # TASK_ID:{task_name}") | crontab -'
-            else: # DAILY
-                hour, minute = time.split(':')
-                command = f'(crontab -l 2>/dev/null ; echo "{minute} {hour} * * * {cron_command} # TASK_ID:{task_name}") | crontab -'
+            cron_line = TaskScheduled._cron_line(python_executable, task_name, python_script_path, schedule_type, date, time)
+            command = f'(crontab -l 2>/dev/null ; echo "{cron_line}") | crontab -'
         elif os_name == "Darwin":  
             safe_task_name = task_name.replace('@', '_').replace('.', '_')
             plist_content = f"""<?xml version="1.0" encoding="UTF-8"?>
@@ -355,6 +310,61 @@ class TaskScheduled:
             print(f"Erro ao criar a tarefa: {e}")
             raise
 
+    @staticmethod
+    def create_tasks(tasks, delete_names=()):
+        """
+        PT-BR:
+        Cria e remove várias tarefas de uma vez. No Linux, o crontab é lido e
+        regravado uma única vez, independentemente do número de tarefas; no
+        Windows e no macOS não há operação em lote e cada tarefa é aplicada
+        individualmente.
+
+        Parâmetros:
+            tasks: Lista de dicts com os argumentos de create_task
+            delete_names: Nomes das tarefas a remover
+
+        EN:
+        Creates and removes several tasks at once. On Linux the crontab is read
+        and rewritten a single time regardless of the number of tasks; Windows
+        and macOS have no bulk operation, so each task is applied on its own.
+
+        Parameters:
+            tasks: List of dicts with create_task arguments
+            delete_names: Names of tasks to remove
+        """
+        # Se estamos rodando no Docker, usa o agendador simplificado
+        if is_running_in_docker():
+            from .task_scheduler_docker import TaskScheduled as DockerTaskScheduled
+            return DockerTaskScheduled.create_tasks(tasks, delete_names)
+
+        tasks = list(tasks)
+        for task in tasks:
+            TaskScheduled.validate_python_script(task["python_script_path"])
+
+        os_name = platform.system()
+        if os_name != "Linux":
+            for task_name in delete_names:
+                try:
+                    TaskScheduled.delete_task(task_name)
+                except Exception as e:
+                    print(f"Aviso: Não foi possível remover a tarefa {task_name}: {e}")
+            for task in tasks:
+                TaskScheduled.create_task(**task)
+            return True
+
+        python_executable = TaskScheduled.get_python_executable()
+        replaced = set(delete_names) | {task["task_name"] for task in tasks}
+        lines = _read_crontab()
+        kept = [line for line in lines if _task_id(line) not in replaced]
+        kept += [TaskScheduled._cron_line(python_executable, **task) for task in tasks]
+        try:
+            subprocess.run(["crontab", "-"], input="\n".join(kept) + "\n", text=True, check=True)
+        except subprocess.CalledProcessError as e:
+            print(f"Erro ao atualizar o crontab: {e}")
+            raise
+        print(f"{len(tasks)} tarefas criadas e {len(lines) + len(tasks) - len(kept)} removidas do crontab!")
+        return True
+
     @staticmethod
     def delete_task(task_name):
         """
@@ -14,6 +14,13 @@ import os
 import subprocess
 from datetime import datetime
 
+def _task_id(cron_line):
+    # Nome da tarefa marcado com "# TASK_ID:" na linha do cron / Task name tagged with "# TASK_ID:" in the cron line
+    if "# TASK_ID:" not in cron_line:
+        return None
+    return cron_line.rpartition("# TASK_ID:")[2].strip()
+
+
 class TaskScheduled:
     @staticmethod
     def validate_python_script(python_script_path):
@@ -70,37 +77,13 @@ class TaskScheduled:
         """
         TaskScheduled.validate_python_script(python_script_path)
 
-        # No Docker, sempre usamos python3
-        python_executable = "python3"
-        
         # Log the scheduling attempt
         log_path = "/app/data/cron_scheduling.log"
         with open(log_path, "a") as log_file:
             log_file.write(f"[{datetime.now()}] Scheduling task: {task_name}\n")
         
-        # Comando que será executado pelo cron (usa o script load_env.sh)
-        env_loader_script = "/usr/local/bin/load_env.sh"
-        cron_command = f"{env_loader_script} {python_executable} {python_script_path} --task_name {task_name}"
-        
-        if schedule_type.upper() == 'ONCE' and date:
-            # IMPORTANTE: Para execução "uma vez", convertemos para agendamento diário
-            # pois o cron padrão não suporta anos específicos
-            # O script summary.py deve verificar se já executou hoje
-            hour, minute = time.split(':')
-            print(f"AVISO: Agendamento 'ONCE' convertido para DAILY. Script deve verificar execução única.")
-        else:  # DAILY
-            hour, minute = time.split(':')
-        
-        # Criamos um arquivo direto em /etc/cron.d/ com permissões adequadas
-        cron_file_path = f"/etc/cron.d/task_{task_name.replace('@', '_').replace('.', '_')}"
-        
         try:
-            # Criar o arquivo cron com o conteúdo correto
-            cron_content = f"# Task created on {datetime.now()}\n"
-            cron_content += "SHELL=/bin/bash\n"
-            cron_content += "PATH=/usr/local/sbin:/usr/local/bin:/usr/sbin:/usr/bin:/sbin:/bin\n"
-            cron_content += "PYTHONPATH=/app:/app/src\n\n"
-            cron_content += f"{minute} {hour} * * * root {cron_command} >> /app/data/task_{task_name.replace('@', '_').replace('.', '_')}.log 2>&1 # TASK_ID:{task_name}\n"
+            cron_file_path, cron_content = TaskScheduled._cron_file(task_name, python_script_path, schedule_type, date, time)
             
             # Escrever para o arquivo
             with open(cron_file_path, 'w') as cron_file:
@@ -131,6 +114,112 @@ class TaskScheduled:
             print(f"Erro ao criar a tarefa: {e}")
             raise
 
+    @staticmethod
+    def _cron_file(task_name, python_script_path, schedule_type='DAILY', date=None, time='22:00'):
+        """
+        PT-BR:
+        Monta o caminho e o conteúdo do arquivo /etc/cron.d/ de uma tarefa.
+
+        EN:
+        Builds the /etc/cron.d/ file path and content for a task.
+        """
+        # No Docker, sempre usamos python3
+        python_executable = "python3"
+        
+        # Comando que será executado pelo cron (usa o script load_env.sh)
+        env_loader_script = "/usr/local/bin/load_env.sh"
+        cron_command = f"{env_loader_script} {python_executable} {python_script_path} --task_name {task_name}"
+        
+        if schedule_type.upper() == 'ONCE' and date:
+            # IMPORTANTE: Para execução "uma vez", convertemos para agendamento diário
+            # pois o cron padrão não suporta anos específicos
+            # O script summary.py deve verificar se já executou hoje
+            hour, minute = time.split(':')
+            print(f"AVISO: Agendamento 'ONCE' convertido para DAILY. Script deve verificar execução única.")
+        else:  # DAILY
+            hour, minute = time.split(':')
+        
+        # Criamos um arquivo direto em /etc/cron.d/ com permissões adequadas
+        safe_task_name = task_name.replace('@', '_').replace('.', '_')
+        cron_file_path = f"/etc/cron.d/task_{safe_task_name}"
+        
+        # Criar o arquivo cron com o conteúdo correto
+        cron_content = f"# Task created on {datetime.now()}\n"
+        cron_content += "SHELL=/bin/bash\n"
+        cron_content += "PATH=/usr/local/sbin:/usr/local/bin:/usr/sbin:/usr/bin:/sbin:/bin\n"
+        cron_content += "PYTHONPATH=/app:/app/src\n\n"
+        cron_content += f"{minute} {hour} * * * root {cron_command} >> /app/data/task_{safe_task_name}.log 2>&1 # TASK_ID:{task_name}\n"
+        return cron_file_path, cron_content
+
+    @staticmethod
+    def create_tasks(tasks, delete_names=()):
+        """
+        PT-BR:
+        Cria e remove várias tarefas de uma vez: os arquivos de /etc/cron.d/ são
+        gravados diretamente, o crontab é atualizado no máximo uma vez e o serviço
+        cron é verificado uma única vez.
+
+        Parâmetros:
+            tasks: Lista de dicts com os argumentos de create_task
+            delete_names: Nomes das tarefas a remover
+
+        EN:
+        Creates and removes several tasks at once: /etc/cron.d/ files are written
+        directly, the crontab is updated at most once and the cron service is
+        checked a single time.
+
+        Parameters:
+            tasks: List of dicts with create_task arguments
+            delete_names: Names of tasks to remove
+        """
+        tasks = list(tasks)
+        for task in tasks:
+            TaskScheduled.validate_python_script(task["python_script_path"])
+
+        log_path = "/app/data/cron_scheduling.log"
+        with open(log_path, "a") as log_file:
+            log_file.write(f"[{datetime.now()}] Bulk scheduling: {len(tasks)} created, {len(delete_names)} removed\n")
+
+        try:
+            # Remoções: arquivos do cron.d; o restante sai do crontab em uma única passada
+            # Removals: cron.d files; the rest leaves the crontab in a single pass
+            crontab_names = set()
+            for task_name in delete_names:
+                cron_file_path = f"/etc/cron.d/task_{task_name.replace('@', '_').replace('.', '_')}"
+                if os.path.exists(cron_file_path):
+                    os.remove(cron_file_path)
+                else:
+                    crontab_names.add(task_name)
+            if crontab_names:
+                current = subprocess.run(["crontab", "-l"], capture_output=True, text=True)
+                if current.returncode == 0:
+                    lines = current.stdout.splitlines()
+                    kept = [line for line in lines if _task_id(line) not in crontab_names]
+                    if len(kept) != len(lines):
+                        subprocess.run(["crontab", "-"], input="\n".join(kept) + "\n", text=True, check=True)
+
+            for task in tasks:
+                cron_file_path, cron_content = TaskScheduled._cron_file(**task)
+                with open(cron_file_path, 'w') as cron_file:
+                    cron_file.write(cron_content)
+                os.chmod(cron_file_path, 0o644)
+                os.chown(cron_file_path, 0, 0)
+
+            try:
+                subprocess.run("service cron status || service cron start", shell=True, check=True)
+            except:
+                print("Aviso: Não foi possível verificar/iniciar o serviço cron")
+
+            with open(log_path, "a") as log_file:
+                log_file.write(f"[{datetime.now()}] Bulk scheduling done\n")
+            print(f"{len(tasks)} tarefas criadas e {len(delete_names)} removidas no cron do Docker!")
+            return True
+        except Exception as e:
+            with open(log_path, "a") as log_file:
+                log_file.write(f"[{datetime.now()}] ERROR in bulk scheduling: {str(e)}\n")
+            print(f"Erro ao agendar as tarefas: {e}")
+            raise
+
     @staticmethod
     def delete_task(task_name):
         """
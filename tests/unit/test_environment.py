@@ -0,0 +1,44 @@
+"""
+Unit tests for the cached, overridable Docker detection.
+"""
+
+import pytest
+
+from whatsapp_manager.utils import environment
+
+
+@pytest.fixture(autouse=True)
+def fresh_cache():
+    environment.reset_environment_cache()
+    yield
+    environment.reset_environment_cache()
+
+
+def test_env_override_skips_probing(monkeypatch):
+    def fail():
+        raise AssertionError("probed")
+
+    monkeypatch.setattr(environment, "_probe_docker", fail)
+    monkeypatch.setattr(environment, "_log_detection", lambda result, reason: None)
+    monkeypatch.setenv("DOCKER_ENV", "false")
+    assert environment.is_running_in_docker() is False
+
+    environment.reset_environment_cache()
+    monkeypatch.setenv("DOCKER_ENV", "true")
+    assert environment.is_running_in_docker() is True
+
+
+def test_probe_and_log_run_once_per_process(monkeypatch):
+    probes, logs = [], []
+
+    def probe():
+        probes.append(1)
+        return True, "test"
+
+    monkeypatch.delenv("DOCKER_ENV", raising=False)
+    monkeypatch.setattr(environment, "_probe_docker", probe)
+    monkeypatch.setattr(environment, "_log_detection", lambda result, reason: logs.append((result, reason)))
+
+    assert all(environment.is_running_in_docker() for _ in range(5))
+    assert probes == [1]
+    assert logs == [(True, "test")]
@@ -0,0 +1,54 @@
+"""
+Unit tests for the fast JSON serialization layer.
+"""
+
+import json
+
+import pytest
+
+from whatsapp_manager.utils import fast_json
+
+
+def test_round_trip_and_compact_output(tmp_path):
+    data = {"timestamp": 1.5, "groups": [{"id": "1@g.us", "subject": "Ação ✅", "size": 3}]}
+
+    encoded = fast_json.dumps(data)
+    assert " " not in encoded.replace("Ação ✅", "")
+    assert fast_json.loads(encoded) == data
+    assert fast_json.loads(encoded.encode("utf-8")) == data
+
+    path = tmp_path / "cache.json"
+    fast_json.dump_file(str(path), data)
+    assert json.loads(path.read_text(encoding="utf-8")) == data
+    assert fast_json.load_file(str(path)) == data
+    assert not (tmp_path / "cache.json.tmp").exists()
+    assert list(tmp_path.iterdir()) == [path]
+
+
+def test_concurrent_dump_file_writers_do_not_share_a_temp_file(tmp_path):
+    import threading
+
+    path = str(tmp_path / "cache.json")
+    payloads = [{"writer": i, "data": "x" * 50_000} for i in range(8)]
+    threads = [threading.Thread(target=fast_json.dump_file, args=(path, payload)) for payload in payloads]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert fast_json.load_file(path) in payloads
+    assert [p.name for p in tmp_path.iterdir()] == ["cache.json"]
+
+
+def test_unsupported_types_fall_back_to_stdlib():
+    assert fast_json.loads(fast_json.dumps({1: "a"})) == {"1": "a"}
+
+
+def test_invalid_json_raises_value_error():
+    with pytest.raises(ValueError):
+        fast_json.loads(b"{not json")
+
+
+def test_backend_selection_falls_back_to_json():
+    assert fast_json._select_backend("json")[0] == "json"
+    assert fast_json._select_backend("missing-backend")[0] == "json"
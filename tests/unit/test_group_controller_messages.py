@@ -0,0 +1,121 @@
+"""
+Unit tests for the paginated message fetch in GroupController.
+"""
+
+from datetime import datetime
+from unittest.mock import Mock
+
+import pytest
+
+
+def _record(msg_id, ts, text="hello"):
+    return {
+        "key": {"remoteJid": "123@g.us", "id": msg_id, "fromMe": False, "participant": "5511@s.whatsapp.net"},
+        "pushName": "Tester",
+        "messageType": "conversation",
+        "messageTimestamp": ts,
+        "message": {"conversation": text},
+    }
+
+
+def _page(records, pages):
+    return {"messages": {"total": 0, "pages": pages, "currentPage": 1, "records": records}}
+
+
+@pytest.fixture
+def controller(monkeypatch, mock_env_vars, tmp_path):
+    for key, value in mock_env_vars.items():
+        monkeypatch.setenv(key, value)
+    monkeypatch.setenv("MESSAGE_STORE_PATH", str(tmp_path / "messages.db"))
+    from whatsapp_manager.core import group_controller
+
+    monkeypatch.setattr(group_controller, "is_running_in_docker", lambda: False)
+    control = group_controller.GroupController()
+    control.client = Mock()
+    return control
+
+
+def test_get_messages_walks_every_page(controller, monkeypatch):
+    monkeypatch.setenv("EVO_MESSAGES_PAGE_SIZE", "3")
+    base = int(datetime(2025, 1, 10, 12, 0, 0).timestamp())
+    pages = [
+        _page([_record(f"a{i}", base - i) for i in range(3)], pages=3),
+        _page([_record(f"b{i}", base - 10 - i) for i in range(3)], pages=3),
+        _page([_record("c0", base - 20)], pages=3),
+    ]
+    controller.client.chat.get_messages.side_effect = pages
+
+    msgs = controller.get_messages("123@g.us", "2025-01-10 00:00:00", "2025-01-10 23:59:59")
+
+    assert [m.message_id for m in msgs] == ["a0", "a1", "a2", "b0", "b1", "b2", "c0"]
+    requested_pages = [c.kwargs["page"] for c in controller.client.chat.get_messages.call_args_list]
+    assert requested_pages == [1, 2, 3]
+
+
+def test_iter_messages_stops_once_window_start_is_passed(controller, monkeypatch):
+    monkeypatch.setenv("EVO_MESSAGES_PAGE_SIZE", "2")
+    start = int(datetime(2025, 1, 10, 0, 0, 0).timestamp())
+    pages = [
+        _page([_record("new", start + 100), _record("old", start - 100)], pages=5),
+        _page([_record("older", start - 200), _record("oldest", start - 300)], pages=5),
+    ]
+    controller.client.chat.get_messages.side_effect = pages
+
+    msgs = list(controller.iter_messages("123@g.us", "2025-01-10 00:00", "2025-01-10 23:59"))
+
+    assert [m.message_id for m in msgs] == ["new"]
+    requested_pages = [c.kwargs["page"] for c in controller.client.chat.get_messages.call_args_list]
+    assert requested_pages == [1]
+
+
+def test_get_messages_only_fetches_the_delta_once_stored(controller, monkeypatch):
+    monkeypatch.setenv("MESSAGE_STORE_OVERLAP_SECONDS", "0")
+    base = int(datetime(2025, 1, 10, 12, 0, 0).timestamp())
+    controller.client.chat.get_messages.return_value = _page([_record("a0", base), _record("a1", base - 60)], pages=1)
+
+    first = controller.get_messages("123@g.us", "2025-01-10 00:00:00", "2025-01-10 12:30:00")
+    assert [m.message_id for m in first] == ["a0", "a1"]
+
+    controller.client.chat.get_messages.reset_mock()
+    controller.client.chat.get_messages.return_value = _page([_record("b0", base + 3600)], pages=1)
+    second = controller.get_messages("123@g.us", "2025-01-10 00:00:00", "2025-01-10 14:00:00")
+
+    assert [m.message_id for m in second] == ["b0", "a0", "a1"]
+    assert controller.client.chat.get_messages.call_count == 1
+    assert controller.client.chat.get_messages.call_args.kwargs["timestamp_start"] == "2025-01-10T12:30:00Z"
+
+    controller.client.chat.get_messages.reset_mock()
+    again = controller.get_messages("123@g.us", "2025-01-10 06:00:00", "2025-01-10 12:59:00")
+    assert [m.message_id for m in again] == ["a0", "a1"]
+    controller.client.chat.get_messages.assert_not_called()
+
+
+def test_wait_for_sync_returns_once_newest_message_is_stable(controller, monkeypatch):
+    monkeypatch.setattr("whatsapp_manager.core.group_controller.time.sleep", lambda s: None)
+    controller.client.chat.get_messages.side_effect = [
+        _page([_record("m1", 100)], pages=1),
+        _page([_record("m2", 200)], pages=1),
+        _page([_record("m2", 200)], pages=1),
+    ]
+
+    assert controller.wait_for_sync("123@g.us", "2025-01-10 23:59:59", timeout=60, poll_interval=1)
+    assert controller.client.chat.get_messages.call_count == 3
+
+
+def test_message_store_prunes_messages_beyond_retention(tmp_path):
+    from whatsapp_manager.core.message_sandeco import MessageSandeco
+    from whatsapp_manager.infrastructure.persistence.message_store import MessageStore
+
+    store = MessageStore(str(tmp_path / "messages.db"), retention_days=1)
+    base = int(datetime(2025, 1, 10, 12, 0, 0).timestamp())
+    store.add_messages([MessageSandeco(_record(f"m{i}", base - i * 43200)) for i in range(4)])
+
+    # Uma janela maior que a retenção é mantida inteira na chamada que a grava
+    # A window longer than the retention is kept whole on the call that records it
+    store.extend_coverage("123@g.us", base - 2 * 86400, base - 86400)
+    assert len(store.get_messages("123@g.us", 0, base)) == 4
+
+    store.extend_coverage("123@g.us", base - 86400, base)
+
+    assert [m.message_id for m in store.get_messages("123@g.us", 0, base)] == ["m0", "m1", "m2"]
+    assert store.get_coverage("123@g.us") == (base - 86400, base)
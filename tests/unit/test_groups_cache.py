@@ -0,0 +1,152 @@
+"""
+Unit tests for the groups cache TTL, stale-while-revalidate policy and group registry.
+"""
+
+import threading
+import time
+from datetime import datetime, timedelta
+from unittest.mock import Mock
+
+import pytest
+
+from whatsapp_manager.infrastructure.persistence.settings_store import SqliteSettingsStore
+from whatsapp_manager.utils import fast_json
+
+
+def _group(group_id, subject):
+    return {"id": group_id, "subject": subject, "subjectOwner": "owner", "subjectTime": 0, "size": 2,
+            "creation": 0, "restrict": False, "announce": False, "isCommunity": False,
+            "isCommunityAnnounce": False}
+
+
+@pytest.fixture
+def controller(monkeypatch, mock_env_vars, tmp_path):
+    for key, value in mock_env_vars.items():
+        monkeypatch.setenv(key, value)
+    monkeypatch.setenv("MESSAGE_STORE_ENABLED", "false")
+    monkeypatch.setenv("GROUPS_CACHE_TTL", "60")
+    monkeypatch.setenv("GROUPS_INDEX_PATH", str(tmp_path / "groups_index.db"))
+    from whatsapp_manager.core import group_controller
+
+    monkeypatch.setattr(group_controller, "is_running_in_docker", lambda: False)
+    control = group_controller.GroupController()
+    control.client = Mock()
+    control.csv_file = str(tmp_path / "group_summary.csv")
+    control.settings_store = SqliteSettingsStore(str(tmp_path / "group_settings.db"), csv_file=control.csv_file)
+    control.cache_file = str(tmp_path / "groups_cache.json")
+    return control
+
+
+def _write_cache(controller, groups, age_seconds):
+    saved_at = datetime.now() - timedelta(seconds=age_seconds)
+    fast_json.dump_file(controller.cache_file, {"timestamp": saved_at.isoformat(), "groups": groups})
+
+
+def test_fresh_cache_is_used_without_refresh(controller):
+    _write_cache(controller, [_group("1@g.us", "Cached")], age_seconds=10)
+
+    groups = controller.fetch_groups()
+
+    assert [g.name for g in groups] == ["Cached"]
+    controller.client.group.fetch_all_groups.assert_not_called()
+
+
+def test_stale_cache_is_served_and_refreshed_once_in_background(controller):
+    _write_cache(controller, [_group("1@g.us", "Cached")], age_seconds=120)
+    release = threading.Event()
+
+    def slow_fetch(**kwargs):
+        release.wait(5)
+        return [_group("1@g.us", "Cached"), _group("2@g.us", "New")]
+
+    controller.client.group.fetch_all_groups.side_effect = slow_fetch
+
+    first = controller.fetch_groups()
+    second = controller.fetch_groups()
+    assert [g.name for g in first] == ["Cached"]
+    assert [g.name for g in second] == ["Cached"]
+
+    in_flight = controller._refresh_cache()
+    release.set()
+    in_flight.result(timeout=5)
+
+    assert controller.client.group.fetch_all_groups.call_count == 1
+    assert [g.name for g in controller.fetch_groups()] == ["Cached", "New"]
+
+
+def test_missing_cache_waits_for_shared_refresh(controller):
+    controller.client.group.fetch_all_groups.return_value = [_group("1@g.us", "Fetched")]
+
+    groups = controller.fetch_groups()
+
+    assert [g.name for g in groups] == ["Fetched"]
+    assert fast_json.load_file(controller.cache_file)["groups"][0]["subject"] == "Fetched"
+
+
+def test_group_registry_and_summary_index(controller):
+    _write_cache(controller, [_group("1@g.us", "One"), _group("2@g.us", "Two")], age_seconds=10)
+    controller.update_summary("2@g.us", "08:30", True, False, False, "summary.py")
+
+    controller.fetch_groups()
+
+    assert controller.find_group_by_id("2@g.us").horario == "08:30"
+    assert controller.find_group_by_id("1@g.us").enabled is False
+    assert controller.find_group_by_id("missing@g.us") is None
+    assert controller.groups_by_id["1@g.us"] is controller.groups[0]
+
+    controller.update_summary("2@g.us", "09:00", False, False, False, "summary.py")
+    assert controller.load_data_by_group("2@g.us")["horario"] == "09:00"
+    assert controller.load_data_by_group("1@g.us") is False
+
+
+def test_get_group_reads_only_the_indexed_record(controller, monkeypatch):
+    controller.client.group.fetch_all_groups.return_value = [_group("1@g.us", "One"), _group("2@g.us", "Two")]
+    controller.fetch_groups()
+
+    from whatsapp_manager.core.group_controller import GroupController
+
+    fresh = GroupController()
+    fresh.client = Mock()
+    fresh.csv_file = controller.csv_file
+    fresh.settings_store = controller.settings_store
+    fresh.cache_file = controller.cache_file
+    monkeypatch.setattr(fresh, "_load_cache", Mock(side_effect=AssertionError("full cache read")))
+
+    group = fresh.get_group("2@g.us")
+
+    assert group.name == "Two"
+    assert fresh.groups == []
+    fresh.client.group.fetch_all_groups.assert_not_called()
+    fresh.client.group.get_group_info.assert_not_called()
+
+
+def test_get_group_falls_back_to_group_info_call(controller):
+    controller.client.group.get_group_info.return_value = {
+        "id": "3@g.us", "subject": "Three", "participants": [{"id": "a"}, {"id": "b"}],
+    }
+
+    group = controller.get_group("3@g.us")
+
+    assert (group.name, group.size) == ("Three", 2)
+    assert controller.group_index.get("3@g.us")["subject"] == "Three"
+    controller.client.group.get_group_info.return_value = {"error": "not found"}
+    assert controller.get_group("4@g.us") is None
+
+
+def test_update_summaries_writes_many_groups_at_once(controller):
+    controller.update_summary("keep@g.us", "22:00", True, False, False, "summary.py", chunk_tokens=5000, rolling=True)
+    configs = [{"group_id": f"{i}@g.us", "horario": "21:00", "enabled": True, "is_links": True, "is_names": True,
+                "script": "summary.py", "send_to_group": False, "send_to_personal": True} for i in range(500)]
+    configs.append({"group_id": "keep@g.us", "horario": "21:00", "enabled": True, "is_links": True,
+                    "is_names": True, "script": "summary.py"})
+    revision = controller.settings_revision()
+
+    started = time.perf_counter()
+    controller.update_summaries(configs)
+    elapsed = time.perf_counter() - started
+
+    assert elapsed < 1.0
+    assert controller.settings_revision() == revision + 1
+    assert len(controller.load_summary_info()) == 501
+    kept = controller.load_data_by_group("keep@g.us")
+    assert (kept["horario"], kept["chunk_tokens"], kept["rolling"]) == ("21:00", 5000, True)
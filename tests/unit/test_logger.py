@@ -0,0 +1,70 @@
+"""
+Unit tests for the queue-based logging pipeline.
+"""
+
+import logging
+import logging.handlers
+
+import pytest
+
+from whatsapp_manager.utils import logger as logger_module
+
+
+@pytest.fixture
+def log_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(logger_module.WhatsAppLogger, "_get_log_directory", lambda self: tmp_path)
+    yield tmp_path
+    logger_module.shutdown_logging()
+
+
+def test_handlers_are_registered_once_and_task_lines_written_once(log_dir):
+    first = logger_module.WhatsAppLogger("test_queue_logger")
+    logger_module.WhatsAppLogger("test_queue_logger")
+    queue_handlers = [h for h in first.logger.handlers if isinstance(h, logging.handlers.QueueHandler)]
+    assert len(queue_handlers) == 1
+
+    for i in range(3):
+        first.log_task_execution("Resumo", "g@g.us", "START", f"run {i}")
+    first.info("hello")
+    logger_module.shutdown_logging()
+
+    task_lines = (log_dir / "scheduled_tasks.log").read_text(encoding="utf-8").splitlines()
+    assert len(task_lines) == 3
+    main_lines = (log_dir / "test_queue_logger.log").read_text(encoding="utf-8").splitlines()
+    assert sum("hello" in line for line in main_lines) == 1
+
+
+def test_default_file_handler_defers_rotation_to_logrotate(log_dir, monkeypatch):
+    monkeypatch.delenv("LOG_ROTATION", raising=False)
+    handler = logger_module._new_file_handler(str(log_dir / "shared.log"))
+    try:
+        assert type(handler) is logging.handlers.WatchedFileHandler
+    finally:
+        handler.close()
+
+
+def test_size_based_rotation(log_dir, monkeypatch):
+    monkeypatch.setenv("LOG_ROTATION", "size")
+    monkeypatch.setenv("LOG_MAX_BYTES", "200")
+    monkeypatch.setenv("LOG_BACKUP_COUNT", "2")
+    rotating = logger_module.WhatsAppLogger("test_rotating_logger")
+    for i in range(20):
+        rotating.info(f"line {i}")
+    logger_module.shutdown_logging()
+
+    assert (log_dir / "test_rotating_logger.log.1").exists()
+    assert not (log_dir / "test_rotating_logger.log.3").exists()
+
+
+def test_loggers_keep_writing_after_shutdown_and_restart(log_dir):
+    existing = logger_module.WhatsAppLogger("test_restart_logger")
+    existing.info("before")
+    logger_module.shutdown_logging()
+
+    existing.info("queued while stopped")
+    restarted = logger_module.WhatsAppLogger("test_restart_logger")
+    restarted.info("after")
+    logger_module.shutdown_logging()
+
+    lines = (log_dir / "test_restart_logger.log").read_text(encoding="utf-8")
+    assert all(text in lines for text in ("before", "queued while stopped", "after"))
@@ -0,0 +1,35 @@
+"""
+Unit tests for the columnar message batch parser.
+"""
+
+from whatsapp_manager.core import message_batch
+
+
+def _records():
+    return [
+        {"key": {"id": "a", "remoteJid": "1@g.us", "participant": "p1"}, "pushName": "Ana",
+         "messageType": "conversation", "messageTimestamp": 300, "message": {"conversation": "oi"}},
+        {"key": {"id": "b", "remoteJid": "1@g.us", "participant": "p2"}, "pushName": "Bia",
+         "messageType": "imageMessage", "messageTimestamp": "200", "message": {"imageMessage": {"caption": "foto"}}},
+        {"key": {"id": "c", "remoteJid": "1@g.us"}, "pushName": "Caio",
+         "messageType": "stickerMessage", "messageTimestamp": None, "message": {}},
+        {"key": {"id": "d", "remoteJid": "1@g.us"}, "pushName": "Dani",
+         "messageType": "conversation", "messageTimestamp": 100, "message": {"conversation": "velha"}},
+    ]
+
+
+def test_parse_records_builds_columns():
+    columns = message_batch.parse_records(_records())
+
+    assert set(columns) == set(message_batch.COLUMNS)
+    assert columns["message_timestamp"].tolist() == [300, 200, -1, 100]
+    assert columns["text"].tolist() == ["oi", "foto", "", "velha"]
+    assert columns["participant"].tolist() == ["p1", "p2", None, None]
+
+
+def test_filter_window_and_frame():
+    columns = message_batch.filter_window(message_batch.parse_records(_records()), 150, 300)
+
+    frame = message_batch.to_frame(columns)
+    assert frame["message_id"].tolist() == ["a", "b"]
+    assert list(frame.columns) == list(message_batch.COLUMNS)
@@ -0,0 +1,52 @@
+"""
+Unit tests for pre-LLM message compaction.
+"""
+
+from whatsapp_manager.core.message_compactor import MessageCompactor
+
+
+class FakeMessage:
+    def __init__(self, name, text, ts):
+        self.name, self.text, self.message_timestamp = name, text, ts
+
+    def get_name(self):
+        return self.name
+
+    def get_text(self):
+        return self.text
+
+
+def test_compaction_rules_and_savings():
+    forwarded = "Encaminhada: " + "promoção imperdível " * 10
+    msgs = [
+        FakeMessage("Ana", None, 0),
+        FakeMessage("Ana", "kkkkk", 10),
+        FakeMessage("Bia", "👍", 20),
+        FakeMessage("Bia", "Alguém sabe configurar o webhook?", 30),
+        FakeMessage("Bia", "Estou com erro 401", 60),
+        FakeMessage("Caio", forwarded, 90),
+        FakeMessage("Dani", forwarded.upper(), 120),
+        FakeMessage("Edu", "x" * 50, 150),
+        FakeMessage("Bia", "ok", 160),
+        FakeMessage("Bia", "Resolvido, obrigado", 1000),
+    ]
+    compactor = MessageCompactor(collapse_minutes=5, dedupe_min_chars=80, max_chars=40)
+
+    result = compactor.compact(msgs)
+
+    assert [(m.name, m.text) for m in result] == [
+        ("Bia", "Alguém sabe configurar o webhook?\nEstou com erro 401"),
+        ("Caio", forwarded[:40].rstrip() + "…"),
+        ("Edu", "x" * 40 + "…"),
+        ("Bia", "Resolvido, obrigado"),
+    ]
+    stats = compactor.stats
+    assert (stats["dropped_empty"], stats["dropped_noise"], stats["duplicates"], stats["collapsed"]) == (1, 3, 1, 1)
+    assert stats["truncated"] == 2
+    assert stats["tokens_saved"] > 0
+
+
+def test_rules_can_be_disabled():
+    msgs = [FakeMessage("Ana", "ok", 0), FakeMessage("Ana", "ok", 1)]
+    compactor = MessageCompactor(noise_pattern="", collapse_minutes=0, dedupe_min_chars=0, max_chars=0)
+    assert [m.text for m in compactor.compact(msgs)] == ["ok", "ok"]
@@ -0,0 +1,65 @@
+"""
+Unit tests for the slotted, lazily-decoded MessageSandeco.
+"""
+
+import base64
+
+import pytest
+
+from whatsapp_manager.core.message_sandeco import MessageSandeco
+
+
+def _document_record():
+    return {
+        "key": {"remoteJid": "123@g.us", "id": "d1", "fromMe": False, "participant": "5511999@s.whatsapp.net"},
+        "pushName": "Ana",
+        "messageType": "documentMessage",
+        "messageTimestamp": 1736500000,
+        "message": {
+            "documentMessage": {"fileName": "spec.pdf", "caption": "Segue a spec"},
+            "base64": base64.b64encode(b"%PDF-1.4").decode(),
+        },
+    }
+
+
+def test_common_fields_and_scope():
+    msg = MessageSandeco(_document_record())
+
+    assert not hasattr(msg, "__dict__")
+    assert (msg.message_id, msg.push_name, msg.message_timestamp) == ("d1", "Ana", 1736500000)
+    assert (msg.scope, msg.group_id, msg.phone) == ("group", "123", "5511999")
+    assert msg.get_text() == "Segue a spec"
+    assert msg.data["data"] is msg.to_record()
+
+
+def test_media_fields_and_base64_are_decoded_on_first_access(monkeypatch):
+    msg = MessageSandeco(_document_record())
+    calls = []
+    original = base64.b64decode
+    monkeypatch.setattr(base64, "b64decode", lambda s: calls.append(s) or original(s))
+
+    assert msg.document_file_name == "spec.pdf"
+    assert calls == []
+    assert msg.document_base64_bytes == b"%PDF-1.4"
+    assert msg.document_base64_bytes == b"%PDF-1.4"
+    assert len(calls) == 1
+    with pytest.raises(AttributeError):
+        msg.audio_url
+
+
+def test_webhook_envelope_and_text_message():
+    envelope = {
+        "event": "messages.upsert",
+        "instance": "inst",
+        "data": {
+            "key": {"remoteJid": "5511@s.whatsapp.net", "id": "t1"},
+            "messageType": "conversation",
+            "messageTimestamp": 1,
+            "message": {"conversation": "oi"},
+        },
+    }
+    msg = MessageSandeco(envelope)
+
+    assert (msg.event, msg.instance, msg.scope, msg.phone) == ("messages.upsert", "inst", "private", "5511")
+    assert msg.text_message == msg.get_text() == "oi"
+    assert msg.get()["text_message"] == "oi"
@@ -0,0 +1,42 @@
+"""
+Unit tests for the summary prompt builder.
+"""
+
+import time
+
+from whatsapp_manager.core.prompt_builder import PromptBuilder
+
+
+class FakeMessage:
+    def __init__(self, name, text, ts):
+        self.name, self.text, self.message_timestamp = name, text, ts
+
+    def get_name(self):
+        return self.name
+
+    def get_text(self):
+        return self.text
+
+
+def test_build_is_compact_and_in_order():
+    builder = PromptBuilder()
+    ts = 1736500000
+    msgs = [FakeMessage("Ana", "  oi\n", ts), FakeMessage("Bia", None, ts + 5)]
+
+    prompt = builder.build("2025-01-10 00:00:00", "2025-01-10 23:59:59", builder.entries(msgs))
+
+    expected_time = time.strftime("%d/%m %H:%M", time.localtime(ts // 60 * 60))
+    assert prompt.endswith(
+        f'Nome: *Ana*\nPostagem: "oi"\ndata: {expected_time}\n\n'
+        f'Nome: *Bia*\nPostagem: ""\ndata: {builder.format_time(ts + 5)}\n\n'
+    )
+    assert "        " not in prompt
+    assert builder.estimate_tokens(prompt) == len(prompt) // 4 + 1
+
+
+def test_time_formatting_is_cached_per_minute():
+    builder = PromptBuilder()
+    base = 1736500020
+    for offset in range(0, 600):
+        builder.format_time(base + offset)
+    assert len(builder._minute_cache) == 10
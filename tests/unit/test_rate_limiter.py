@@ -0,0 +1,58 @@
+"""
+Unit tests for the send token bucket.
+"""
+
+from whatsapp_manager.infrastructure.api.rate_limiter import TokenBucket, is_rate_limit_error
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+def test_burst_is_free_then_paced_at_rate():
+    clock = FakeClock()
+    bucket = TokenBucket(rate=2, capacity=3, clock=clock, sleep=clock.sleep)
+
+    assert [bucket.acquire() for _ in range(3)] == [0.0, 0.0, 0.0]
+    assert bucket.acquire() == 0.5
+    assert clock.now == 0.5
+
+
+def test_penalize_blocks_until_backoff_expires():
+    clock = FakeClock()
+    bucket = TokenBucket(rate=10, capacity=5, clock=clock, sleep=clock.sleep)
+
+    bucket.penalize(4)
+    bucket.acquire()
+
+    assert clock.now >= 4
+
+
+def test_zero_rate_disables_limiting_and_detects_rate_errors():
+    bucket = TokenBucket(rate=0, sleep=lambda s: (_ for _ in ()).throw(AssertionError("slept")))
+    assert bucket.acquire() == 0.0
+    assert is_rate_limit_error(Exception("Error 429: rate-overlimit"))
+    assert not is_rate_limit_error(Exception("not found"))
+
+
+def test_rate_limit_detection_ignores_unrelated_429_digits():
+    class HTTPError(Exception):
+        def __init__(self, status_code):
+            super().__init__("boom")
+            self.status_code = status_code
+
+    assert is_rate_limit_error(Exception("Erro na requisição: 429 - Too Many Requests"))
+    assert is_rate_limit_error(Exception("HTTP status 429"))
+    assert is_rate_limit_error(HTTPError(429))
+    assert not is_rate_limit_error(HTTPError(500))
+    assert not is_rate_limit_error(Exception("Erro na requisição: 400 number 5511942912345 invalid"))
+    assert not is_rate_limit_error(Exception("message 3EB0429ABC sent, 14290 bytes"))
@@ -0,0 +1,59 @@
+"""
+Unit tests for the in-process daily scheduler heap.
+"""
+
+import random
+from datetime import datetime, time, timedelta
+
+from whatsapp_manager.core.scheduler_engine import DailyScheduler
+
+
+def test_pop_due_fires_once_and_reschedules_next_day():
+    engine = DailyScheduler(catchup=timedelta(minutes=15))
+    engine.load({"a": time(21, 0), "b": time(21, 5)})
+
+    assert engine.next_due(datetime(2025, 1, 10, 20, 0)) == datetime(2025, 1, 10, 21, 0)
+    due, missed = engine.pop_due(datetime(2025, 1, 10, 21, 1))
+    assert [key for key, _ in due] == ["a"] and missed == []
+    assert engine.next_due(datetime(2025, 1, 10, 21, 1)) == datetime(2025, 1, 10, 21, 5)
+
+    due, missed = engine.pop_due(datetime(2025, 1, 11, 23, 0))
+    assert due == []
+    assert sorted(key for key, _ in missed) == ["a", "b"]
+    assert engine.next_due(datetime(2025, 1, 11, 23, 0)) == datetime(2025, 1, 12, 21, 0)
+
+
+def test_slots_missed_before_start_begin_tomorrow():
+    engine = DailyScheduler(catchup=timedelta(minutes=15))
+    engine.load({"a": time(8, 0)})
+
+    assert engine.peek_due(datetime(2025, 1, 10, 9, 0)) == []
+    assert engine.next_due(datetime(2025, 1, 10, 9, 0)) == datetime(2025, 1, 11, 8, 0)
+
+
+def test_spread_is_stable_and_bounded_and_jitter_adds_delay():
+    slots = {f"g{i}@g.us": time(21, 0) for i in range(50)}
+    engine = DailyScheduler(spread_seconds=600)
+    engine.load(slots)
+    first = dict(engine.peek_due(datetime(2025, 1, 10, 21, 10)))
+    engine.load(slots)
+    assert dict(engine.peek_due(datetime(2025, 1, 10, 21, 10))) == first
+    assert len(set(first.values())) > 1
+    assert all(datetime(2025, 1, 10, 21, 0) <= when < datetime(2025, 1, 10, 21, 10) for when in first.values())
+
+    jittered = DailyScheduler(jitter_seconds=30, rng=random.Random(1))
+    jittered.load({"a": time(21, 0)})
+    when = jittered.next_due(datetime(2025, 1, 10, 20, 0))
+    assert datetime(2025, 1, 10, 21, 0) <= when <= datetime(2025, 1, 10, 21, 0, 30)
+
+
+def test_slot_spread_past_midnight_keeps_its_daily_cadence():
+    # "late" fica 573s depois do horário / "late" is spread 573s after its slot
+    engine = DailyScheduler(catchup=timedelta(minutes=15), spread_seconds=600)
+    engine.load({"late": time(23, 59)})
+
+    first = engine.next_due(datetime(2025, 1, 10, 20, 0))
+    assert first == datetime(2025, 1, 11, 0, 8, 33)
+    due, _ = engine.pop_due(first)
+    assert [key for key, _ in due] == ["late"]
+    assert engine.next_due(first) == datetime(2025, 1, 12, 0, 8, 33)
@@ -0,0 +1,111 @@
+"""
+Unit tests for the group summary settings stores.
+"""
+
+import math
+
+import pandas as pd
+import pytest
+
+from whatsapp_manager.infrastructure.persistence.settings_store import (
+    CsvSettingsStore,
+    SqliteSettingsStore,
+    get_settings_store,
+)
+
+
+def _config(group_id, horario="22:00", **extra):
+    return {"group_id": group_id, "horario": horario, "enabled": True, "is_links": False, "is_names": False,
+            "script": "summary.py", "send_to_group": True, "send_to_personal": False, "start_date": None,
+            "start_time": None, "end_date": None, "end_time": None, "min_messages_summary": 50, **extra}
+
+
+@pytest.fixture(params=["csv", "sqlite"])
+def store(request, tmp_path):
+    csv_file = str(tmp_path / "group_summary.csv")
+    if request.param == "csv":
+        return CsvSettingsStore(csv_file)
+    return SqliteSettingsStore(str(tmp_path / "settings.db"), csv_file=csv_file)
+
+
+def test_upsert_get_delete_round_trip(store):
+    assert store.load().empty
+    first_revision = store.revision()
+
+    store.upsert(_config("a@g.us"))
+    store.upsert_many([_config("b@g.us", "08:00"), _config("a@g.us", "09:30")])
+
+    df = store.load()
+    assert sorted(df["group_id"]) == ["a@g.us", "b@g.us"]
+    config = store.get("a@g.us")
+    assert config["horario"] == "09:30"
+    assert bool(config["enabled"]) is True
+    assert math.isnan(config["start_date"])
+    assert store.revision() != first_revision
+
+    assert store.delete("a@g.us") is True
+    assert store.delete("a@g.us") is False
+    assert store.get("a@g.us") is None
+
+
+def test_sqlite_imports_existing_csv_and_later_csv_edits(tmp_path):
+    csv_file = tmp_path / "group_summary.csv"
+    pd.DataFrame([_config("a@g.us", "07:00"), _config("a@g.us", "23:00"), _config("b@g.us")]).to_csv(csv_file, index=False)
+
+    store = SqliteSettingsStore(str(tmp_path / "settings.db"), csv_file=str(csv_file))
+    assert store.get("a@g.us")["horario"] == "07:00"
+    store.upsert(_config("c@g.us", "06:00"))
+
+    # Edição manual do CSV: só as linhas editadas, novas ou removidas são aplicadas
+    # Manual CSV edit: only edited, added or removed rows are applied
+    pd.DataFrame([_config("a@g.us", "07:00", chunk_tokens=5000), _config("d@g.us")]).to_csv(csv_file, index=False)
+    reopened = SqliteSettingsStore(str(tmp_path / "settings.db"), csv_file=str(csv_file))
+    revision = reopened.revision()
+    assert sorted(reopened.load()["group_id"]) == ["a@g.us", "c@g.us", "d@g.us"]
+    assert reopened.get("a@g.us")["chunk_tokens"] == 5000
+    assert reopened.get("c@g.us")["horario"] == "06:00"
+
+    # Sem nova edição, nada é reimportado / Without a new edit, nothing is re-imported
+    assert store.revision() == revision
+    assert store.get("a@g.us")["chunk_tokens"] == 5000
+
+
+def test_sqlite_export_is_opt_in_and_does_not_reimport_itself(tmp_path):
+    csv_file = tmp_path / "group_summary.csv"
+    store = SqliteSettingsStore(str(tmp_path / "settings.db"), csv_file=str(csv_file))
+    store.upsert(_config("a@g.us"))
+    assert not csv_file.exists()
+
+    exporting = SqliteSettingsStore(str(tmp_path / "settings.db"), csv_file=str(csv_file), export_csv=True)
+    exporting.upsert(_config("b@g.us"))
+    assert list(pd.read_csv(csv_file)["group_id"]) == ["a@g.us", "b@g.us"]
+    revision = exporting.revision()
+    assert store.revision() == revision
+
+
+def test_factory_selects_backend(tmp_path, monkeypatch):
+    csv_file = str(tmp_path / "group_summary.csv")
+    monkeypatch.setenv("SETTINGS_BACKEND", "csv")
+    assert isinstance(get_settings_store(csv_file), CsvSettingsStore)
+
+    monkeypatch.setenv("SETTINGS_BACKEND", "sqlite")
+    monkeypatch.delenv("SETTINGS_DB_PATH", raising=False)
+    monkeypatch.delenv("SETTINGS_EXPORT_CSV", raising=False)
+    store = get_settings_store(csv_file)
+    assert isinstance(store, SqliteSettingsStore)
+    assert store.db_path == str(tmp_path / "group_settings.db")
+    assert store.export_enabled is False
+
+
+def test_summary_update_keeps_hand_added_columns(tmp_path):
+    from whatsapp_manager.core.group_controller import GroupController
+
+    csv_file = tmp_path / "group_summary.csv"
+    pd.DataFrame([_config("a@g.us", message_count=120)]).to_csv(csv_file, index=False)
+    store = SqliteSettingsStore(str(tmp_path / "settings.db"), csv_file=str(csv_file))
+
+    row = GroupController._summary_row(store.get("a@g.us"), "a@g.us", "21:00", True, True, True, "summary.py")
+    store.upsert(row)
+
+    assert store.get("a@g.us")["message_count"] == 120
+    assert store.get("a@g.us")["horario"] == "21:00"
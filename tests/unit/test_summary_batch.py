@@ -0,0 +1,92 @@
+"""
+Unit tests for the concurrent batch summary pipeline.
+"""
+
+import threading
+import time
+
+from whatsapp_manager.core.summary_batch import SummaryBatch
+from whatsapp_manager.core.summary_runner import SummaryJob
+
+
+class FakeController:
+    groups = []
+
+    def fetch_groups(self):
+        raise AssertionError("batch must not fetch the full group list")
+
+
+class FakeRunner:
+    def __init__(self):
+        self.controller = FakeController()
+        self.lock = threading.Lock()
+        self.active_llm = 0
+        self.max_llm = 0
+        self.crews = set()
+
+    def _log(self, level, message, exc_info=False):
+        pass
+
+    def _fail(self, job, reason, exc_info=False):
+        job.status = SummaryJob.STATUS_ERROR
+        job.reason = reason
+        return job
+
+    def prepare(self, group_id, task_name=None):
+        job = SummaryJob(group_id, task_name)
+        if group_id == "skip":
+            job.status = SummaryJob.STATUS_SKIPPED
+        elif group_id == "boom":
+            raise RuntimeError("fetch failed")
+        else:
+            job.status = SummaryJob.STATUS_READY
+        return job
+
+    def summarize(self, job, summary_crew=None):
+        with self.lock:
+            self.active_llm += 1
+            self.max_llm = max(self.max_llm, self.active_llm)
+            self.crews.add(id(summary_crew))
+        time.sleep(0.05)
+        with self.lock:
+            self.active_llm -= 1
+        job.summary = f"summary {job.group_id}"
+        job.status = SummaryJob.STATUS_SUMMARIZED
+        return job
+
+    def deliver(self, job):
+        job.status = SummaryJob.STATUS_SUCCESS
+        return job
+
+
+def test_batch_runs_pipeline_with_bounded_llm_concurrency():
+    runner = FakeRunner()
+    batch = SummaryBatch(runner, fetch_concurrency=4, llm_concurrency=2, send_concurrency=1, crew_factory=object)
+
+    group_ids = [f"g{i}" for i in range(8)] + ["skip", "boom"]
+    jobs = batch.run(group_ids)
+
+    assert [job.group_id for job in jobs] == group_ids
+    assert [job.status for job in jobs[:8]] == [SummaryJob.STATUS_SUCCESS] * 8
+    assert jobs[8].status == SummaryJob.STATUS_SKIPPED
+    assert jobs[9].status == SummaryJob.STATUS_ERROR
+    assert runner.max_llm == 2
+    assert len(runner.crews) <= 2
+
+
+def test_concurrent_runs_share_stage_limits():
+    runner = FakeRunner()
+    batch = SummaryBatch(runner, fetch_concurrency=4, llm_concurrency=2, send_concurrency=1, crew_factory=object)
+
+    results = []
+    threads = [threading.Thread(target=lambda ids=ids: results.append(batch.run(ids)))
+               for ids in ([f"a{i}" for i in range(6)], [f"b{i}" for i in range(6)])]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    batch.close()
+
+    assert sorted(len(jobs) for jobs in results) == [6, 6]
+    assert all(job.status == SummaryJob.STATUS_SUCCESS for jobs in results for job in jobs)
+    assert runner.max_llm == 2
@@ -0,0 +1,105 @@
+"""
+Unit tests for the content-hash summary cache.
+"""
+
+import time
+
+from whatsapp_manager.infrastructure.persistence.summary_cache import SummaryCache
+
+
+def test_identical_inputs_hit_and_template_changes_miss(tmp_path):
+    cache = SummaryCache(str(tmp_path / "cache.db"), max_entries=10, max_age_days=1)
+    key = cache.make_key({"msgs": "hello"}, "template v1", "gemini")
+
+    assert cache.get(key) is None
+    cache.put(key, "summary", "gemini")
+    assert cache.get(key) == "summary"
+    assert cache.get(cache.make_key({"msgs": "hello"}, "template v2", "gemini")) is None
+
+    stats = cache.stats()
+    assert (stats["hits"], stats["misses"], stats["entries"]) == (1, 2, 1)
+    assert SummaryCache(str(tmp_path / "cache.db")).stats()["total_hits"] == 1
+
+
+def test_eviction_by_size_and_age(tmp_path, monkeypatch):
+    cache = SummaryCache(str(tmp_path / "cache.db"), max_entries=2, max_age_days=1)
+    now = [1000.0]
+    monkeypatch.setattr(time, "time", lambda: now[0])
+
+    for i in range(3):
+        now[0] += 1
+        cache.put(f"k{i}", f"s{i}")
+    assert cache.get("k0") is None
+    assert cache.get("k2") == "s2"
+
+    now[0] += 2 * 86400
+    assert cache.get("k2") is None
+
+
+def test_retry_of_the_same_window_is_a_cache_hit(tmp_path, monkeypatch):
+    from datetime import datetime, timedelta
+    from types import SimpleNamespace
+    from unittest.mock import Mock
+
+    from whatsapp_manager.core import summary_runner
+    from whatsapp_manager.core.summary_crew import SummaryCrew
+    from whatsapp_manager.core.summary_runner import SummaryJob, SummaryRunner
+    from whatsapp_manager.infrastructure.persistence.summary_events import SummaryEventLog
+    from whatsapp_manager.infrastructure.persistence.summary_state import SummaryStateStore
+
+    llm_calls = []
+
+    class FakeLLMCrew(SummaryCrew):
+        def create_crew(self):
+            self.task = self.chunk_task = SimpleNamespace(description="template", expected_output="output")
+            self.crew = self.chunk_crew = SimpleNamespace(
+                kickoff=lambda inputs: llm_calls.append(inputs) or SimpleNamespace(raw="summary")
+            )
+
+    class Clock(datetime):
+        current = datetime(2025, 1, 10, 22, 0, 0)
+
+        @classmethod
+        def now(cls, tz=None):
+            cls.current += timedelta(seconds=90)
+            return cls.current
+
+    class Message:
+        def __init__(self, index):
+            self.message_timestamp = 1736500000 + index
+            self.remote_jid = "123@g.us"
+
+        def get_name(self):
+            return "user"
+
+        def get_text(self):
+            return f"message {self.message_timestamp}"
+
+    monkeypatch.setattr(summary_runner, "datetime", Clock)
+    monkeypatch.delenv("WHATSAPP_NUMBER", raising=False)
+    controller = Mock()
+    controller.load_data_by_group.return_value = {
+        "enabled": True, "horario": "22:00", "min_messages_summary": 0, "send_to_group": True, "chunk_tokens": 0,
+    }
+    controller.get_group.return_value = SimpleNamespace(name="Group")
+    controller.get_messages.return_value = [Message(i) for i in range(3)]
+    sender = Mock()
+    sender.textMessage.side_effect = [RuntimeError("send failed"), None]
+    runner = SummaryRunner(
+        controller=controller,
+        sender=sender,
+        summary_state=SummaryStateStore(str(tmp_path / "state.db")),
+        event_log=SummaryEventLog(str(tmp_path / "events.jsonl")),
+    )
+    cache = SummaryCache(str(tmp_path / "cache.db"))
+    runner._summary_crew = FakeLLMCrew(cache=cache)
+    runner.personal_number = None
+
+    first = runner.run("123@g.us")
+    second = runner.run("123@g.us")
+
+    assert first.status == SummaryJob.STATUS_ERROR
+    assert second.status == SummaryJob.STATUS_SUCCESS
+    assert first.end_date != second.end_date
+    assert len(llm_calls) == 1
+    assert (cache.hits, cache.misses) == (1, 1)
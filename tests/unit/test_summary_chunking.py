@@ -0,0 +1,146 @@
+"""
+Unit tests for map-reduce chunked summarisation in SummaryRunner.
+"""
+
+import threading
+import time
+from unittest.mock import Mock
+
+from whatsapp_manager.core.summary_runner import SummaryJob, SummaryRunner
+
+
+class FakeMessage:
+    def __init__(self, index):
+        self.index = index
+        self.message_id = f"m{index}"
+        self.message_timestamp = 1736500000 + index * 60
+
+    def get_name(self):
+        return f"user{self.index % 3}"
+
+    def get_text(self):
+        return f"message number {self.index} " + "x" * 200
+
+
+class FakeCrew:
+    lock = threading.Lock()
+    chunk_calls = []
+    reduce_calls = []
+
+    def kickoff_chunk(self, inputs, cache_inputs=None):
+        with self.lock:
+            self.chunk_calls.append(inputs["msgs"])
+        return f"notes for chunk {len(self.chunk_calls)}"
+
+    def kickoff(self, inputs, cache_inputs=None):
+        self.reduce_calls.append(inputs["msgs"])
+        return "final summary"
+
+
+def _job(runner, count, config):
+    job = SummaryJob("123@g.us")
+    job.config = config
+    job.start_date, job.end_date = "2025-01-10 00:00:00", "2025-01-10 23:59:59"
+    job.messages = [FakeMessage(i) for i in reversed(range(count))]
+    job.prompt = runner.build_prompt(job)
+    job.status = SummaryJob.STATUS_READY
+    return job
+
+
+def test_large_window_is_summarised_in_chunks_then_reduced():
+    FakeCrew.chunk_calls, FakeCrew.reduce_calls = [], []
+    runner = SummaryRunner(controller=Mock(), sender=Mock())
+    runner.crew_factory = FakeCrew
+    job = _job(runner, 40, {"chunk_tokens": 1000, "chunk_parallelism": 4})
+
+    runner.summarize(job)
+
+    assert job.status == SummaryJob.STATUS_SUMMARIZED
+    assert job.summary == "final summary"
+    assert job.chunks == len(FakeCrew.chunk_calls) > 1
+    assert all(runner.estimate_tokens(c) <= 1000 + 200 for c in FakeCrew.chunk_calls)
+    assert len(FakeCrew.reduce_calls) == 1
+    assert "notes for chunk" in FakeCrew.reduce_calls[0]
+
+
+def test_small_window_keeps_single_prompt():
+    FakeCrew.chunk_calls, FakeCrew.reduce_calls = [], []
+    runner = SummaryRunner(controller=Mock(), sender=Mock())
+    runner.crew_factory = FakeCrew
+    job = _job(runner, 3, {"chunk_tokens": float("nan")})
+
+    runner.summarize(job)
+
+    assert FakeCrew.chunk_calls == []
+    assert FakeCrew.reduce_calls == [job.prompt]
+    assert job.entries and job.prompt.index("message number 0 ") < job.prompt.index("message number 2 ")
+
+
+def test_rolling_summary_sends_previous_summary_and_only_new_messages(tmp_path, monkeypatch):
+    from whatsapp_manager.core.group_controller import GroupController
+    from whatsapp_manager.infrastructure.persistence.summary_state import SummaryStateStore
+
+    FakeCrew.chunk_calls, FakeCrew.reduce_calls = [], []
+    controller = Mock()
+    controller._message_window = GroupController._message_window
+    state = SummaryStateStore(str(tmp_path / "state.db"))
+    sender = Mock()
+    runner = SummaryRunner(controller=controller, sender=sender, summary_state=state, event_log=Mock())
+    runner.crew_factory = FakeCrew
+    config = {"rolling": True, "chunk_tokens": 0}
+
+    first = _job(runner, 5, config)
+    runner.apply_rolling_state(first)
+    first.prompt = runner.build_prompt(first)
+    runner.summarize(first)
+    # O estado só é gravado após a entrega / State is only saved after delivery
+    assert state.get("123@g.us") is None
+    runner.deliver(first)
+    assert state.get("123@g.us")["last_timestamp"] == first.messages[0].message_timestamp
+
+    second = _job(runner, 8, config)
+    late = FakeMessage(9)
+    late.message_id, late.message_timestamp = "late", first.messages[0].message_timestamp
+    second.messages.append(late)
+    runner.apply_rolling_state(second)
+    second.prompt = runner.build_prompt(second)
+    runner.summarize(second)
+
+    prompt = FakeCrew.reduce_calls[-1]
+    assert "final summary" in prompt
+    assert "message number 4 " not in prompt
+    assert all(f"message number {i} " in prompt for i in (5, 6, 7, 9))
+
+    # Falha no envio não avança o estado / A failed send does not advance the state
+    sender.textMessage.side_effect = RuntimeError("offline")
+    runner.deliver(second)
+    assert state.get("123@g.us")["last_ids"] == ["m4"]
+
+
+def test_chunk_calls_share_the_runner_llm_limit():
+    active, peak = [0], [0]
+    lock = threading.Lock()
+
+    class SlowCrew(FakeCrew):
+        def kickoff_chunk(self, inputs, cache_inputs=None):
+            with lock:
+                active[0] += 1
+                peak[0] = max(peak[0], active[0])
+            time.sleep(0.02)
+            with lock:
+                active[0] -= 1
+            return "notes"
+
+    runner = SummaryRunner(controller=Mock(), sender=Mock())
+    runner.crew_factory = SlowCrew
+    runner.llm_slots = threading.BoundedSemaphore(2)
+    jobs = [_job(runner, 40, {"chunk_tokens": 1000, "chunk_parallelism": 4}) for _ in range(3)]
+
+    threads = [threading.Thread(target=runner.summarize, args=(job,)) for job in jobs]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert all(job.status == SummaryJob.STATUS_SUMMARIZED for job in jobs)
+    assert peak[0] == 2
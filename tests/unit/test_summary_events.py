@@ -0,0 +1,112 @@
+"""
+Unit tests for the JSON-lines summary event log and the dashboard columns.
+"""
+
+from unittest.mock import Mock
+
+from whatsapp_manager.infrastructure.persistence.summary_events import (
+    SummaryEventLog,
+    dashboard_frame,
+    read_events,
+)
+
+
+def _event(status, destinations, finished_at, name="Grupo A"):
+    return {
+        "event": "summary_run",
+        "status": status,
+        "group_id": "a@g.us",
+        "name": name,
+        "finished_at": finished_at,
+        "destinations": destinations,
+        "message_count": 120,
+        "llm_seconds": 2.5,
+    }
+
+
+def test_events_round_trip_into_dashboard_columns(tmp_path):
+    log = SummaryEventLog(str(tmp_path / "events" / "summary_events.jsonl"))
+    log.append(_event("success", ["group", "personal"], "2025-01-10T21:00:05"))
+    log.append(_event("success", ["personal"], "2025-01-11T21:00:05"))
+    log.append(_event("skipped", [], "2025-01-12T21:00:05"))
+    log.append(_event("error", [], "2025-01-13T08:30:00"))
+
+    frame = dashboard_frame(log.read_frame())
+
+    assert list(frame["Send Type"]) == ["Unknown", "Personal", "Group & Personal"]
+    assert list(frame["Success"]) == [False, True, True]
+    assert list(frame["Hour"]) == [8, 21, 21]
+    assert frame["Day of Week"].iloc[-1] == "Friday"
+    assert frame["Message Count"].iloc[0] == 120
+
+
+def test_missing_file_and_corrupted_lines(tmp_path):
+    log = SummaryEventLog(str(tmp_path / "missing.jsonl"))
+    assert log.read_frame().empty
+
+    data = b'{"status": "success", "finished_at": "2025-01-10T21:00:00", "destinations": ["group"]}\n{"status": "succ'
+    frame = read_events(data)
+    assert len(frame) == 1
+    assert dashboard_frame(frame)["Send Type"].tolist() == ["Group"]
+
+
+def test_runner_records_skipped_run(tmp_path):
+    from whatsapp_manager.core.summary_runner import SummaryJob, SummaryRunner
+
+    log = SummaryEventLog(str(tmp_path / "summary_events.jsonl"))
+    runner = SummaryRunner(controller=Mock(), sender=Mock(), event_log=log)
+    runner._skip(SummaryJob("a@g.us"), "too few messages")
+
+    events = log.read_frame()
+    assert events["status"].tolist() == ["skipped"]
+    assert events["reason"].tolist() == ["too few messages"]
+    assert events["message_count"].tolist() == [0]
+
+
+def test_incremental_reader_parses_only_appended_lines(tmp_path, monkeypatch):
+    from whatsapp_manager.infrastructure.persistence import summary_events
+
+    path = tmp_path / "summary_events.jsonl"
+    log = SummaryEventLog(str(path))
+    reader = summary_events.IncrementalEventReader(str(path))
+    assert reader.refresh().empty
+
+    log.append(_event("success", ["group"], "2025-01-10T21:00:00", name="A"))
+    assert reader.refresh()["Group Name"].tolist() == ["A"]
+
+    parsed = []
+    original = summary_events.read_events
+    monkeypatch.setattr(summary_events, "read_events", lambda data: parsed.append(data) or original(data))
+
+    log.append(_event("success", ["group"], "2025-01-11T21:00:00", name="B"))
+    with open(path, "ab") as f:
+        f.write(b'{"status": "success", "finished_at": "2025-01-12T2')
+    assert reader.refresh()["Group Name"].tolist() == ["B", "A"]
+    assert len(parsed) == 1 and parsed[0].count(b"\n") == 1
+
+    with open(path, "ab") as f:
+        f.write(b'1:00:00", "name": "C", "destinations": ["group"]}\n')
+    assert reader.refresh()["Group Name"].tolist() == ["C", "B", "A"]
+    assert reader.refresh() is reader.frame
+    assert len(parsed) == 2
+
+
+def test_incremental_reader_rebuilds_on_truncation_and_rotation(tmp_path):
+    from whatsapp_manager.infrastructure.persistence.summary_events import IncrementalEventReader
+
+    path = tmp_path / "summary_events.jsonl"
+    log = SummaryEventLog(str(path))
+    reader = IncrementalEventReader(str(path))
+    log.append(_event("success", ["group"], "2025-01-10T21:00:00", name="A"))
+    log.append(_event("success", ["group"], "2025-01-11T21:00:00", name="B"))
+    assert len(reader.refresh()) == 2
+
+    path.write_bytes(b"")
+    log.append(_event("success", ["group"], "2025-01-12T21:00:00", name="C"))
+    assert reader.refresh()["Group Name"].tolist() == ["C"]
+
+    rotated = tmp_path / "new.jsonl"
+    SummaryEventLog(str(rotated)).append(_event("success", ["group"], "2025-01-09T21:00:00", name="Z"))
+    path.rename(tmp_path / "old.jsonl")
+    rotated.rename(path)
+    assert reader.refresh()["Group Name"].tolist() == ["Z"]
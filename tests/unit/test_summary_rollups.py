@@ -0,0 +1,76 @@
+"""
+Unit tests for the incremental summary rollups behind the dashboard charts.
+"""
+
+from whatsapp_manager.infrastructure.persistence.summary_events import SummaryEventLog
+from whatsapp_manager.infrastructure.persistence.summary_rollups import SummaryRollupStore
+
+
+def _event(name, finished_at, destinations=("group",), status="success", messages=100):
+    return {
+        "status": status,
+        "group_id": f"{name}@g.us",
+        "name": name,
+        "finished_at": finished_at,
+        "destinations": list(destinations),
+        "message_count": messages,
+    }
+
+
+def test_rollups_accumulate_only_new_lines_and_persist(tmp_path):
+    events_path = str(tmp_path / "summary_events.jsonl")
+    log = SummaryEventLog(events_path)
+    store = SummaryRollupStore(str(tmp_path / "rollups.db"))
+
+    log.append(_event("A", "2025-01-10T21:00:05"))
+    log.append(_event("A", "2025-01-10T21:30:00", messages=50))
+    log.append(_event("B", "2025-01-10T08:00:00", destinations=("group", "personal")))
+    log.append(_event("B", "2025-01-11T08:00:00", status="skipped"))
+    assert store.update(events_path) == 3
+    assert store.update(events_path) == 0
+
+    log.append(_event("A", "2025-01-10T21:45:00", messages=10))
+    reopened = SummaryRollupStore(str(tmp_path / "rollups.db"))
+    assert reopened.update(events_path) == 1
+
+    rows = reopened.load()
+    a = rows[rows["Group Name"] == "A"].iloc[0]
+    assert len(rows) == 2
+    assert (a["Count"], a["Messages"], a["Hour"]) == (3, 160, 21)
+    assert str(a["First Activity"]) == "2025-01-10 21:00:05"
+    assert str(a["Last Activity"]) == "2025-01-10 21:45:00"
+    assert rows[rows["Group Name"] == "B"]["Send Type"].tolist() == ["Group & Personal"]
+
+
+def test_rollup_filters_and_rebuild_on_truncation(tmp_path):
+    events_path = tmp_path / "summary_events.jsonl"
+    log = SummaryEventLog(str(events_path))
+    store = SummaryRollupStore(str(tmp_path / "rollups.db"))
+    log.append(_event("A", "2025-01-10T21:00:00"))
+    log.append(_event("B", "2025-01-12T21:00:00", destinations=("personal",)))
+    log.append(_event("C", "2025-01-14T21:00:00"))
+    store.update(str(events_path))
+
+    assert store.load(start_date="2025-01-11", end_date="2025-01-13")["Group Name"].tolist() == ["B"]
+    assert store.load(send_type="Group")["Group Name"].tolist() == ["A", "C"]
+
+    events_path.write_bytes(b"")
+    log.append(_event("D", "2025-02-01T10:00:00"))
+    store.update(str(events_path))
+    assert store.load()["Group Name"].tolist() == ["D"]
+
+
+def test_switching_event_file_rebuilds_from_the_new_file_only(tmp_path):
+    store = SummaryRollupStore(str(tmp_path / "rollups.db"))
+    old_path, new_path = str(tmp_path / "old.jsonl"), str(tmp_path / "new.jsonl")
+    SummaryEventLog(old_path).append(_event("A", "2025-01-10T21:00:00"))
+    SummaryEventLog(new_path).append(_event("B", "2025-01-10T22:00:00"))
+    assert store.update(old_path) == 1
+
+    assert store.update(new_path) == 1
+    assert list(store.load()["Group Name"]) == ["B"]
+
+    # Voltar ao arquivo anterior também recomeça, sem somar duas vezes
+    # Going back to the previous file also starts over, without double counting
+    assert store.update(old_path) == 1
+    assert list(store.load()["Count"]) == [1]
@@ -0,0 +1,113 @@
+"""
+Unit tests for the resident summary worker schedule.
+"""
+
+from datetime import datetime
+from types import SimpleNamespace
+
+import pandas as pd
+import pytest
+
+
+class FakeController:
+    def __init__(self, csv_file, rows):
+        self.csv_file = csv_file
+        self.rows = rows
+
+    def load_summary_info(self):
+        return pd.DataFrame(self.rows)
+
+    def settings_revision(self):
+        return len(self.rows)
+
+
+class FakeRunner:
+    def __init__(self, controller):
+        self.controller = controller
+        self.ran = []
+
+    def _log(self, level, message, exc_info=False):
+        pass
+
+
+class FakeBatch:
+    def __init__(self, runner):
+        self.runner = runner
+        self.failing = set()
+
+    def run(self, group_ids):
+        self.runner.ran.extend(group_ids)
+        return [SimpleNamespace(group_id=group_id, status="error" if group_id in self.failing else "success")
+                for group_id in group_ids]
+
+
+@pytest.fixture
+def worker(tmp_path, monkeypatch):
+    from whatsapp_manager.core import summary_worker
+
+    monkeypatch.setattr(summary_worker, "STATE_FILE", str(tmp_path / "state.json"))
+    monkeypatch.setattr(summary_worker, "HEARTBEAT_FILE", str(tmp_path / "heartbeat"))
+    csv_file = tmp_path / "group_summary.csv"
+    csv_file.write_text("")
+    rows = [
+        {"group_id": "a@g.us", "horario": "21:00", "enabled": True},
+        {"group_id": "b@g.us", "horario": "21:05", "enabled": True},
+        {"group_id": "off@g.us", "horario": "21:00", "enabled": False},
+        {"group_id": "once@g.us", "horario": "21:00", "enabled": True, "start_date": "2025-01-01",
+         "start_time": "00:00", "end_date": "2025-01-01", "end_time": "23:59"},
+    ]
+    runner = FakeRunner(FakeController(str(csv_file), rows))
+    w = summary_worker.SummaryWorker(runner=runner, poll_interval=1, catchup_minutes=15, batch=FakeBatch(runner),
+                                     retry_seconds=300)
+    w.reload_schedule(force=True)
+    return w
+
+
+def test_schedule_only_contains_enabled_daily_groups(worker):
+    assert sorted(worker.schedule) == ["a@g.us", "b@g.us"]
+
+
+def test_due_groups_run_once_per_day_within_catchup_window(worker):
+    assert worker.due_groups(datetime(2025, 1, 10, 20, 59)) == []
+
+    worker.run_due(datetime(2025, 1, 10, 21, 6))
+    assert worker.runner.ran == ["a@g.us", "b@g.us"]
+
+    worker.run_due(datetime(2025, 1, 10, 21, 10))
+    assert worker.runner.ran == ["a@g.us", "b@g.us"]
+
+    assert worker.due_groups(datetime(2025, 1, 11, 22, 0)) == []
+    assert worker.due_groups(datetime(2025, 1, 11, 21, 1)) == ["a@g.us"]
+
+
+def test_hot_reload_and_dispatch_to_pool(worker):
+    worker.due_groups(datetime(2025, 1, 10, 20, 0))
+    worker.runner.controller.rows.append({"group_id": "c@g.us", "horario": "21:02", "enabled": True})
+    assert worker.reload_schedule() is True
+
+    future = worker.dispatch_due(datetime(2025, 1, 10, 21, 3))
+    assert [job.group_id for job in future.result(timeout=5)] == ["a@g.us", "c@g.us"]
+    assert worker.dispatch_due(datetime(2025, 1, 10, 21, 4)) is None
+    assert worker._seconds_until_next(datetime(2025, 1, 10, 21, 4)) == 1
+    worker._executor.shutdown()
+
+
+def test_failed_group_is_retried_within_catchup_window(worker):
+    worker.batch.failing.add("a@g.us")
+    worker.run_due(datetime(2025, 1, 10, 21, 1))
+    assert "a@g.us" not in worker.last_runs
+
+    # Antes do atraso de nova tentativa nada roda / Nothing runs before the retry delay
+    assert worker.run_due(datetime(2025, 1, 10, 21, 3)) == []
+
+    worker.batch.failing.clear()
+    worker.run_due(datetime(2025, 1, 10, 21, 7))
+    assert worker.runner.ran == ["a@g.us", "b@g.us", "a@g.us"]
+    assert worker.last_runs["a@g.us"] == "2025-01-10"
+
+    # Falha sem tempo para repetir dentro da tolerância / Failure with no time left to retry
+    worker.batch.failing.add("b@g.us")
+    worker.run_due(datetime(2025, 1, 11, 21, 16))
+    assert worker.runner.ran[-1] == "b@g.us"
+    assert worker.run_due(datetime(2025, 1, 11, 21, 19)) == []
+    assert worker.last_runs["b@g.us"] == "2025-01-10"
@@ -0,0 +1,95 @@
+"""
+Unit tests for bulk task scheduling.
+"""
+
+import subprocess
+
+import pytest
+
+from whatsapp_manager.utils import task_scheduler
+from whatsapp_manager.utils.task_scheduler import TaskScheduled
+
+
+@pytest.fixture
+def crontab(monkeypatch, tmp_path):
+    state = {"content": "0 1 * * * other job\n"
+                        "0 22 * * * old --task_name ResumoGrupo_1 # TASK_ID:ResumoGrupo_1\n"
+                        "0 22 * * * old --task_name ResumoGrupo_12 # TASK_ID:ResumoGrupo_12\n",
+             "calls": []}
+
+    def fake_run(command, input=None, **kwargs):
+        state["calls"].append(command)
+        if command == ["crontab", "-l"]:
+            return subprocess.CompletedProcess(command, 0, stdout=state["content"], stderr="")
+        if command == ["crontab", "-"]:
+            state["content"] = input
+            return subprocess.CompletedProcess(command, 0)
+        raise AssertionError(f"unexpected command {command}")
+
+    monkeypatch.setattr(task_scheduler, "is_running_in_docker", lambda: False)
+    monkeypatch.setattr(task_scheduler.platform, "system", lambda: "Linux")
+    monkeypatch.setattr(task_scheduler.subprocess, "run", fake_run)
+    monkeypatch.setattr(TaskScheduled, "get_python_executable", staticmethod(lambda: "/usr/bin/python3"))
+    script = tmp_path / "summary_batch.py"
+    script.write_text("")
+    state["script"] = str(script)
+    return state
+
+
+def test_create_tasks_updates_crontab_once(crontab):
+    tasks = [{"task_name": "ResumoTodosGrupos", "python_script_path": crontab["script"], "time": "21:30"}]
+
+    TaskScheduled.create_tasks(tasks, delete_names=[f"ResumoGrupo_{i}" for i in range(500)])
+
+    assert crontab["calls"] == [["crontab", "-l"], ["crontab", "-"]]
+    lines = crontab["content"].splitlines()
+    assert lines[0] == "0 1 * * * other job"
+    assert not any("TASK_ID:ResumoGrupo_" in line for line in lines)
+    assert lines[-1].startswith("30 21 * * * ") and lines[-1].endswith("# TASK_ID:ResumoTodosGrupos")
+
+
+def test_create_tasks_replaces_existing_entry_exactly(crontab):
+    tasks = [{"task_name": "ResumoGrupo_1", "python_script_path": crontab["script"], "schedule_type": "ONCE",
+              "date": "2025-03-09", "time": "08:05"}]
+
+    TaskScheduled.create_tasks(tasks)
+
+    lines = crontab["content"].splitlines()
+    assert sum("TASK_ID:ResumoGrupo_1" in line for line in lines) == 2  # ResumoGrupo_1 and ResumoGrupo_12
+    assert any(line.startswith("05 08 09 03 * ") and line.endswith("# TASK_ID:ResumoGrupo_1") for line in lines)
+    assert any(line.endswith("# TASK_ID:ResumoGrupo_12") for line in lines)
+
+
+def test_create_tasks_treats_missing_crontab_as_empty(crontab, monkeypatch):
+    def fake_run(command, input=None, **kwargs):
+        crontab["calls"].append(command)
+        if command == ["crontab", "-l"]:
+            return subprocess.CompletedProcess(command, 1, stdout="", stderr="no crontab for app\n")
+        crontab["content"] = input
+        return subprocess.CompletedProcess(command, 0)
+
+    monkeypatch.setattr(task_scheduler.subprocess, "run", fake_run)
+    TaskScheduled.create_tasks([{"task_name": "ResumoTodosGrupos", "python_script_path": crontab["script"], "time": "21:30"}])
+
+    assert crontab["content"].splitlines()[0].endswith("# TASK_ID:ResumoTodosGrupos")
+
+
+def test_create_tasks_aborts_when_crontab_cannot_be_read(crontab, monkeypatch):
+    def fake_run(command, input=None, **kwargs):
+        crontab["calls"].append(command)
+        if command == ["crontab", "-l"]:
+            return subprocess.CompletedProcess(command, 1, stdout="", stderr="crontab: permission denied\n")
+        raise AssertionError("crontab must not be rewritten")
+
+    monkeypatch.setattr(task_scheduler.subprocess, "run", fake_run)
+    with pytest.raises(subprocess.CalledProcessError):
+        TaskScheduled.create_tasks([{"task_name": "ResumoTodosGrupos", "python_script_path": crontab["script"], "time": "21:30"}])
+
+    assert crontab["calls"] == [["crontab", "-l"]]
+    assert "other job" in crontab["content"]
+
+
+def test_once_cron_line_reads_iso_dates():
+    line = TaskScheduled._cron_line("/usr/bin/python3", "ResumoGrupo_1", "summary.py", "ONCE", "2025-03-09", "08:05")
+
+    assert line.startswith("05 08 09 03 * ")
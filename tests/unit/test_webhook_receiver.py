@@ -0,0 +1,141 @@
+"""
+Unit tests for the Evolution webhook receiver.
+"""
+
+import asyncio
+import json
+import time
+
+import pytest
+
+from whatsapp_manager.infrastructure.persistence.message_store import MessageStore
+from whatsapp_manager.infrastructure.webhook.receiver import WebhookReceiver
+
+# Mensagens recentes: a retenção do armazenamento remove as antigas / Recent messages: store retention prunes old ones
+NOW = int(time.time())
+
+
+def _event(msg_id, ts, event="messages.upsert"):
+    return {
+        "event": event,
+        "instance": "TestInstance",
+        "date_time": "2025-01-10T12:00:00.000Z",
+        "apikey": "secret",
+        "data": {
+            "key": {"remoteJid": "123@g.us", "id": msg_id, "fromMe": False, "participant": "5511@s.whatsapp.net"},
+            "pushName": "Tester",
+            "messageType": "conversation",
+            "messageTimestamp": ts,
+            "message": {"conversation": f"text {msg_id}"},
+        },
+    }
+
+
+def test_replay_writes_messages_and_marks_coverage(tmp_path):
+    store = MessageStore(str(tmp_path / "messages.db"))
+    receiver = WebhookReceiver(store, batch_size=2)
+    now = int(time.time())
+    payloads = [_event(f"m{i}", now + i) for i in range(5)] + [_event("x", now, event="connection.update")]
+
+    stats = asyncio.run(receiver.replay(payloads))
+
+    assert stats["written"] == 5
+    assert stats["ignored"] == 1
+    stored = store.get_messages("123@g.us", now, now + 10)
+    assert [m.message_id for m in stored] == ["m4", "m3", "m2", "m1", "m0"]
+    assert stored[0].get_text() == "text m4"
+    coverage = store.get_coverage("123@g.us")
+    assert coverage[0] == receiver.started_at
+
+
+def test_http_endpoint_accepts_events_and_checks_api_key(tmp_path):
+    store = MessageStore(str(tmp_path / "messages.db"))
+    receiver = WebhookReceiver(store, host="127.0.0.1", port=0, api_key="secret", flush_interval=0.05)
+
+    async def post(payload):
+        reader, writer = await asyncio.open_connection("127.0.0.1", receiver.port)
+        body = json.dumps(payload).encode()
+        writer.write(
+            b"POST /webhook/messages-upsert HTTP/1.1\r\nHost: x\r\nConnection: close\r\n"
+            + f"Content-Length: {len(body)}\r\n\r\n".encode() + body
+        )
+        await writer.drain()
+        status = (await reader.readline()).split()[1]
+        writer.close()
+        return int(status)
+
+    async def scenario():
+        await receiver.start()
+        try:
+            ok = await post(_event("m1", NOW))
+            bad = dict(_event("m2", NOW + 1), apikey="wrong")
+            denied = await post(bad)
+        finally:
+            await receiver.stop()
+        return ok, denied
+
+    ok, denied = asyncio.run(scenario())
+
+    assert (ok, denied) == (200, 401)
+    assert [m.message_id for m in store.get_messages("123@g.us", 0, 2_000_000_000)] == ["m1"]
+
+
+def test_invalid_content_length_gets_400(tmp_path):
+    receiver = WebhookReceiver(MessageStore(str(tmp_path / "messages.db")), host="127.0.0.1", port=0, api_key="secret")
+
+    async def post(length):
+        reader, writer = await asyncio.open_connection("127.0.0.1", receiver.port)
+        writer.write(f"POST /webhook HTTP/1.1\r\nHost: x\r\nContent-Length: {length}\r\n\r\n".encode())
+        await writer.drain()
+        status = (await reader.readline()).split()[1]
+        writer.close()
+        return int(status)
+
+    async def scenario():
+        await receiver.start()
+        try:
+            return [await post("abc"), await post("-5")]
+        finally:
+            await receiver.stop()
+
+    assert asyncio.run(scenario()) == [400, 400]
+    assert receiver.stats["rejected"] == 2
+
+
+def test_start_refuses_without_api_key(tmp_path):
+    receiver = WebhookReceiver(MessageStore(str(tmp_path / "messages.db")), port=0)
+
+    with pytest.raises(ValueError):
+        asyncio.run(receiver.start())
+    assert not receiver._authorized({"apikey": ""}, {})
+
+
+def test_failed_write_keeps_batch_pending(tmp_path):
+    store = MessageStore(str(tmp_path / "messages.db"))
+    receiver = WebhookReceiver(store, batch_size=10)
+    add_messages = store.add_messages
+    calls = []
+
+    def flaky_add(messages):
+        calls.append(len(messages))
+        if len(calls) == 1:
+            raise RuntimeError("database is locked")
+        return add_messages(messages)
+
+    store.add_messages = flaky_add
+
+    async def scenario():
+        await receiver.ingest(_event("m1", NOW))
+        try:
+            await receiver.flush()
+        except RuntimeError:
+            pass
+        assert len(receiver._buffer) == 1
+        assert store.get_coverage("123@g.us") is None
+        await receiver.flush()
+
+    asyncio.run(scenario())
+
+    assert calls == [1, 1]
+    assert receiver._buffer == []
+    assert [m.message_id for m in store.get_messages("123@g.us", 0, 2_000_000_000)] == ["m1"]
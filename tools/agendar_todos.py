@@ -1,5 +1,4 @@
 import argparse
-import csv
 import os
 import sys
 
@@ -18,50 +17,44 @@ args = parser.parse_args()
 
 # Corrected paths relative to PROJECT_ROOT
 summary_script_path = os.path.join(PROJECT_ROOT, "src", "whatsapp_manager", "core", "summary.py")
-group_info_csv_path = os.path.join(PROJECT_ROOT, "data", "group_summary.csv")
-
-# Try data directory first, then root
-group_info_csv_path = os.path.join(PROJECT_ROOT, "data", "group_summary.csv")
-if not os.path.exists(group_info_csv_path):
-    group_info_csv_path = os.path.join(PROJECT_ROOT, "group_summary.csv")
-
-if not os.path.exists(group_info_csv_path):
-    print(f"Erro: Arquivo group_info.csv não encontrado em {group_info_csv_path}")
-    sys.exit(1)
 
 if not os.path.exists(summary_script_path):
     print(f"Erro: Script summary.py não encontrado em {summary_script_path}")
     sys.exit(1)
 
 try:
-    with open(group_info_csv_path, mode='r', encoding='utf-8') as f: # Added mode and encoding
-        reader = csv.DictReader(f)
-        control = GroupController() # Assumes .env is loaded correctly by GroupController from PROJECT_ROOT
-        for row in reader:
-            group_id = row.get('group_id')
-            if not group_id:
-                print(f"Aviso: Linha ignorada em group_info.csv por falta de group_id: {row}")
-                continue
-
-            print(f"Agendando para o grupo: {group_id} às {args.time}")
-            control.update_summary(
-                group_id=group_id,
-                horario=args.time,
-                enabled=True,
-                is_links=True,
-                is_names=True,
-                script=summary_script_path,
-                send_to_group=False,
-                send_to_personal=True
-            )
-            TaskScheduled.create_task(
-                task_name=f'ResumoGrupo_{group_id}', # Consistent with Portuguese version of UI
-                python_script_path=summary_script_path,
-                schedule_type='DAILY',
-                time=args.time,
-            )
+    # Grupos lidos do armazenamento de configurações (o mesmo usado pela interface)
+    control = GroupController() # Assumes .env is loaded correctly by GroupController from PROJECT_ROOT
+    configs = []
+    tasks = []
+    for row in control.load_summary_info().to_dict('records'):
+        group_id = row.get('group_id')
+        if not group_id:
+            print(f"Aviso: Configuração ignorada por falta de group_id: {row}")
+            continue
+
+        print(f"Agendando para o grupo: {group_id} às {args.time}")
+        configs.append({
+            "group_id": group_id,
+            "horario": args.time,
+            "enabled": True,
+            "is_links": True,
+            "is_names": True,
+            "script": summary_script_path,
+            "send_to_group": False,
+            "send_to_personal": True,
+        })
+        tasks.append({
+            "task_name": f'ResumoGrupo_{group_id}', # Consistent with Portuguese version of UI
+            "python_script_path": summary_script_path,
+            "schedule_type": 'DAILY',
+            "time": args.time,
+        })
+
+    # Todas as configurações e todos os agendamentos em uma única gravação cada;
+    # a entrada em lote instalada por versões anteriores é removida junto
+    control.update_summaries(configs)
+    TaskScheduled.create_tasks(tasks, delete_names=['ResumoTodosGrupos'])
     print(f'Agendamento diário para todos os grupos realizado! (envio para seu número pessoal, horário: {args.time})')
-except FileNotFoundError:
-    print(f"Erro: O arquivo {group_info_csv_path} não foi encontrado.")
 except Exception as e:
     print(f"Ocorreu um erro durante o processamento: {e}")
@@ -0,0 +1,85 @@
+"""
+Compara os backends JSON no cache de grupos (1k, 10k e 50k grupos).
+Benchmarks the JSON backends on the groups cache (1k, 10k and 50k groups).
+
+Uso / Usage:
+    python tools/benchmark_json.py
+    python tools/benchmark_json.py --sizes 1000 10000 50000 --repeat 5
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+
+# Determine project root relative to this script file
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+SRC_DIR = os.path.join(PROJECT_ROOT, 'src')
+if SRC_DIR not in sys.path:
+    sys.path.insert(0, SRC_DIR)
+
+from whatsapp_manager.utils import fast_json
+
+
+def build_cache(size):
+    """Gera um cache sintético no formato de fetch_all_groups."""
+    groups = []
+    for i in range(size):
+        groups.append({
+            "id": f"1203630{i:011d}@g.us",
+            "subject": f"Grupo de teste número {i} 🚀",
+            "subjectOwner": f"55119{i:08d}@s.whatsapp.net",
+            "subjectTime": 1700000000 + i,
+            "pictureUrl": f"https://pps.whatsapp.net/v/t61.24694-24/{i}_n.jpg?ccb=11-4&oh=01_Q5AaI&oe=67A1",
+            "size": i % 1024,
+            "creation": 1600000000 + i,
+            "owner": f"55119{i:08d}@s.whatsapp.net",
+            "desc": "Descrição do grupo com acentuação e quebras\nde linha." * 3,
+            "descId": f"DESC{i:016X}",
+            "restrict": bool(i % 2),
+            "announce": bool(i % 3),
+            "isCommunity": False,
+            "isCommunityAnnounce": False,
+        })
+    return {"timestamp": time.time(), "groups": groups}
+
+
+def best_of(repeat, func):
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def available_backends():
+    backends = {"json": (json.loads, lambda obj: json.dumps(obj).encode("utf-8"))}
+    for name in ("orjson", "msgspec"):
+        backend, loads, dumps = fast_json._select_backend(name)
+        if backend == name:
+            backends[name] = (loads, dumps)
+    return backends
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark dos backends JSON / JSON backends benchmark")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000, 50000])
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    backends = available_backends()
+    print(f"Backend ativo / Active backend: {fast_json.BACKEND}")
+    print(f"{'groups':>8} {'backend':>8} {'size MiB':>9} {'dump ms':>9} {'load ms':>9}")
+    for size in args.sizes:
+        cache = build_cache(size)
+        for name, (loads, dumps) in backends.items():
+            data = dumps(cache)
+            dump_time = best_of(args.repeat, lambda: dumps(cache))
+            load_time = best_of(args.repeat, lambda: loads(data))
+            print(f"{size:>8} {name:>8} {len(data) / 1048576:>9.2f} {dump_time * 1000:>9.1f} {load_time * 1000:>9.1f}")
+
+
+if __name__ == "__main__":
+    main()
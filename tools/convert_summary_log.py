@@ -0,0 +1,124 @@
+"""
+Converte o log antigo de resumos (data/log_summary.txt) em eventos JSON lines.
+Converts the legacy summary log (data/log_summary.txt) into JSON lines events.
+
+Executar uma vez após a atualização para manter o histórico no dashboard.
+Eventos já presentes no destino (mesmo group_id e finished_at) são ignorados,
+então repetir a conversão não duplica o histórico.
+Run once after upgrading to keep the history in the dashboard.
+Events already in the target (same group_id and finished_at) are skipped,
+so running the conversion again does not duplicate the history.
+
+Uso / Usage:
+    python tools/convert_summary_log.py
+    python tools/convert_summary_log.py data/log_summary.txt data/summary_events.jsonl
+"""
+
+import argparse
+import os
+import re
+import sys
+from datetime import datetime
+
+from dotenv import load_dotenv
+
+# Determine project root relative to this script file
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+SRC_DIR = os.path.join(PROJECT_ROOT, 'src')
+if SRC_DIR not in sys.path:
+    sys.path.insert(0, SRC_DIR)
+
+from whatsapp_manager.infrastructure.persistence.summary_events import (
+    DESTINATION_GROUP,
+    DESTINATION_PERSONAL,
+    SummaryEventLog,
+)
+from whatsapp_manager.utils import fast_json
+
+LEGACY_LOG_PATH = os.path.join(PROJECT_ROOT, "data", "log_summary.txt")
+
+ENTRY_PATTERN = re.compile(
+    r"\[(\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}(?:\.\d+)?)\] \[(.*?)\] \[GRUPO: (.*?)\] "
+    r"\[GROUP_ID: (.*?)\] - Mensagem: (.*?)(?=\[\d{4}-\d{2}-\d{2} |$)"
+)
+
+
+def legacy_events(content):
+    """
+    PT-BR:
+    Extrai os eventos das entradas do log antigo.
+
+    EN:
+    Extracts events from the legacy log entries.
+    """
+    for line in content.splitlines():
+        if line.startswith('//'):
+            continue
+        for timestamp, _level, name, group_id, message in ENTRY_PATTERN.findall(line):
+            destinations = []
+            if "grupo" in message:
+                destinations.append(DESTINATION_GROUP)
+            if "número pessoal" in message:
+                destinations.append(DESTINATION_PERSONAL)
+            yield {
+                "event": "summary_run",
+                "status": "success" if "sucesso" in message else "error",
+                "group_id": group_id.strip(),
+                "name": name.strip(),
+                "finished_at": datetime.fromisoformat(timestamp).isoformat(),
+                "window_end": datetime.fromisoformat(timestamp).isoformat(),
+                "destinations": destinations,
+                "reason": message.strip(),
+            }
+
+
+def existing_keys(event_log):
+    """
+    PT-BR:
+    Chaves (group_id, finished_at) dos eventos já gravados no destino.
+
+    EN:
+    (group_id, finished_at) keys of the events already in the target.
+    """
+    # Linha a linha, sem inferência de tipos do leitor colunar / Line by line, without the columnar reader's type inference
+    keys = set()
+    try:
+        with open(event_log.path, "rb") as f:
+            for line in f:
+                try:
+                    event = fast_json.loads(line)
+                except ValueError:
+                    continue
+                keys.add((event.get("group_id"), event.get("finished_at")))
+    except FileNotFoundError:
+        pass
+    return keys
+
+
+def main():
+    load_dotenv(os.path.join(PROJECT_ROOT, '.env'), override=True)
+    parser = argparse.ArgumentParser(description="Converte log_summary.txt em JSON lines / Convert log_summary.txt to JSON lines")
+    parser.add_argument("source", nargs="?", default=LEGACY_LOG_PATH)
+    parser.add_argument("target", nargs="?", default=os.getenv(
+        "SUMMARY_EVENTS_PATH", os.path.join(PROJECT_ROOT, "data", "summary_events.jsonl")))
+    args = parser.parse_args()
+
+    with open(args.source, 'r', encoding='utf-8') as f:
+        content = f.read()
+    event_log = SummaryEventLog(args.target)
+    seen = existing_keys(event_log)
+    count = skipped = 0
+    for event in legacy_events(content):
+        key = (event["group_id"], event["finished_at"])
+        if key in seen:
+            skipped += 1
+            continue
+        seen.add(key)
+        event_log.append(event)
+        count += 1
+    print(f"{count} eventos gravados em {args.target}, {skipped} já existentes / "
+          f"{count} events written to {args.target}, {skipped} already present")
+
+
+if __name__ == "__main__":
+    main()
@@ -13,9 +13,6 @@ Allows viewing and managing groups through a command-line interface.
 import os
 import sys
 
-# Third-party library imports
-import pandas as pd
-
 # Determine project root relative to this script file
 PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
 SRC_DIR = os.path.join(PROJECT_ROOT, 'src')
@@ -23,13 +20,11 @@ if SRC_DIR not in sys.path:
     sys.path.insert(0, SRC_DIR)
 
 from whatsapp_manager.core.group_controller import GroupController
+from whatsapp_manager.infrastructure.persistence.settings_store import get_settings_store
 from whatsapp_manager.utils.task_scheduler import TaskScheduled
 
-# Define path for group_summary.csv
-# Try data directory first, then root
+# Define path for group_summary.csv (importado pelo armazenamento de configurações / imported by the settings store)
 GROUP_SUMMARY_CSV_PATH = os.path.join(PROJECT_ROOT, "data", "group_summary.csv")
-if not os.path.exists(GROUP_SUMMARY_CSV_PATH):
-    GROUP_SUMMARY_CSV_PATH = os.path.join(PROJECT_ROOT, "group_summary.csv")
 
 
 def list_groups():
@@ -38,19 +33,15 @@ def list_groups():
     Lista todos os grupos agendados no sistema com suas respectivas informações.
     
     Retorna:
-        DataFrame: Contém as informações dos grupos agendados do arquivo CSV.
+        DataFrame: Contém as informações dos grupos agendados.
     
     EN:
     Lists all scheduled groups in the system with their respective information.
     
     Returns:
-        DataFrame: Contains scheduled groups information from the CSV file.
+        DataFrame: Contains scheduled groups information.
     """
-    try:
-        df = pd.read_csv(GROUP_SUMMARY_CSV_PATH)
-    except FileNotFoundError:
-        print(f"Arquivo {GROUP_SUMMARY_CSV_PATH} não encontrado.")
-        return pd.DataFrame() # Return empty DataFrame if file not found
+    df = get_settings_store(GROUP_SUMMARY_CSV_PATH).load()
 
     control = GroupController()
     groups = control.fetch_groups()
@@ -86,13 +77,8 @@ def delete_scheduled_group(group_id):
         bool: True if removal was successful, False otherwise
     """
     try:
-        try:
-            df = pd.read_csv(GROUP_SUMMARY_CSV_PATH)
-        except FileNotFoundError:
-            print(f"Arquivo {GROUP_SUMMARY_CSV_PATH} não encontrado.")
-            return False
-
-        if group_id not in df['group_id'].values:
+        store = get_settings_store(GROUP_SUMMARY_CSV_PATH)
+        if store.get(group_id) is None:
             print(f"Grupo não encontrado / Group not found: ID {group_id}")
             return False
         
@@ -103,8 +89,7 @@ def delete_scheduled_group(group_id):
         except Exception as e:
             print(f"Aviso / Warning: Não foi possível remover a tarefa / Could not remove task: {e}")
         
-        df = df[df['group_id'] != group_id]
-        df.to_csv(GROUP_SUMMARY_CSV_PATH, index=False)
+        store.delete(group_id)
         print("Grupo removido do arquivo de configuração / Group removed from configuration file")
         
         return True
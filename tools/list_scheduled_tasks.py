@@ -1,9 +1,6 @@
 import os
 import sys
 
-# Third-party library imports
-import pandas as pd
-
 # Determine project root relative to this script file
 PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
 SRC_DIR = os.path.join(PROJECT_ROOT, 'src')
@@ -11,6 +8,7 @@ if SRC_DIR not in sys.path:
     sys.path.insert(0, SRC_DIR)
 
 from whatsapp_manager.core.group_controller import GroupController
+from whatsapp_manager.infrastructure.persistence.settings_store import get_settings_store
 from whatsapp_manager.utils.task_scheduler import TaskScheduled
 
 # Define path for group_summary.csv
@@ -27,11 +25,9 @@ def list_scheduled_groups():
     Displays detailed information about each group, including name, ID and settings.
     """
     try:
-        try:
-            df = pd.read_csv(GROUP_SUMMARY_CSV_PATH)
-        except FileNotFoundError:
-            print(f"Arquivo {GROUP_SUMMARY_CSV_PATH} não encontrado.")
-            return # Exit if file not found
+        # Mesmo armazenamento de configurações usado pela interface e pelo worker
+        # Same settings store used by the UI and the worker
+        df = get_settings_store(GROUP_SUMMARY_CSV_PATH).load()
 
         enabled_groups = df[df['enabled'] == True]
 
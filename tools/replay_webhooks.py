@@ -0,0 +1,100 @@
+"""
+Reproduz eventos de webhook gravados para medir a vazão da ingestão.
+Replays recorded webhook events to benchmark ingestion throughput.
+
+Uso / Usage:
+    python tools/replay_webhooks.py eventos.jsonl
+    python tools/replay_webhooks.py eventos.json --repeat 20 --db /tmp/bench.db
+    python tools/replay_webhooks.py eventos.jsonl --url http://localhost:8090/webhook
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import sys
+import tempfile
+import time
+import urllib.request
+
+# Determine project root relative to this script file
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+SRC_DIR = os.path.join(PROJECT_ROOT, 'src')
+if SRC_DIR not in sys.path:
+    sys.path.insert(0, SRC_DIR)
+
+from whatsapp_manager.infrastructure.persistence.message_store import MessageStore
+from whatsapp_manager.infrastructure.webhook.receiver import WebhookReceiver
+
+
+def load_payloads(path):
+    """Lê eventos de um arquivo JSON (lista) ou JSON-lines."""
+    with open(path, 'r', encoding='utf-8') as f:
+        content = f.read().strip()
+    if content.startswith('['):
+        return json.loads(content)
+    return [json.loads(line) for line in content.splitlines() if line.strip()]
+
+
+def replay_in_process(payloads, db_path, batch_size):
+    store = MessageStore(db_path)
+    receiver = WebhookReceiver(store, batch_size=batch_size)
+    return asyncio.run(receiver.replay(payloads))
+
+
+def replay_over_http(payloads, url):
+    started = time.perf_counter()
+    for payload in payloads:
+        request = urllib.request.Request(
+            url,
+            data=json.dumps(payload).encode('utf-8'),
+            headers={'Content-Type': 'application/json'},
+            method='POST'
+        )
+        with urllib.request.urlopen(request) as response:
+            response.read()
+    elapsed = time.perf_counter() - started
+    return {
+        'events': len(payloads),
+        'seconds': round(elapsed, 4),
+        'events_per_second': round(len(payloads) / elapsed, 1) if elapsed > 0 else None,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Reproduz eventos de webhook gravados / Replays recorded webhook events")
+    parser.add_argument('file', help='Arquivo JSON ou JSON-lines com eventos messages.upsert')
+    parser.add_argument('--repeat', type=int, default=1, help='Repete os eventos N vezes (IDs recebem sufixo)')
+    parser.add_argument('--batch-size', type=int, default=200, help='Mensagens por gravação (modo local)')
+    parser.add_argument('--db', default=None, help='Banco SQLite de destino (padrão: arquivo temporário)')
+    parser.add_argument('--url', default=None, help='Envia por HTTP para um receptor em execução em vez de processar localmente')
+    args = parser.parse_args()
+
+    payloads = load_payloads(args.file)
+    if args.repeat > 1:
+        # Gera IDs distintos para que cada repetição seja gravada
+        replayed = []
+        for i in range(args.repeat):
+            for payload in payloads:
+                copy = json.loads(json.dumps(payload))
+                data = copy.get('data')
+                for item in (data if isinstance(data, list) else [data]):
+                    if isinstance(item, dict) and isinstance(item.get('key'), dict):
+                        item['key']['id'] = f"{item['key'].get('id')}_{i}"
+                replayed.append(copy)
+        payloads = replayed
+
+    if args.url:
+        stats = replay_over_http(payloads, args.url)
+    elif args.db:
+        stats = replay_in_process(payloads, args.db, args.batch_size)
+    else:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            stats = replay_in_process(payloads, os.path.join(tmp_dir, 'messages.db'), args.batch_size)
+
+    for key, value in stats.items():
+        print(f"{key}: {value}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,48 @@
+"""
+Importa ou exporta as configurações de resumo (SQLite) em CSV.
+Imports or exports the summary settings (SQLite) as CSV.
+
+Uso / Usage:
+    python tools/settings_csv.py export                 # grava data/group_summary.csv
+    python tools/settings_csv.py export backup.csv
+    python tools/settings_csv.py import group_summary.csv
+"""
+
+import argparse
+import os
+import sys
+
+from dotenv import load_dotenv
+
+# Determine project root relative to this script file
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+SRC_DIR = os.path.join(PROJECT_ROOT, 'src')
+if SRC_DIR not in sys.path:
+    sys.path.insert(0, SRC_DIR)
+
+from whatsapp_manager.infrastructure.persistence.settings_store import get_settings_store
+
+GROUP_SUMMARY_CSV_PATH = os.path.join(PROJECT_ROOT, "data", "group_summary.csv")
+
+
+def main():
+    load_dotenv(os.path.join(PROJECT_ROOT, '.env'), override=True)
+    parser = argparse.ArgumentParser(description="Importa/exporta configurações de resumo / Import/export summary settings")
+    parser.add_argument("action", choices=["import", "export"])
+    parser.add_argument("path", nargs="?", default=GROUP_SUMMARY_CSV_PATH)
+    args = parser.parse_args()
+
+    store = get_settings_store(GROUP_SUMMARY_CSV_PATH)
+    if args.action == "export":
+        store.export_csv(args.path)
+        print(f"Configurações exportadas para {args.path} / Settings exported to {args.path}")
+    else:
+        if not hasattr(store, "import_csv"):
+            print("SETTINGS_BACKEND=csv: nada a importar / nothing to import")
+            return
+        rows = store.import_csv(args.path)
+        print(f"{rows} linhas importadas de {args.path} / {rows} rows imported from {args.path}")
+
+
+if __name__ == "__main__":
+    main()